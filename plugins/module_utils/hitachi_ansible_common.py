@@ -3,12 +3,40 @@
 
 import os
 from logging.handlers import RotatingFileHandler
+import asyncio
+import atexit
+import base64
+import codecs
+import concurrent.futures
+import contextlib
+import fcntl
+import hashlib
+import http.client
+import io
+import json
 import logging
+import random
+import re
+import select
+import socket
+import ssl
 import subprocess
 import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
 
 from ansible.module_utils.hitachi_ansible_common_constant import (
     LoggingConstants,
+    ConnectionConstants,
+    ConcurrencyConstants,
+    JobWaiterConstants,
+    JsonStreamConstants,
+    PaginationConstants,
+    SessionCacheConstants,
+    NameCacheConstants,
 )
 
 def get_log_file():
@@ -42,4 +70,862 @@ def initialize_filehandler_logger(logger):
     # command = f'export ANSIBLE_LOG_PATH={LoggingConstants.INTERNAL_LOG_FILE}'
     # subprocess.run(command, shell=True)
 
-    
\ No newline at end of file
+
+def get_logger():
+    '''Always returns the same logger instance for automation module'''
+    return logging.getLogger('AutomationModuleLogger')
+
+
+def basic_auth_header(user, password):
+    ''' Returns the value of a basic Authorization header '''
+    credentials = '{}:{}'.format(user, password).encode('utf-8')
+    return 'Basic ' + base64.b64encode(credentials).decode('ascii')
+
+
+class ConnectionPool(object):
+    ''' Per-process pool of keep-alive HTTPS connections.
+
+        Connections are keyed by (address, port, validate_certs), so a
+        connection is only reused for the same endpoint and certificate
+        policy. The pool counts how many connections were opened and how
+        many requests were sent over a reused connection.
+    '''
+
+    def __init__(self, max_idle_per_key=ConnectionConstants.MAX_IDLE_PER_KEY):
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._max_idle_per_key = max_idle_per_key
+        self.opened = 0
+        self.reused = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'opened': self.opened,
+                'reused': self.reused,
+            }
+
+    @staticmethod
+    def is_proxied(url):
+        ''' True if the environment routes `url` through a proxy.
+            Such requests are left to open_url, which handles proxies.
+        '''
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in urllib.request.getproxies():
+            return False
+        return not urllib.request.proxy_bypass(parsed.hostname)
+
+    @contextlib.contextmanager
+    def request(self, method, url, data=None, headers=None, validate_certs=True, timeout=None):
+        ''' Sends a request and yields the http.client response.
+
+            The connection goes back to the pool when the caller has read
+            the whole body, otherwise it is closed.
+        '''
+        parsed = urllib.parse.urlsplit(url)
+        key = (parsed.hostname, parsed.port or http.client.HTTPS_PORT, bool(validate_certs))
+        path = parsed.path
+        if parsed.query:
+            path = path + '?' + parsed.query
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        conn, response = self._send(key, method, path, data, headers or {}, timeout)
+        try:
+            yield response
+        finally:
+            if response.isclosed() and not response.will_close:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _send(self, key, method, path, data, headers, timeout):
+        conn, reused = self._checkout(key, timeout)
+        try:
+            try:
+                conn.request(method, path, body=data, headers=headers)
+            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped the idle keep-alive connection before the whole
+                # request reached it, so it cannot have acted on it. Retry once on a new one.
+                get_logger().debug('Keep-alive connection to %s:%s was closed by the server, reconnecting', key[0], key[1])
+                conn = self._connect(key, timeout)
+                conn.request(method, path, body=data, headers=headers)
+                return conn, conn.getresponse()
+            try:
+                return conn, conn.getresponse()
+            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                conn.close()
+                # The server may have acted on the request, only repeat it if that is harmless
+                if not reused or method not in ConnectionConstants.IDEMPOTENT_METHODS:
+                    raise
+                get_logger().debug('Keep-alive connection to %s:%s was closed by the server, reconnecting', key[0], key[1])
+                conn = self._connect(key, timeout)
+                conn.request(method, path, body=data, headers=headers)
+                return conn, conn.getresponse()
+        except socket.timeout:
+            conn.close()
+            raise
+        except OSError as err:
+            conn.close()
+            raise urllib.error.URLError(err)
+        except Exception:
+            conn.close()
+            raise
+
+    def _checkout(self, key, timeout):
+        with self._lock:
+            connections = self._idle.get(key)
+            while connections:
+                conn = connections.pop()
+                if self._is_dropped(conn):
+                    conn.close()
+                    continue
+                self.reused += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._connect(key, timeout), False
+
+    @staticmethod
+    def _is_dropped(conn):
+        ''' True if the server closed the idle connection, an idle keep-alive
+            connection has nothing to read until the next request is sent
+        '''
+        if conn.sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self._max_idle_per_key:
+                connections.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, key, timeout):
+        address, port, validate_certs = key
+        context = ssl.create_default_context()
+        if not validate_certs:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        with self._lock:
+            self.opened += 1
+        get_logger().debug('Opening connection to %s:%s', address, port)
+        return http.client.HTTPSConnection(address, port, timeout=timeout, context=context)
+
+
+CONNECTION_POOL = ConnectionPool()
+
+
+@atexit.register
+def _close_connection_pool():
+    stats = CONNECTION_POOL.stats()
+    if stats['opened'] > 0:
+        get_logger().info('Connection pool: %d connections opened, %d reused', stats['opened'], stats['reused'])
+    CONNECTION_POOL.close()
+
+
+class AsyncResponse(object):
+    ''' A response read completely by AsyncConnectionPool.
+
+        Offers the parts of http.client.HTTPResponse the clients use,
+        status, reason, msg and read(), so responses are decoded the same way.
+    '''
+
+    def __init__(self, status, reason, msg, body, will_close):
+        self.status = status
+        self.reason = reason
+        self.msg = msg
+        self.will_close = will_close
+        self._body = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self._body.read(amt)
+
+
+class AsyncConnectionPool(object):
+    ''' Per-process pool of keep-alive HTTPS connections for asyncio.
+
+        Speaks HTTP/1.1 over asyncio streams, so hundreds of requests can be in
+        flight on one event loop with nothing but the standard library.
+        Connections are keyed like ConnectionPool and only reused on the event
+        loop that opened them. Proxies are not supported, callers check
+        ConnectionPool.is_proxied and use the blocking client for those.
+    '''
+
+    def __init__(self, max_idle_per_key=ConnectionConstants.MAX_IDLE_PER_KEY):
+        self._idle = {}
+        self._max_idle_per_key = max_idle_per_key
+        self.opened = 0
+        self.reused = 0
+
+    def stats(self):
+        return {
+            'opened': self.opened,
+            'reused': self.reused,
+        }
+
+    async def request(self, method, url, data=None, headers=None, validate_certs=True, timeout=None):
+        ''' Sends a request and returns the AsyncResponse with its whole body.
+            Raises socket.timeout after `timeout` seconds and urllib.error.URLError
+            if the connection fails, like ConnectionPool.
+        '''
+        parsed = urllib.parse.urlsplit(url)
+        key = (parsed.hostname, parsed.port or http.client.HTTPS_PORT, bool(validate_certs))
+        path = parsed.path
+        if parsed.query:
+            path = path + '?' + parsed.query
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        request = self._format_request(method, path, parsed.netloc, data, headers or {})
+
+        try:
+            return await asyncio.wait_for(self._send(key, method, request), timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout('timed out')
+        except (OSError, asyncio.IncompleteReadError, http.client.HTTPException) as err:
+            raise urllib.error.URLError(err)
+
+    def close(self):
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for reader, writer in connections:
+                writer.close()
+
+    async def _send(self, key, method, request):
+        (reader, writer), reused = await self._checkout(key)
+        try:
+            try:
+                writer.write(request)
+                await writer.drain()
+            except ConnectionError:
+                writer.close()
+                if not reused:
+                    raise
+                # The server dropped the idle keep-alive connection before the whole
+                # request reached it, so it cannot have acted on it. Retry once on a new one.
+                get_logger().debug('Keep-alive connection to %s:%s was closed by the server, reconnecting', key[0], key[1])
+                reader, writer = await self._connect(key)
+                writer.write(request)
+                await writer.drain()
+            try:
+                response = await self._read_response(reader, method)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                # The server may have acted on the request, only repeat it if that is harmless
+                if not reused or method not in ConnectionConstants.IDEMPOTENT_METHODS:
+                    raise
+                get_logger().debug('Keep-alive connection to %s:%s was closed by the server, reconnecting', key[0], key[1])
+                reader, writer = await self._connect(key)
+                writer.write(request)
+                response = await self._read_response(reader, method)
+        except BaseException:
+            # Also on cancellation, a connection with a request half done is not reusable
+            writer.close()
+            raise
+        if response.will_close:
+            writer.close()
+        else:
+            self._checkin(key, (reader, writer))
+        return response
+
+    @staticmethod
+    def _format_request(method, path, host, data, headers):
+        lines = ['{} {} HTTP/1.1'.format(method, path), 'Host: {}'.format(host)]
+        lines.extend('{}: {}'.format(name, value) for name, value in headers.items())
+        if data is not None:
+            lines.append('Content-Length: {}'.format(len(data)))
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        return head if data is None else head + data
+
+    @staticmethod
+    async def _read_response(reader, method):
+        status_line = (await reader.readline()).decode('latin-1').rstrip('\r\n')
+        if not status_line:
+            raise ConnectionResetError('The server closed the connection without a response')
+        parts = status_line.split(' ', 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+            raise http.client.BadStatusLine(status_line)
+        version, status = parts[0], int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ''
+
+        head = b''
+        while True:
+            line = await reader.readline()
+            head += line
+            if line in (b'\r\n', b'\n', b''):
+                break
+        msg = http.client.parse_headers(io.BytesIO(head))
+
+        connection = (msg.get('Connection') or '').lower()
+        will_close = connection == 'close' or (version == 'HTTP/1.0' and connection != 'keep-alive')
+        if method == 'HEAD' or status < 200 or status in (http.HTTPStatus.NO_CONTENT, http.HTTPStatus.NOT_MODIFIED):
+            body = b''
+        elif (msg.get('Transfer-Encoding') or '').lower() == 'chunked':
+            body = b''
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0].strip(), 16)
+                if size == 0:
+                    # Skip the trailer up to the blank line
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                body += await reader.readexactly(size)
+                await reader.readexactly(2)
+        elif msg.get('Content-Length') is not None:
+            body = await reader.readexactly(int(msg.get('Content-Length')))
+        else:
+            body = await reader.read()
+            will_close = True
+        return AsyncResponse(status, reason, msg, body, will_close)
+
+    async def _checkout(self, key):
+        loop = asyncio.get_running_loop()
+        connections = self._idle.get(key, [])
+        while connections:
+            connection_loop, connection = connections.pop()
+            # Streams are bound to the loop that opened them, and a stream the
+            # server closed while idle has reached its end
+            if connection_loop is loop and not connection[1].is_closing() and not connection[0].at_eof():
+                self.reused += 1
+                return connection, True
+        return await self._connect(key), False
+
+    def _checkin(self, key, connection):
+        connections = self._idle.setdefault(key, [])
+        if len(connections) < self._max_idle_per_key:
+            connections.append((asyncio.get_running_loop(), connection))
+            return
+        connection[1].close()
+
+    async def _connect(self, key):
+        address, port, validate_certs = key
+        context = ssl.create_default_context()
+        if not validate_certs:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        self.opened += 1
+        get_logger().debug('Opening connection to %s:%s', address, port)
+        return await asyncio.open_connection(address, port, ssl=context)
+
+
+ASYNC_CONNECTION_POOL = AsyncConnectionPool()
+
+
+class LockedFileCache(object):
+    ''' Base of the on-disk caches, one JSON file per key in `directory`.
+        A file is only read or written while its lock file is held with flock,
+        so module processes running in parallel see each other's updates.
+    '''
+    # Named in the warning logged when the cache directory is not usable
+    description = 'cache'
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _write(self, path, entry):
+        temp_path = path + '.tmp'
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(temp_path, path)
+
+    def _path(self, key):
+        digest = hashlib.sha256('\0'.join(str(part) for part in key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + '.json')
+
+    @contextlib.contextmanager
+    def _locked(self, key):
+        ''' Holds the lock file of `key`, yields None if the cache directory is not usable '''
+        path = self._path(key)
+        try:
+            if not os.path.exists(self.directory):
+                os.makedirs(self.directory, mode=0o700)
+            fd = os.open(path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        except (IOError, OSError) as err:
+            get_logger().warning('The %s is not available: %s', self.description, err)
+            yield None
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield path
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+class SessionTokenCache(LockedFileCache):
+    ''' On-disk cache of REST API session tokens shared by module processes.
+
+        Each (management_address, port, user) gets one JSON file, named by a
+        digest that also covers the password so a token is never handed to a
+        caller that could not have logged in itself. Files are locked with
+        flock while they are read or written, and an entry expires TTL
+        seconds after it was last used.
+    '''
+    description = 'session token cache'
+
+    def __init__(self, directory=SessionCacheConstants.CACHE_DIR, ttl=None):
+        super(SessionTokenCache, self).__init__(directory)
+        self.ttl = SessionCacheConstants.get_ttl() if ttl is None else ttl
+
+    @staticmethod
+    def is_enabled():
+        return SessionCacheConstants.is_enabled()
+
+    def get_or_create(self, key, create):
+        ''' Returns the cached (token, session_id) for `key`.
+            On a miss or an expired entry, calls `create()` for a new pair and
+            stores it. The file lock is held meanwhile, so concurrent module
+            processes log in only once.
+        '''
+        with self._locked(key) as path:
+            if path is None:
+                return create()
+            entry = self._read(path)
+            if entry is not None:
+                get_logger().debug('Using the cached session %s', entry['session_id'])
+            else:
+                token, session_id = create()
+                entry = {
+                    'token': token,
+                    'session_id': session_id,
+                }
+            entry['expires'] = time.time() + self.ttl
+            try:
+                self._write(path, entry)
+            except (IOError, OSError) as err:
+                get_logger().warning('Failed to save the session token: %s', err)
+            return entry['token'], entry['session_id']
+
+    def invalidate(self, key):
+        with self._locked(key) as path:
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    def _read(self, path):
+        try:
+            with open(path) as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('expires', 0) <= time.time():
+            return None
+        if entry.get('token') is None:
+            return None
+        return entry
+
+
+SESSION_TOKEN_CACHE = SessionTokenCache()
+
+
+class NameIdCache(LockedFileCache):
+    ''' On-disk cache of the IDs of named resources shared by module processes.
+
+        Each storage system, as (client, management_address, port, user), gets
+        one JSON file mapping kind -> name -> [ID, expiry time]. An entry
+        expires after the TTL of its kind, and the operations that create or
+        delete a resource drop the entries of its kind or name. A cached ID
+        the storage system no longer knows must be dropped by the caller.
+    '''
+    description = 'name cache'
+
+    def __init__(self, directory=NameCacheConstants.CACHE_DIR):
+        super(NameIdCache, self).__init__(directory)
+
+    @staticmethod
+    def is_enabled():
+        return NameCacheConstants.is_enabled()
+
+    def get(self, scope, kind, name):
+        ''' Returns the cached ID of the `kind` resource `name`, None on a miss '''
+        if name is None or not self.is_enabled():
+            return None
+        with self._locked(scope) as path:
+            if path is None:
+                return None
+            entry = self._read(path).get(kind, {}).get(name)
+        if entry is None or entry[1] <= time.time():
+            return None
+        get_logger().debug('Using the cached ID %s of %s %s', entry[0], kind, name)
+        return entry[0]
+
+    def put(self, scope, kind, ids):
+        ''' Saves the {name: ID} of `kind` resources '''
+        ids = dict((name, resource_id) for name, resource_id in ids.items()
+                   if name is not None and resource_id is not None)
+        if not ids:
+            return
+        expires = time.time() + NameCacheConstants.get_ttl(kind)
+        with self._updating(scope) as entries:
+            if entries is not None:
+                names = entries.setdefault(kind, {})
+                for name, resource_id in ids.items():
+                    names[name] = [resource_id, expires]
+
+    def invalidate(self, scope, kind, name=None):
+        ''' Drops the cached ID of `name`, or of every name of `kind` '''
+        with self._updating(scope) as entries:
+            if entries is not None and kind in entries:
+                if name is None:
+                    del entries[kind]
+                else:
+                    entries[kind].pop(name, None)
+
+    @contextlib.contextmanager
+    def _updating(self, scope):
+        ''' Yields the entries of `scope` to change and saves them, yields None if the cache is off '''
+        if not self.is_enabled():
+            yield None
+            return
+        with self._locked(scope) as path:
+            if path is None:
+                yield None
+                return
+            entries = self._read(path)
+            yield entries
+            # Expired entries are dropped whenever the file is rewritten
+            now = time.time()
+            for kind in list(entries):
+                entries[kind] = dict((name, entry) for name, entry in entries[kind].items() if entry[1] > now)
+                if not entries[kind]:
+                    del entries[kind]
+            try:
+                self._write(path, entries)
+            except (IOError, OSError) as err:
+                get_logger().warning('Failed to save the name cache: %s', err)
+
+    def _read(self, path):
+        try:
+            with open(path) as cache_file:
+                entries = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+
+NAME_ID_CACHE = NameIdCache()
+
+
+class JobWaiter(object):
+    ''' Polls an asynchronous REST API job until it is done.
+
+        The first poll is immediate, then the interval grows exponentially
+        with random jitter up to `max_interval`, so a job that finishes in a
+        few hundred milliseconds returns without waiting for a fixed sleep.
+        Waiting stops after `timeout` seconds, or never if it is None.
+    '''
+
+    def __init__(self, timeout=JobWaiterConstants.TIMEOUT,
+                 initial_interval=JobWaiterConstants.INITIAL_INTERVAL,
+                 max_interval=JobWaiterConstants.MAX_INTERVAL,
+                 multiplier=JobWaiterConstants.MULTIPLIER,
+                 jitter=JobWaiterConstants.JITTER):
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def wait(self, poll, is_done):
+        ''' Calls `poll()` until `is_done(result)` is true and returns that result.
+            Returns None if the deadline passes first.
+        '''
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        interval = self.initial_interval
+        polls = 0
+        while True:
+            result = poll()
+            polls += 1
+            if is_done(result):
+                get_logger().debug('Job done after %d polls', polls)
+                return result
+            delay = min(interval * random.uniform(1 - self.jitter, 1 + self.jitter), self.max_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    get_logger().debug('Job not done after %d polls, timed out', polls)
+                    return None
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            interval = min(interval * self.multiplier, self.max_interval)
+
+
+class AsyncJobWaiter(JobWaiter):
+    ''' JobWaiter for asyncio, the event loop keeps running other requests between polls '''
+
+    async def wait(self, poll, is_done):
+        ''' Awaits `poll()` until `is_done(result)` is true and returns that result.
+            Returns None if the deadline passes first.
+        '''
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        interval = self.initial_interval
+        polls = 0
+        while True:
+            result = await poll()
+            polls += 1
+            if is_done(result):
+                get_logger().debug('Job done after %d polls', polls)
+                return result
+            delay = min(interval * random.uniform(1 - self.jitter, 1 + self.jitter), self.max_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    get_logger().debug('Job not done after %d polls, timed out', polls)
+                    return None
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+            interval = min(interval * self.multiplier, self.max_interval)
+
+
+def paginate(get_page, page_size=PaginationConstants.PAGE_SIZE, start=0, next_start=None):
+    ''' Yields the items of a paged list endpoint, fetching each page only when the
+        caller has consumed the previous one, so a lookup can stop at its match.
+
+        `get_page(start, page_size)` returns or yields the items of one page, so a page
+        decoded from the response stream reaches the caller item by item.
+        `next_start(start, count, last)` returns the start of the page after the one
+        of `count` items ending with `last`, by default start + count as used by
+        offset/limit endpoints. Paging ends at the first page that is not full, or
+        when a page starts with the first item of the previous one because the
+        endpoint ignored the start.
+    '''
+    if next_start is None:
+        next_start = lambda start, count, last: start + count
+    previous_first = None
+    while True:
+        count = 0
+        last = None
+        for item in get_page(start, page_size):
+            if count == 0:
+                if item == previous_first:
+                    return
+                previous_first = item
+            count += 1
+            last = item
+            yield item
+        if count != page_size:
+            return
+        start = next_start(start, count, last)
+
+
+class JsonStreamParser(object):
+    ''' Decodes a JSON response from its stream without reading the whole body first.
+
+        The members of the top-level object are decoded one by one, and the
+        items of the `array_key` array one item at a time, so the body is never
+        held as bytes and text next to the decoded objects. Only the first
+        LOG_PREFIX_SIZE bytes are kept, for the debug log.
+    '''
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+    # Characters that may follow a complete value
+    DELIMITERS = ' \t\n\r,:]}'
+
+    def __init__(self, stream, chunk_size=JsonStreamConstants.CHUNK_SIZE,
+                 log_prefix_size=JsonStreamConstants.LOG_PREFIX_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.log_prefix_size = log_prefix_size
+        self.log_prefix = b''
+        self.truncated = False
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._array_found = False
+
+    def load(self, array_key):
+        ''' Returns the decoded body. Bodies that are not a JSON object are
+            returned like json.loads would, or as text if they are not JSON.
+        '''
+        if self._peek() != '{':
+            return self._load_rest()
+        members = {}
+        array = [item for item in self.iter_items(array_key, members)]
+        if self._array_found:
+            members[array_key] = array
+        self.finish()
+        return members
+
+    def iter_items(self, array_key, members):
+        ''' Yields the items of `array_key` while they are read, and stores the
+            other members of the top-level object in `members`.
+        '''
+        self._array_found = False
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key == array_key and self._peek() == '[':
+                self._pos += 1
+                self._array_found = True
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(',', ']') == ']':
+                            break
+            else:
+                members[key] = self._value()
+            if self._expect(',', '}') == '}':
+                return
+
+    def finish(self):
+        ''' Reads the rest of the stream, so the keep-alive connection can be reused '''
+        while self._fill():
+            pass
+
+    def log_text(self):
+        text = self.log_prefix.decode('utf-8', 'replace')
+        if self.truncated:
+            text += '... (truncated)'
+        return text
+
+    def _load_rest(self):
+        while self._fill():
+            pass
+        text = self._buffer[self._pos:]
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+
+    def _fill(self):
+        ''' Appends the next chunk to the buffer, returns False at the end of the stream '''
+        if self._eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        room = self.log_prefix_size - len(self.log_prefix)
+        self.log_prefix += chunk[:room]
+        if len(chunk) > room:
+            self.truncated = True
+        self._eof = not chunk
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(chunk, final=self._eof)
+        self._pos = 0
+        return not self._eof
+
+    def _peek(self):
+        ''' Skips whitespace, returns the next character or '' at the end of the stream '''
+        while True:
+            self._pos = self.WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, *chars):
+        char = self._peek()
+        if char not in chars:
+            raise ValueError('Expecting one of {} at {!r}'.format(chars, self._buffer[self._pos:self._pos + 20]))
+        self._pos += 1
+        return char
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            # raw_decode takes the 12 of a number cut off as 12. or 12e, the rest is in the next chunk
+            if end < len(self._buffer) and self._buffer[end] not in self.DELIMITERS and \
+                    isinstance(value, (int, float)) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def map_concurrently(func, items, max_workers=ConcurrencyConstants.MAX_WORKERS_DEFAULT, stop_on_error=False):
+    ''' Calls `func(item)` for each of `items` with at most `max_workers` calls in flight.
+
+        Returns a list of (result, error) pairs in the order of `items`, error is the
+        exception the call raised or None. A failed call does not stop the others,
+        unless `stop_on_error` is set: then calls not started yet are skipped and get
+        a concurrent.futures.CancelledError.
+    '''
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        outcomes = []
+        failed = False
+        for item in items:
+            if stop_on_error and failed:
+                outcomes.append((None, concurrent.futures.CancelledError()))
+                continue
+            try:
+                outcomes.append((func(item), None))
+            except Exception as err:
+                outcomes.append((None, err))
+                failed = True
+        return outcomes
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        if stop_on_error:
+            concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for future in futures:
+                future.cancel()
+        outcomes = []
+        for future in futures:
+            if future.cancelled():
+                outcomes.append((None, concurrent.futures.CancelledError()))
+                continue
+            error = future.exception()
+            outcomes.append((None if error is not None else future.result(), error))
+        return outcomes
+
+
+async def map_concurrently_async(func, items, max_concurrency=ConcurrencyConstants.ASYNC_MAX_CONCURRENCY_DEFAULT):
+    ''' Awaits `func(item)` for each of `items` with at most `max_concurrency` calls in flight
+        on the running event loop. Returns (result, error) pairs like map_concurrently.
+    '''
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def call(item):
+        async with semaphore:
+            try:
+                return await func(item), None
+            except Exception as err:
+                return None, err
+
+    return list(await asyncio.gather(*[call(item) for item in items]))
+
+
+def resource_id_from_uri(uri):
+    ''' Returns the ID at the end of an affected resource URI, e.g. "CL1-A,3" for
+        /ConfigurationManager/v1/objects/host-groups/CL1-A,3 '''
+    return uri.rstrip('/').rsplit('/', 1)[-1]
+
+
+def project_outputs(outputs, fields):
+    ''' Keeps only `fields` of the outputs object, or of each object of an outputs list.
+        Other outputs are returned as they are. '''
+    if isinstance(outputs, dict):
+        return dict((field, outputs[field]) for field in fields if field in outputs)
+    if isinstance(outputs, list):
+        return [project_outputs(item, fields) for item in outputs]
+    return outputs
@@ -19,4 +19,137 @@ class LoggingConstants(object):
         if level is None:
             return logging.INFO
         # Convert the level string to a logging level constant
-        return getattr(logging, level.upper())
\ No newline at end of file
+        return getattr(logging, level.upper())
+
+
+class ConnectionConstants(object):
+    # Number of idle keep-alive connections kept per (address, port, cert policy)
+    MAX_IDLE_PER_KEY = 10
+    # Methods sent again when a reused connection drops before the response,
+    # a POST may already have been acted on and is left to the caller
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+
+class ConcurrencyConstants(object):
+    # Requests an operation keeps in flight when max_workers is not given, e.g. by
+    # BlockClient and VssbClient callers or the modules without a max_workers option
+    MAX_WORKERS_DEFAULT = 1
+    # Default max_workers of the modules that create or add resources in bulk
+    MAX_WORKERS_CREATE_DEFAULT = 8
+    # Default max_workers of the modules that delete resources in bulk, lower as each
+    # deletion also starts background work on the storage system, e.g. freeing pool pages
+    MAX_WORKERS_DELETE_DEFAULT = 4
+    # Upper bound of max_workers, to keep the REST API server responsive
+    MAX_WORKERS_LIMIT = 32
+    # Requests kept in flight on one event loop by the asyncio clients when not given
+    ASYNC_MAX_CONCURRENCY_DEFAULT = 64
+
+
+class JobWaiterConstants(object):
+    # Seconds to wait for a job before giving up, the old 30 polls of 10 seconds
+    TIMEOUT = 300
+    # Seconds between polls, doubled after each poll up to MAX_INTERVAL
+    INITIAL_INTERVAL = 0.2
+    MAX_INTERVAL = 10
+    MULTIPLIER = 2
+    # Each sleep is randomized by up to this fraction of the interval
+    JITTER = 0.25
+
+
+class JsonStreamConstants(object):
+    # Bytes read from a response per chunk while decoding it as a stream
+    CHUNK_SIZE = 64 * 1024
+    # Bytes of a streamed response body kept for the debug log
+    LOG_PREFIX_SIZE = 4096
+
+
+class PaginationConstants(object):
+    # Items requested per page from paged list endpoints
+    PAGE_SIZE = 500
+
+
+class ReturnDetailConstants(object):
+    # Values of the return_detail module option
+    FULL = 'full'
+    ID = 'id'
+    FIELDS = 'fields'
+    CHOICES = [FULL, ID, FIELDS]
+
+
+class SessionCacheConstants(object):
+    CACHE_DIR = "/var/log/hitachi/ansible-storage/sessions"
+    # Seconds a cached token stays valid after its last use, kept below the
+    # 300 seconds the storage systems keep an idle session alive
+    TTL_DEFAULT = 240
+
+    @staticmethod
+    def is_enabled():
+        """
+        The session token cache is opt-in, enable it in the env variable
+        export HITACHI_SESSION_CACHE="true"
+
+        """
+        value = os.environ.get('HITACHI_SESSION_CACHE')
+        if value is None:
+            return False
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+    @staticmethod
+    def get_ttl():
+        """
+        Override the token TTL in seconds in the env variable
+        export HITACHI_SESSION_CACHE_TTL="120"
+
+        """
+        value = os.environ.get('HITACHI_SESSION_CACHE_TTL')
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return SessionCacheConstants.TTL_DEFAULT
+
+
+class NameCacheConstants(object):
+    CACHE_DIR = "/var/log/hitachi/ansible-storage/names"
+    SERVER = 'server'
+    PORT = 'port'
+    POOL = 'pool'
+    VOLUME = 'volume'
+    SNAPSHOT_GROUP = 'snapshot_group'
+    COPY_GROUP = 'copy_group'
+    COPY_PAIR = 'copy_pair'
+    # Seconds a name stays mapped to its ID, by kind of resource. Ports and
+    # pools are rarely renamed, the other kinds come and go with the tenants
+    TTL_DEFAULTS = {
+        SERVER: 600,
+        PORT: 3600,
+        POOL: 3600,
+        VOLUME: 600,
+        SNAPSHOT_GROUP: 600,
+        COPY_GROUP: 600,
+        COPY_PAIR: 600,
+    }
+
+    @staticmethod
+    def is_enabled():
+        """
+        The name cache is on by default, disable it in the env variable
+        export HITACHI_NAME_CACHE="false"
+
+        """
+        value = os.environ.get('HITACHI_NAME_CACHE')
+        if value is None:
+            return True
+        return value.strip().lower() not in ('0', 'false', 'no', 'off')
+
+    @staticmethod
+    def get_ttl(kind):
+        """
+        Override the TTL in seconds of every kind in the env variable
+        export HITACHI_NAME_CACHE_TTL="60"
+
+        """
+        value = os.environ.get('HITACHI_NAME_CACHE_TTL')
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return NameCacheConstants.TTL_DEFAULTS[kind]
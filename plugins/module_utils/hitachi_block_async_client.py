@@ -0,0 +1,298 @@
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import io
+import json
+from http import HTTPStatus
+
+from ansible.module_utils.urls import urllib_error, socket
+from ansible.module_utils.six.moves.urllib import parse as urlparse
+from ansible.module_utils.six.moves.http_client import HTTPException
+from ansible.module_utils.hitachi_block_constant import (
+    Api,
+    PfRestEndpoints,
+    Http,
+    ErrorMessages,
+    LogMessages,
+)
+from ansible.module_utils.hitachi_block_client import (
+    get_logger,
+    BlockSession,
+    Executors,
+    HTTPClient,
+    HitachiBlockHttpException,
+    HitachiBlockModuleException,
+)
+from ansible.module_utils.hitachi_ansible_common import (
+    basic_auth_header,
+    ASYNC_CONNECTION_POOL,
+    CONNECTION_POOL,
+    AsyncJobWaiter,
+    project_outputs,
+    resource_id_from_uri,
+)
+from ansible.module_utils.hitachi_ansible_common_constant import (
+    ConcurrencyConstants,
+    NameCacheConstants,
+    ReturnDetailConstants,
+)
+
+
+class AsyncHTTPClient(object):
+    ''' asyncio counterpart of HTTPClient.
+
+        Requests are sent over ASYNC_CONNECTION_POOL on the running event loop and
+        jobs are awaited with AsyncJobWaiter, so many requests and job polls overlap
+        in one thread. Request bodies and responses are built and decoded by HTTPClient.
+    '''
+
+    @staticmethod
+    async def _request(http_verb, endpoint, params, body=None):
+        try:
+            return await AsyncHTTPClient._send_request(http_verb, endpoint, params, body)
+        except HitachiBlockHttpException as err:
+            # A cached or long running session token may have expired on the storage system
+            if getattr(err, 'code', None) != HTTPStatus.UNAUTHORIZED or params.session is None:
+                raise
+            # Renewing logs in with the blocking client, keep it off the event loop
+            renewed = await asyncio.get_running_loop().run_in_executor(None, params.session.renew, params)
+            if not renewed:
+                raise
+            return await AsyncHTTPClient._send_request(http_verb, endpoint, params, body)
+
+    @staticmethod
+    async def _send_request(http_verb, endpoint, params, body=None):
+        url = HTTPClient._format_url(params, endpoint)
+        if CONNECTION_POOL.is_proxied(url):
+            # AsyncConnectionPool does not speak to proxies, open_url does
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(HTTPClient._send_request, http_verb, endpoint, params, body=body))
+        try:
+            headers = dict(Http.HEADERS_JSON)
+            if params.session_token is not None:
+                headers[Http.AUTHORIZATION] = Http.SESSION + params.session_token
+            else:
+                headers[Http.AUTHORIZATION] = basic_auth_header(params.user, params.password)
+            headers['User-Agent'] = Http.USER_AGENT
+
+            get_logger().debug(LogMessages.API_REQUEST_START.format(
+                               http_verb, urlparse.urlparse(url).path))
+
+            data = None
+            if (http_verb == Http.POST or http_verb == Http.PUT) and body is not None:
+                data = json.dumps(body)
+
+            response = await ASYNC_CONNECTION_POOL.request(
+                http_verb,
+                url,
+                data=data,
+                headers=headers,
+                validate_certs=HTTPClient._is_validate_certs(params),
+                timeout=Http.OPEN_URL_TIMEOUT
+            )
+            if response.status >= 400:
+                raise urllib_error.HTTPError(url, response.status, response.reason, response.msg, io.BytesIO(response.read()))
+            return HTTPClient._load_response(response)
+        except (urllib_error.URLError, socket.timeout) as err:
+            raise HitachiBlockHttpException(err)
+        except HTTPException as err:
+            raise HitachiBlockHttpException(err)
+
+    @staticmethod
+    async def get_by_uri(params, uri):
+        return await AsyncHTTPClient._request(Http.GET, uri, params)
+
+    @staticmethod
+    async def get_jobs(params, job_id):
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.GET_JOBS, job_id)
+        return await AsyncHTTPClient._request(Http.GET, endpoint, params)
+
+    @staticmethod
+    async def _poll_job(params, job):
+        ''' Same as HTTPClient._poll_job '''
+        if job.get(Api.STATUS) == 'Completed':
+            return job
+        job_id = job[Api.JOBID]
+        return await AsyncJobWaiter().wait(lambda: AsyncHTTPClient.get_jobs(params, job_id),
+                                           lambda job_response: job_response[Api.STATUS] == 'Completed')
+
+    @staticmethod
+    async def _wait_job(params, job):
+        ''' Same as HTTPClient._wait_job '''
+        job_response = await AsyncHTTPClient._poll_job(params, job)
+        if job_response is None:
+            raise HitachiBlockModuleException(ErrorMessages.JOB_TIMEOUT_ERR.format(job[Api.JOBID]))
+        if job_response[Api.STATE] != 'Succeeded':
+            raise HitachiBlockModuleException(HTTPClient._job_error_message(job_response))
+        return job_response
+
+    @staticmethod
+    async def post_ldevs(params):
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.POST_LDEVS)
+        post_response = await AsyncHTTPClient._request(Http.POST, endpoint, params, body=HTTPClient.ldevs_body(params))
+        job_response = await AsyncHTTPClient._poll_job(params, post_response)
+        if job_response is None:
+            raise HitachiBlockModuleException(ErrorMessages.JOB_TIMEOUT_ERR.format(post_response[Api.JOBID]))
+        return HTTPClient.ldevs_result(job_response)
+
+    @staticmethod
+    async def post_snapshots(params):
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.POST_SNAPSHOTS)
+        post_response = await AsyncHTTPClient._request(Http.POST, endpoint, params, body=HTTPClient.snapshots_body(params))
+        job_response = await AsyncHTTPClient._wait_job(params, post_response)
+        return job_response[Api.AFFECTEDRESOURCES][0]
+
+    @staticmethod
+    async def post_snapshots_split(params):
+        return await AsyncHTTPClient._post_snapshots_action(params, PfRestEndpoints.POST_SNAPSHOTS_SPLIT)
+
+    @staticmethod
+    async def post_snapshots_resync(params):
+        return await AsyncHTTPClient._post_snapshots_action(params, PfRestEndpoints.POST_SNAPSHOTS_RESYNC)
+
+    @staticmethod
+    async def post_snapshots_restore(params):
+        return await AsyncHTTPClient._post_snapshots_action(params, PfRestEndpoints.POST_SNAPSHOTS_RESTORE,
+                                                            body=HTTPClient.snapshots_restore_body())
+
+    @staticmethod
+    async def _post_snapshots_action(params, endpoint_format, body=None):
+        endpoint = HTTPClient._format_endpoint(endpoint_format, params.snapshot_id)
+        post_response = await AsyncHTTPClient._request(Http.POST, endpoint, params, body=body)
+        job_response = await AsyncHTTPClient._wait_job(params, post_response)
+        return job_response[Api.AFFECTEDRESOURCES][0]
+
+
+class AsyncExecutors(object):
+    ''' asyncio counterpart of Executors.
+
+        Used as an async context manager, one session is opened for every operation
+        awaited inside. Each operation runs on its own copy of the Params, and its
+        keyword arguments override the Params attributes of the same name, so one
+        AsyncExecutors can drive many operations with asyncio.gather:
+
+            async with AsyncExecutors(module_params) as executors:
+                results = await asyncio.gather(*[executors.create_ldev(ldev_id=ldev_id)
+                                                 for ldev_id in ldev_ids])
+
+        create_ldev, create_ti, split_ti, resync_ti and restore_ti send their requests
+        and poll their jobs on the event loop. Their name and snapshot lookups, which
+        may read the name cache file, and any other Executors operation awaited with
+        run(), such as split_si, use one of `max_threads` worker threads instead, so
+        at most `max_threads` of those are in flight at a time.
+    '''
+
+    def __init__(self, params=None, max_threads=ConcurrencyConstants.ASYNC_MAX_CONCURRENCY_DEFAULT):
+        self.executors = Executors(params)
+        self.params = self.executors.params
+        self.max_threads = max_threads
+        self.session = None
+        self._threads = None
+
+    async def __aenter__(self):
+        self._threads = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_threads)
+        self.session = BlockSession(self.params)
+        await self._in_thread(self.session.__enter__)
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        session, self.session = self.session, None
+        try:
+            await self._in_thread(session.__exit__, exception_type, exception_value, traceback)
+        finally:
+            threads, self._threads = self._threads, None
+            threads.shutdown(wait=False)
+
+    async def create_ldev(self, **overrides):
+        params = self._context(overrides)
+        if params.check_mode:
+            return {Api.CHANGED: False}
+        affected_resource_uri, response = await AsyncHTTPClient.post_ldevs(params)
+        if affected_resource_uri is not None:
+            outputs = await self._get_by_uri(params, affected_resource_uri)
+            if "blockCapacity" in outputs:
+                outputs["capacity_mb"] = outputs.pop("blockCapacity")/2/1024
+            response = {
+                Api.CHANGED: True,
+                Api.OUTPUTS: outputs,
+            }
+        return self._projected(params, response)
+
+    async def create_ti(self, **overrides):
+        params = self._context(overrides)
+        if params.check_mode:
+            return {Api.CHANGED: False}
+        affected_resource_uri = await AsyncHTTPClient.post_snapshots(params)
+        # Invalidating locks and rewrites the name cache file
+        await self._in_thread(HTTPClient.invalidate_name, params, NameCacheConstants.SNAPSHOT_GROUP,
+                              params.snapshot_group_name)
+        outputs = await self._get_by_uri(params, affected_resource_uri)
+        return self._projected(params, {
+            Api.CHANGED: True,
+            Api.OUTPUTS: outputs,
+        })
+
+    async def split_ti(self, **overrides):
+        return await self._snapshot_action(overrides, AsyncHTTPClient.post_snapshots_split,
+                                           'The Snapshot is not found specified by pvol_ldev_id.', always_find=True)
+
+    async def resync_ti(self, **overrides):
+        return await self._snapshot_action(overrides, AsyncHTTPClient.post_snapshots_resync,
+                                           'The Snapshot is not found specified by snapshot_group_name and pvol_ldev_id and mu_number.')
+
+    async def restore_ti(self, **overrides):
+        return await self._snapshot_action(overrides, AsyncHTTPClient.post_snapshots_restore,
+                                           'The Snapshot is not found specified by snapshot_group_name and pvol_ldev_id and mu_number.')
+
+    async def _snapshot_action(self, overrides, post, not_found_message, always_find=False):
+        ''' Same as Executors._do_split_ti, _do_resync_ti and _do_restore_ti '''
+        params = self._context(overrides)
+        if params.check_mode:
+            return {Api.CHANGED: False}
+        Executors._validate_mu_number(params)
+        if always_find or params.mu_number is not None:
+            params.snapshot_id = await self._in_thread(HTTPClient.get_snapshot_id, params, '')
+        if params.snapshot_id is None:
+            raise HitachiBlockModuleException(not_found_message)
+        affected_resource_uri = await post(params)
+        outputs = await self._get_by_uri(params, affected_resource_uri)
+        return self._projected(params, {
+            Api.CHANGED: True,
+            Api.OUTPUTS: outputs,
+        })
+
+    async def run(self, operation, **overrides):
+        ''' Awaits the Executors `operation`, e.g. 'split_si', run in a worker thread '''
+        executors = copy.copy(self.executors)
+        executors.params = self._context(overrides)
+        return await self._in_thread(getattr(executors, operation))
+
+    async def _in_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._threads, func, *args)
+
+    def _context(self, overrides):
+        params = self.params.copy()
+        for name, value in overrides.items():
+            if not hasattr(params, name):
+                raise HitachiBlockModuleException(ErrorMessages.UNKNOWN_PARAMETER_ERR.format(name))
+            setattr(params, name, value)
+        return params
+
+    @staticmethod
+    async def _get_by_uri(params, uri):
+        if params.return_detail == ReturnDetailConstants.ID:
+            # The caller only needs the ID, skip reading the resource back
+            return {Api.ID: resource_id_from_uri(uri)}
+        endpoint = uri.split('/', 2)[2]
+        return await AsyncHTTPClient.get_by_uri(params, endpoint)
+
+    @staticmethod
+    def _projected(params, response):
+        if params.return_detail == ReturnDetailConstants.FIELDS and \
+                isinstance(response, dict) and Api.OUTPUTS in response:
+            response[Api.OUTPUTS] = project_outputs(response[Api.OUTPUTS], params.return_fields)
+        return response
@@ -1,7 +1,11 @@
 from datetime import datetime
 import functools
+import contextlib
+import io
 import json
+import concurrent.futures
 import copy
+import threading
 import time
 import urllib.parse
 
@@ -26,7 +30,21 @@ from ansible.module_utils.hitachi_block_constant import (
 
 from ansible.module_utils.hitachi_ansible_common import (
     initialize_filehandler_logger,
-    
+    basic_auth_header,
+    CONNECTION_POOL,
+    SESSION_TOKEN_CACHE,
+    NAME_ID_CACHE,
+    JobWaiter,
+    JsonStreamParser,
+    map_concurrently,
+    paginate,
+    project_outputs,
+    resource_id_from_uri,
+)
+from ansible.module_utils.hitachi_ansible_common_constant import (
+    ConcurrencyConstants,
+    NameCacheConstants,
+    ReturnDetailConstants,
 )
 
 def checkHex(s):
@@ -118,6 +136,58 @@ def get_with_log(class_name=''):
     return with_log
 
 
+def with_request_context(func):
+    ''' Decorates an Executors operation to run on its own copy of the Params, so operations
+        of one Executors can run concurrently from worker threads '''
+    @functools.wraps(func)
+    def in_context(self, *args, **kwargs):
+        context = copy.copy(self)
+        context.params = self.params.copy()
+        return func(context, *args, **kwargs)
+    return in_context
+
+
+def with_session(func):
+    ''' Decorates an Executors operation to run inside one BlockSession '''
+    @functools.wraps(func)
+    def in_session(self, *args, **kwargs):
+        with BlockSession(self.params):
+            return func(self, *args, **kwargs)
+    return in_session
+
+
+def with_name_cache(func):
+    ''' Decorates an Executors operation to run again with fresh lookups when the
+        storage system answers 404 Not Found to an ID taken from NAME_ID_CACHE '''
+    @functools.wraps(func)
+    def resolved(self, *args, **kwargs):
+        del self.params.name_cache_hits[:]
+        try:
+            return func(self, *args, **kwargs)
+        except HitachiBlockHttpException as err:
+            if getattr(err, 'code', None) != HTTPStatus.NOT_FOUND or not self.params.name_cache_hits:
+                raise
+            for kind, name in self.params.name_cache_hits:
+                HTTPClient.invalidate_name(self.params, kind, name)
+            del self.params.name_cache_hits[:]
+            get_logger().info('A cached resource ID is not found, looking the names up again')
+            return func(self, *args, **kwargs)
+    return resolved
+
+
+def with_return_detail(func):
+    ''' Decorates an Executors operation to reduce its outputs to the return_fields
+        when return_detail is fields '''
+    @functools.wraps(func)
+    def projected(self, *args, **kwargs):
+        response = func(self, *args, **kwargs)
+        if self.params.return_detail == ReturnDetailConstants.FIELDS and \
+                isinstance(response, dict) and Api.OUTPUTS in response:
+            response[Api.OUTPUTS] = project_outputs(response[Api.OUTPUTS], self.params.return_fields)
+        return response
+    return projected
+
+
 class Params(object):
     def __init__(self, params=None):
         if params is not None:
@@ -150,6 +220,15 @@ class Params(object):
             self.copy_pair_name = params.get(ModuleArgs.COPY_PAIR_NAME, ModuleArgs.NULL)
             self.mu_number = params.get(ModuleArgs.MU_NUMBER)
             self.generations = params.get(ModuleArgs.GENERATIONS)
+            self.max_workers = params.get(ModuleArgs.MAX_WORKERS, ConcurrencyConstants.MAX_WORKERS_DEFAULT)
+            self.return_detail = params.get(ModuleArgs.RETURN_DETAIL, ReturnDetailConstants.FULL)
+            self.return_fields = params.get(ModuleArgs.RETURN_FIELDS)
+            self.port_settings = params.get(ModuleArgs.PORT_SETTINGS)
+            self.chap_settings = params.get(ModuleArgs.CHAP_SETTINGS)
+            self.action = params.get(ModuleArgs.ACTION)
+            if self.return_detail == ReturnDetailConstants.FIELDS and not self.return_fields:
+                raise HitachiBlockModuleException(
+                    ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.RETURN_FIELDS))
             self.external_port_id = params.get(ModuleArgs.EXTERNAL_PORT_ID)
             self.external_lun = params.get(ModuleArgs.EXTERNAL_LUN)
             self.external_paritygroup_id = params.get(ModuleArgs.EXTERNAL_PARITYGROUP_ID)
@@ -158,7 +237,6 @@ class Params(object):
             self.external_iscsi_target = params.get(ModuleArgs.EXTERNAL_ISCSI_TARGET)
             self.external_pathgroup_id = params.get(ModuleArgs.EXTERNAL_PATHGROUP_ID)
             self.advisor_port = params.get(ModuleArgs.ADVISOR_PORT)
-            self.request_params = None
             self.chap_user_name = params.get(ModuleArgs.CHAP_USER_NAME)
             self.way_of_chap_user = params.get(ModuleArgs.WAY_OF_CHAP_USER)
             self.chap_password = params.get(ModuleArgs.CHAP_PASSWORD)
@@ -168,8 +246,26 @@ class Params(object):
             self.local_clone_copypair_id = None
             self.snapshot_group_id = None
             self.snapshot_id = None
-            self.auto_split = None
+            self.auto_split = params.get(ModuleArgs.AUTO_SPLIT)
+            self.pvol_ldev_ids = params.get(ModuleArgs.PVOL_LDEV_IDS)
             self.session_id = None
+            self.session_token = None
+            self.session = None
+            # Set once the running operation has renewed the session token, see renew()
+            self.session_renewed = False
+            # (kind, name) of the IDs taken from NAME_ID_CACHE by the running operation
+            self.name_cache_hits = []
+            # snapshotId by (snapshotGroupName, pvolLdevId, muNumber) found by the running
+            # operation, shared by its workers. A pair may be deleted or recreated between operations
+            self.snapshot_ids = {}
+
+    def copy(self):
+        ''' Returns a shallow copy for one Executors operation. IDs looked up and other
+            values set during the operation stay on the copy. '''
+        params = copy.copy(self)
+        params.name_cache_hits = []
+        params.snapshot_ids = {}
+        return params
 
     @property
     def management_address(self):
@@ -489,6 +585,47 @@ class Params(object):
     def generations(self, value):
         self._generations = value
 
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        if value is None:
+            value = ConcurrencyConstants.MAX_WORKERS_DEFAULT
+        Params.validate_non_bool(ModuleArgs.MAX_WORKERS, value)
+        if value < 1 or value > ConcurrencyConstants.MAX_WORKERS_LIMIT:
+            raise HitachiBlockModuleException(
+                ErrorMessages.INVALID_RANGE_VALUE.format(
+                    ModuleArgs.MAX_WORKERS, value, 1, ConcurrencyConstants.MAX_WORKERS_LIMIT))
+        self._max_workers = value
+
+    @property
+    def return_detail(self):
+        return self._return_detail
+
+    @return_detail.setter
+    def return_detail(self, value):
+        if value is None:
+            value = ReturnDetailConstants.FULL
+        if value not in ReturnDetailConstants.CHOICES:
+            raise HitachiBlockModuleException(
+                ErrorMessages.INVALID_CHOICE_VALUE.format(
+                    ModuleArgs.RETURN_DETAIL, value, ', '.join(ReturnDetailConstants.CHOICES)))
+        self._return_detail = value
+
+    @property
+    def action(self):
+        return self._action
+
+    @action.setter
+    def action(self, value):
+        if value is not None and value not in AutomationConstants.GROUP_ACTIONS:
+            raise HitachiBlockModuleException(
+                ErrorMessages.INVALID_CHOICE_VALUE.format(
+                    ModuleArgs.ACTION, value, ', '.join(AutomationConstants.GROUP_ACTIONS)))
+        self._action = value
+
     @get_with_log('Params')
     def _is_exceeds_max_length(self, value, max_len):
         if len(to_text(value)) > max_len:
@@ -516,7 +653,7 @@ class Params(object):
     @staticmethod
     @get_with_log('Params')
     def validate_name_parameter(param, value, bPassword=False):
-        if value is not ModuleArgs.NULL and (len(value) < AutomationConstants.NAME_PARAMS_MIN or len(value) > AutomationConstants.NAME_PARAMS_MAX ):
+        if value is not ModuleArgs.NULL and value is not None and (len(value) < AutomationConstants.NAME_PARAMS_MIN or len(value) > AutomationConstants.NAME_PARAMS_MAX ):
             if bPassword:
                 raise HitachiBlockValidationException( ErrorMessages.INVALID_NAME_SIZE.format(
                         param, '******'))
@@ -551,7 +688,7 @@ class Params(object):
     @staticmethod
     @get_with_log('Params')
     def validate_size_value(param, value):
-        if value is not ModuleArgs.NULL and (value > AutomationConstants.MAX_SIZE_ALLOWED or value < AutomationConstants.MIN_SIZE_ALLOWED):
+        if value is not ModuleArgs.NULL and value is not None and (value > AutomationConstants.MAX_SIZE_ALLOWED or value < AutomationConstants.MIN_SIZE_ALLOWED):
             raise HitachiBlockValidationException( ErrorMessages.INVALID_SIZE_VALUE.format(
                     param, value))
             
@@ -624,13 +761,23 @@ class HitachiBlockHttpException(HitachiBlockException):
 
 
 class HTTPClient(object):
+    # True once the storage system answered 400 Bad Request to a snapshots query
+    _snapshot_query_unsupported = False
+
     @staticmethod
     @get_with_log('HTTPClient')
     def post_ldevs(params, storage_device_id):
-        logger = get_logger()
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_LDEVS)
-        params.request_params = {
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=HTTPClient.ldevs_body(params))
+        job_response = HTTPClient._poll_job(params, post_response)
+        if job_response is None:
+            raise HitachiBlockModuleException(ErrorMessages.JOB_TIMEOUT_ERR.format(post_response[Api.JOBID]))
+        return HTTPClient.ldevs_result(job_response)
+
+    @staticmethod
+    def ldevs_body(params):
+        return {
             Api.POOLID: params.pool_id,
             Api.DATAREDUCTIONMODE: 'compression_deduplication',
             Api.LDEVID: params.ldev_id,
@@ -638,10 +785,12 @@ class HTTPClient(object):
             #Api.BLOCKCAPACITY: params.block_capacity * 1024,
             Api.DATA_REDUCTION_MODE: params.data_reduction_mode
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
+
+    @staticmethod
+    def ldevs_result(job_response):
+        ''' Returns (affected resource URI, None) of the completed post_ldevs job,
+            or (None, response) if the LDEV is already defined '''
+        logger = get_logger()
         job_state = job_response[Api.STATE]
         apierr = job_response.get(Api.ERROR,None)
 
@@ -655,14 +804,10 @@ class HTTPClient(object):
             return None, response
 
         response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
+        if job_state == 'Succeeded':
             response = job_response[Api.AFFECTEDRESOURCES][0]
         else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+            raise HitachiBlockModuleException(HTTPClient._job_error_message(job_response))
         return response, None
 
     @staticmethod
@@ -670,25 +815,14 @@ class HTTPClient(object):
     def post_ldev_expand(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_LDEVS_EXPAND, storage_device_id, params.ldev_id)
-        params.request_params = {
+        request_params = {
             "parameters": {
                 Api.ADDITIONALBLOCKCAPACITY: str(params.capacity_mb) +  "M",
             }
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -696,26 +830,15 @@ class HTTPClient(object):
     def post_host_groups(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_HOST_GROUPS)
-        params.request_params = {
+        request_params = {
             Api.PORTID: params.port_id,
             Api.HOSTGROUPNUMBER: params.host_group_number,
             Api.HOSTGROUPNAME: params.host_group_name,
             Api.HOSTMODE: params.host_mode
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -723,25 +846,14 @@ class HTTPClient(object):
     def post_luns(params):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_LUNS)
-        params.request_params = {
+        request_params = {
             Api.PORTID: params.port_id,
             Api.HOSTGROUPNUMBER: params.host_group_number,
             Api.LDEVID: params.ldev_id
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -750,55 +862,50 @@ class HTTPClient(object):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_HOST_ISCSIS)
-        params.request_params = {
+        request_params = {
             Api.ISCSINAME: params.iscsi_name,
             Api.PORTID: params.port_id,
             Api.HOSTGROUPNUMBER: params.host_group_number
         }
-        logger.debug(f"Request parameters {params.request_params }")
-        post_response =  HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        logger.debug(f"Request parameters {request_params }")
+        post_response =  HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
     @get_with_log('HTTPClient')
     def get_host_iscsis(params, port_id, host_group_number):
         endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_HOST_ISCSIS, '?{}={}&{}={}'.format(Api.PORTID, port_id, Api.HOSTGROUPNUMBER, host_group_number))
-        return HTTPClient._request(Http.GET, endpoint, params)
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def get_host_iscsis_by_port(params, port_id):
+        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_HOST_ISCSIS, '?{}={}'.format(Api.PORTID, port_id))
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def get_host_groups_by_port(params, port_id):
+        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_HOST_GROUPS_BY_PORT, port_id)
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def get_chap_users_by_port(params, port_id):
+        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_CHAP_USERS, port_id)
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
 
     @staticmethod
     @get_with_log('HTTPClient')
     def delete_host_iscsis(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.PUT_HOST_ISCSIS, params.port_id, params.host_group_number, params.iscsi_name)
-        params.request_params = {}
 
         delete_response = HTTPClient._request(Http.DELETE, endpoint, params)
-        job_id = delete_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        job_response = HTTPClient._wait_job(params, delete_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
         
 
@@ -808,24 +915,13 @@ class HTTPClient(object):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.PUT_HOST_ISCSIS, params.port_id, params.host_group_number, params.iscsi_name)
-        params.request_params = {
+        request_params = {
             Api.ISCSINICKNAME: params.nick_name
         }
         logger.debug(f"end point details: %s %s", endpoint, params)
-        put_response = HTTPClient._request(Http.PUT, endpoint, params)
-        job_id = put_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        put_response = HTTPClient._request(Http.PUT, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, put_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
             
         logger.debug(f"Final response of the task {response}")
         return response
@@ -843,26 +939,15 @@ class HTTPClient(object):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_CHAP_USERS)
-        params.request_params = {
+        request_params = {
             Api.CHAPUSERNAME: params.chap_user_name,
             Api.PORTID: params.port_id,
             Api.HOSTGROUPNUMBER: params.host_group_number,
             Api.WAYOFCHAPUSER: params.way_of_chap_user
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -870,43 +955,25 @@ class HTTPClient(object):
     def post_chap_users_single(params):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.PUT_CHAP_USERS_SINGLE, params.port_id, params.host_group_number, params.way_of_chap_user, params.chap_user_name)
-        params.request_params = {
+        request_params = {
             Api.CHAPPASSWORD: params.chap_password
         }
-        put_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = put_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        put_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, put_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
     @get_with_log('HTTPClient')
     def post_local_clone_copypairs(params, storage_device_id):
-        copy_pair_name = 'clone_' + format(params.pvol_ldev_id, '06X') + '_' + format(params.svol_ldev_id, '06X')
-        ''' Check Copy Group '''
-        endpoint = HTTPClient._format_endpoint(
-            PfRestEndpoints.GET_LOCAL_CLONE_COPYGROUPS, storage_device_id)
-        get_response = HTTPClient._request(Http.GET, endpoint, params)
-        local_clone_copygroups = [elm for elm in get_response['data'] if elm['copyGroupName'] == params.copy_group_name]
-        if len(local_clone_copygroups) <= 0:
-            isNewCopyGroup = True
-        else:
-            isNewCopyGroup = False
+        copy_pair_name = HTTPClient.local_clone_copypair_name(params.pvol_ldev_id, params.svol_ldev_id)
+        ''' Check Copy Group, on the storage system: a cached ID may outlive a group removed since '''
+        isNewCopyGroup = HTTPClient.get_local_clone_copygroup_id_by_name(params, storage_device_id, use_cache=False) is None
 
         copy_pace = 3 if params.copy_pace is None else params.copy_pace
         is_consistency_group = False if params.consistency_group_id is None else True
         pvolMuNumber = 0
-        params.request_params = {
+        request_params = {
             Api.COPYGROUPNAME: params.copy_group_name,
             Api.COPYPAIRNAME: copy_pair_name,
             Api.REPLICATIONTYPE: "SI",
@@ -921,20 +988,9 @@ class HTTPClient(object):
         }
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_LOCAL_CLONE_COPYPAIRS, storage_device_id)
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -942,7 +998,28 @@ class HTTPClient(object):
     def get_local_clone_copygroups(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.GET_LOCAL_CLONE_COPYGROUPS)
-        return HTTPClient._request(Http.GET, endpoint, params)
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
+
+    @staticmethod
+    def iter_local_clone_copygroups(params, storage_device_id):
+        ''' Yields the local-clone-copygroups, the endpoint has no paging so they come from one GET '''
+        for copygroup in HTTPClient.get_local_clone_copygroups(params, storage_device_id)['data']:
+            yield copygroup
+
+    @staticmethod
+    def get_local_clone_copygroup_id_by_name(params, storage_device_id, use_cache=True):
+        ''' Returns the localCloneCopygroupId of params.copy_group_name, None if it is not found.
+            Without `use_cache` the copy groups are always listed. '''
+        if use_cache:
+            resource_id = HTTPClient.get_cached_id(params, NameCacheConstants.COPY_GROUP, params.copy_group_name)
+            if resource_id is not None:
+                return resource_id
+        for copygroup in HTTPClient.iter_local_clone_copygroups(params, storage_device_id):
+            if copygroup['copyGroupName'] is not None and copygroup['copyGroupName'] == params.copy_group_name:
+                resource_id = copygroup['localCloneCopygroupId']
+                HTTPClient.cache_names(params, NameCacheConstants.COPY_GROUP, {params.copy_group_name: resource_id})
+                return resource_id
+        return None
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -951,64 +1028,107 @@ class HTTPClient(object):
             PfRestEndpoints.GET_LOCAL_CLONE_COPYGROUPS_ONE, params.local_clone_copygroup_id)
         return HTTPClient._request(Http.GET, endpoint, params)
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def get_local_clone_copypairs_one(params, storage_device_id, copypair_id):
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.GET_LOCAL_CLONE_COPYPAIRS_ONE, copypair_id)
+        return HTTPClient._request(Http.GET, endpoint, params)
+
+    @staticmethod
+    def local_clone_copypair_name(pvol_ldev_id, svol_ldev_id):
+        ''' Returns the name post_local_clone_copypairs gives the pair of the two LDEVs '''
+        return 'clone_' + format(pvol_ldev_id, '06X') + '_' + format(svol_ldev_id, '06X')
+
+    @staticmethod
+    def get_local_clone_copypair_id_by_name(params, storage_device_id):
+        ''' Returns the localCloneCopypairId of params.copy_pair_name in params.copy_group_name,
+            None if it is not found. Without a copy_pair_name, the pair is the one
+            post_local_clone_copypairs created for params.pvol_ldev_id and params.svol_ldev_id.
+            A pair ID is the copy group ID followed by the pair name, so the pair is read
+            directly and the pairs of the group are only listed if that read finds nothing.
+        '''
+        if params.copy_pair_name not in (None, ModuleArgs.NULL):
+            copy_pair_name = params.copy_pair_name
+        else:
+            if params.pvol_ldev_id in (None, ModuleArgs.NULL) or params.svol_ldev_id in (None, ModuleArgs.NULL):
+                raise HitachiBlockModuleException(ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.COPY_PAIR_NAME))
+            copy_pair_name = HTTPClient.local_clone_copypair_name(params.pvol_ldev_id, params.svol_ldev_id)
+        cache_name = params.copy_group_name + ',' + copy_pair_name
+        copypair_id = HTTPClient.get_cached_id(params, NameCacheConstants.COPY_PAIR, cache_name)
+        if copypair_id is not None:
+            return copypair_id
+
+        params.local_clone_copygroup_id = HTTPClient.get_local_clone_copygroup_id_by_name(params, storage_device_id)
+        if params.local_clone_copygroup_id is None:
+            raise HitachiBlockModuleException('The Copy Group is not found specified by copy_group_name.')
+        try:
+            copypair = HTTPClient.get_local_clone_copypairs_one(
+                params, storage_device_id, params.local_clone_copygroup_id + ',' + copy_pair_name)
+        except HitachiBlockHttpException as err:
+            if getattr(err, 'code', None) != HTTPStatus.NOT_FOUND:
+                raise
+            copypairs = HTTPClient.get_local_clone_copygroups_one(params, storage_device_id)['copyPairs']
+            copypair = next((cp for cp in copypairs
+                             if cp['copyPairName'] is not None and cp['copyPairName'] == copy_pair_name), None)
+            if copypair is None:
+                return None
+        copypair_id = copypair['localCloneCopypairId']
+        HTTPClient.cache_names(params, NameCacheConstants.COPY_PAIR, {cache_name: copypair_id})
+        return copypair_id
+
     @staticmethod
     @get_with_log('HTTPClient')
     def post_local_clone_copypairs_split(params, storage_device_id):
+        request_params = None
         if params.copy_pace is not None:
-            params.request_params = {
+            request_params = {
                 'parameters': {
                     Api.COPYPACE: params.copy_pace
                 }
             }
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_LOCAL_CLONE_COPYPAIRS_SPLIT, params.local_clone_copypair_id)
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
     @get_with_log('HTTPClient')
     def post_local_clone_copypairs_resync(params, storage_device_id):
+        request_params = None
         if params.copy_pace is not None:
-            params.request_params = {
+            request_params = {
                 'parameters': {
                     Api.COPYPACE: params.copy_pace
                 }
             }
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_LOCAL_CLONE_COPYPAIRS_RESYNC, params.local_clone_copypair_id)
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
     @get_with_log('HTTPClient')
     def post_snapshots(params):
+        post_response = HTTPClient.submit_snapshots(params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
+        return response
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def submit_snapshots(params):
+        ''' Requests the Thin Image pair and returns its job without waiting for it '''
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.POST_SNAPSHOTS)
+        return HTTPClient._request(Http.POST, endpoint, params, body=HTTPClient.snapshots_body(params))
 
+    @staticmethod
+    def snapshots_body(params):
         if params.mu_number is not None:
             value = params.mu_number
             Params.validate_non_bool(ModuleArgs.MU_NUMBER, value)
@@ -1019,12 +1139,10 @@ class HTTPClient(object):
                     ErrorMessages.INVALID_RANGE_VALUE.format(
                         ModuleArgs.MU_NUMBER, value, min, max))
 
-        endpoint = HTTPClient._format_endpoint(
-            PfRestEndpoints.POST_SNAPSHOTS)
         ''' Check Copy Group '''
         copy_speed = 'medium' if params.copy_pace is None else params.copy_speed
         is_consistency_group = False if params.is_consistency_group is None else params.is_consistency_group
-        params.request_params = {
+        request_params = {
             Api.SNAPSHOTGROUPNAME: params.snapshot_group_name,
             Api.SNAPSHOTPOOLID: params.snapshot_pool_id,
             Api.PVOLLDEVID: params.pvol_ldev_id,
@@ -1032,32 +1150,36 @@ class HTTPClient(object):
             Api.ISDATAREDUCTIONFORCECOPY: True
         }
         if params.mu_number is not None:
-            params.request_params[Api.MUNUMBER] = params.mu_number
+            request_params[Api.MUNUMBER] = params.mu_number
         if params.auto_split is not None:
-            params.request_params[Api.AUTOSPLIT] = params.auto_split
-
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
-        return response
+            request_params[Api.AUTOSPLIT] = params.auto_split
+        return request_params
 
     @staticmethod
     @get_with_log('HTTPClient')
     def get_snapshot_groups(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.GET_SNAPSHOT_GROUPS)
-        return HTTPClient._request(Http.GET, endpoint, params)
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
+
+    @staticmethod
+    def iter_snapshot_groups(params, storage_device_id):
+        ''' Yields the snapshot-groups, the endpoint has no paging so they come from one GET '''
+        for snapshotgroup in HTTPClient.get_snapshot_groups(params, storage_device_id)['data']:
+            yield snapshotgroup
+
+    @staticmethod
+    def get_snapshot_group_id_by_name(params, storage_device_id):
+        ''' Returns the snapshotGroupId of params.snapshot_group_name, None if it is not found '''
+        resource_id = HTTPClient.get_cached_id(params, NameCacheConstants.SNAPSHOT_GROUP, params.snapshot_group_name)
+        if resource_id is not None:
+            return resource_id
+        for snapshotgroup in HTTPClient.iter_snapshot_groups(params, storage_device_id):
+            if snapshotgroup['snapshotGroupName'] is not None and snapshotgroup['snapshotGroupName'] == params.snapshot_group_name:
+                resource_id = snapshotgroup['snapshotGroupId']
+                HTTPClient.cache_names(params, NameCacheConstants.SNAPSHOT_GROUP, {params.snapshot_group_name: resource_id})
+                return resource_id
+        return None
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1066,25 +1188,73 @@ class HTTPClient(object):
             PfRestEndpoints.GET_SNAPSHOT_GROUPS_ONE, params.snapshot_group_id)
         return HTTPClient._request(Http.GET, endpoint, params)
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def get_snapshots(params, storage_device_id, query):
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.GET_SNAPSHOTS, '?' + urllib.parse.urlencode(query))
+        return HTTPClient._request(Http.GET, endpoint, params)['data']
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def find_snapshots(params, storage_device_id, mu_number=None):
+        ''' Returns the snapshots of params.pvol_ldev_id in params.snapshot_group_name,
+            only the one of `mu_number` when it is given.
+            The snapshots endpoint is asked for them directly. The snapshot group is only
+            read when the storage system does not take the query or finds nothing, so a
+            missing group is reported as such.
+        '''
+        if not HTTPClient._snapshot_query_unsupported:
+            query = [
+                (Api.SNAPSHOTGROUPNAME, params.snapshot_group_name),
+                (Api.PVOLLDEVID, params.pvol_ldev_id),
+            ]
+            if mu_number is not None:
+                query.append((Api.MUNUMBER, mu_number))
+            try:
+                snapshots = HTTPClient.get_snapshots(params, storage_device_id, query)
+            except HitachiBlockHttpException as err:
+                if getattr(err, 'code', None) != HTTPStatus.BAD_REQUEST:
+                    raise
+                get_logger().info('The storage system does not take the snapshots query, scanning the snapshot group')
+                HTTPClient._snapshot_query_unsupported = True
+            else:
+                if snapshots:
+                    return snapshots
+
+        params.snapshot_group_id = HTTPClient.get_snapshot_group_id_by_name(params, storage_device_id)
+        if params.snapshot_group_id is None:
+            raise HitachiBlockModuleException('The Snapshot Group is not found specified by snapshot_group_name.')
+        snapshots = HTTPClient.get_snapshot_groups_one(params, storage_device_id)['snapshots']
+        return [ss for ss in snapshots
+                if ss['pvolLdevId'] is not None and ss['pvolLdevId'] == params.pvol_ldev_id
+                and (mu_number is None or ss['muNumber'] is not None and ss['muNumber'] == mu_number)]
+
+    @staticmethod
+    def get_snapshot_id(params, storage_device_id):
+        ''' Returns the snapshotId of params.pvol_ldev_id and params.mu_number (any MU when it is None)
+            in params.snapshot_group_name, None if there is no such snapshot.
+            The IDs found are remembered for the rest of the operation, see Params.snapshot_ids.
+        '''
+        key = (params.snapshot_group_name, params.pvol_ldev_id, params.mu_number)
+        snapshot_id = params.snapshot_ids.get(key)
+        if snapshot_id is not None:
+            return snapshot_id
+        snapshots = HTTPClient.find_snapshots(params, storage_device_id, params.mu_number)
+        if not snapshots:
+            return None
+        snapshot_id = snapshots[0]['snapshotId']
+        params.snapshot_ids[key] = snapshot_id
+        return snapshot_id
+
     @staticmethod
     @get_with_log('HTTPClient')
     def post_snapshots_split(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_SNAPSHOTS_SPLIT, params.snapshot_id)
         post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -1093,91 +1263,94 @@ class HTTPClient(object):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_SNAPSHOTS_RESYNC, params.snapshot_id)
         post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
-    @get_with_log('HTTPClient')
-    def post_snapshots_restore(params, storage_device_id):
-        params.request_params = {
+    def snapshots_restore_body():
+        return {
             "parameters": {
                 # restore TI, we don't want default to autosplit=true, UCA-119
-                Api.AUTOSPLIT: False                
-                #Api.AUTOSPLIT: True
+                Api.AUTOSPLIT: False
             }
         }
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def post_snapshots_restore(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_SNAPSHOTS_RESTORE, params.snapshot_id)
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=HTTPClient.snapshots_restore_body())
+        job_response = HTTPClient._wait_job(params, post_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def post_snapshot_groups_action(params, storage_device_id):
+        ''' Invokes params.action on every snapshot of the snapshot group with one job '''
+        request_params = None
+        if params.action == 'restore':
+            # Same as restore TI, the pairs are not split again automatically
+            request_params = {
+                "parameters": {
+                    Api.AUTOSPLIT: False
+                }
+            }
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.POST_SNAPSHOT_GROUPS_ACTION, params.snapshot_group_id, params.action)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        return job_response[Api.AFFECTEDRESOURCES]
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def post_local_clone_copygroups_action(params, storage_device_id):
+        ''' Invokes params.action on every pair of the local clone copy group with one job '''
+        request_params = None
+        if params.copy_pace not in (None, ModuleArgs.NULL) and params.action != 'restore':
+            request_params = {
+                'parameters': {
+                    Api.COPYPACE: params.copy_pace
+                }
+            }
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.POST_LOCAL_CLONE_COPYGROUPS_ACTION, params.local_clone_copygroup_id, params.action)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, post_response)
+        return job_response[Api.AFFECTEDRESOURCES]
+
     @staticmethod
     @get_with_log('HTTPClient')
     def put_iscsi_ports_discover(params, storage_device_id):
-        params.request_params = {
+        request_params = {
             "parameters": {
                 Api.ISCSIIPADDRESS: params.external_IP
             }
         }
         if params.external_port_number is not None:
-            params.request_params["parameters"][Api.TCPPORT] = params.external_port_number
+            request_params["parameters"][Api.TCPPORT] = params.external_port_number
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.PUT_ISCSI_PORTS_DISCOVER, storage_device_id, params.external_port_id)
-        return HTTPClient._request(Http.PUT, endpoint, params)
+        return HTTPClient._request(Http.PUT, endpoint, params, body=request_params)
 
     @staticmethod
     @get_with_log('HTTPClient')
     def put_iscsi_ports_register(params, storage_device_id):
-        params.request_params = {
+        request_params = {
             "parameters": {
                 Api.ISCSIIPADDRESS: params.external_IP,
                 Api.ISCSINAME: params.external_iscsi_target
             }
         }
         if params.external_port_number is not None:
-            params.request_params["parameters"][Api.TCPPORT] = params.external_port_number
+            request_params["parameters"][Api.TCPPORT] = params.external_port_number
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.PUT_ISCSI_PORTS_REGISTER, storage_device_id, params.external_port_id)
-        put_response = HTTPClient._request(Http.PUT, endpoint, params)
-        job_id = put_response[Api.JOBID]
-        job_response = HTTPClient.get_jobs(params, job_id)
-        job_status = job_response[Api.STATUS]
-        job_state = job_response[Api.STATE]
-        response = None
-        if job_status == 'Completed' and job_state == 'Succeeded':
-            response = job_response[Api.AFFECTEDRESOURCES][0]
-        else:
-            raise HitachiBlockModuleException(
-                job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                job_response[Api.ERROR][Api.SOLUTION])
+        put_response = HTTPClient._request(Http.PUT, endpoint, params, body=request_params)
+        job_response = HTTPClient._wait_job(params, put_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -1190,7 +1363,7 @@ class HTTPClient(object):
     @staticmethod
     @get_with_log('HTTPClient')
     def put_iscsi_ports_check(params, storage_device_id):
-        params.request_params = {
+        request_params = {
             "parameters": {
                 Api.ISCSIIPADDRESS: params.external_IP,
                 Api.ISCSINAME: params.external_iscsi_target
@@ -1198,12 +1371,12 @@ class HTTPClient(object):
         }
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.PUT_ISCSI_PORTS_CHECK, storage_device_id, params.external_port_id)
-        return HTTPClient._request(Http.PUT, endpoint, params)
+        return HTTPClient._request(Http.PUT, endpoint, params, body=request_params)
     
     @staticmethod
     @get_with_log('HTTPClient')
     def put_iscsi_ports_remove(params, storage_device_id):
-        params.request_params = {
+        request_params = {
             "parameters": {
                 Api.ISCSIIPADDRESS: params.external_IP,
                 Api.ISCSINAME: params.external_iscsi_target
@@ -1211,7 +1384,7 @@ class HTTPClient(object):
         }
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.PUT_ISCSI_PORTS_REMOVE, storage_device_id, params.external_port_id)
-        return HTTPClient._request(Http.PUT, endpoint, params)
+        return HTTPClient._request(Http.PUT, endpoint, params, body=request_params)
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1259,7 +1432,7 @@ class HTTPClient(object):
     @staticmethod
     @get_with_log('HTTPClient')
     def post_external_volumes(params):
-        params.request_params = {
+        request_params = {
             Api.EXTERNALPARITYGROUPID: params.external_paritygroup_id,
             Api.EXTERNALPATHGROUPID: params.external_pathgroup_id,
             Api.PORTID: params.external_port_id,
@@ -1269,7 +1442,7 @@ class HTTPClient(object):
         }
         endpoint = HTTPClient._format_endpoint(
             PfRestEndpoints.POST_EXTERNAL_VOLUMES)
-        return HTTPClient._request(Http.POST, endpoint, params)
+        return HTTPClient._request(Http.POST, endpoint, params, body=request_params)
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1301,22 +1474,50 @@ class HTTPClient(object):
 
     @staticmethod
     @get_with_log('HTTPClient')
-    def get_ldevs_one(params, storage_device_id):
-        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_LDEVS_ONE, params.ldev_id)
-        print('sngsng endpoint=',endpoint)
+    def post_objects_sessions(params):
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.POST_OBJECTS_SESSIONS)
+        request_params = None
+        return HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def delete_objects_sessions(params):
+        endpoint = HTTPClient._format_endpoint(
+            PfRestEndpoints.DELETE_OBJECTS_SESSIONS, params.session_id)
+        return HTTPClient._request(Http.DELETE, endpoint, params)
+
+    @staticmethod
+    def iter_ldevs(params, query=None):
+        ''' Yields the LDEVs matching `query`, one headLdevId/count page at a time,
+            so only the pages the caller consumes are fetched.
+        '''
+        def get_page(head_ldev_id, count):
+            page_query = dict(query or {})
+            page_query[Api.HEADLDEVID] = head_ldev_id
+            page_query[Api.COUNT] = count
+            endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_LDEVS) + '?' + urllib.parse.urlencode(page_query)
+            return HTTPClient._iter_request(endpoint, params, 'data')
+        return paginate(get_page, next_start=lambda head_ldev_id, count, last: last[Api.LDEVID] + 1)
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def get_ldevs_one(params, storage_device_id):
+        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_LDEVS_ONE, params.ldev_id)
+        print('sngsng endpoint=',endpoint)
         return HTTPClient._request(Http.GET, endpoint, params)
 
     @staticmethod
     @get_with_log('HTTPClient')
     def delete_luns(params, storage_device_id, portId, hostGroupNumber, lun):
-        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.DELETE_LUNS, storage_device_id, portId, hostGroupNumber, lun)
+        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.DELETE_LUNS, portId, hostGroupNumber, lun)
         return HTTPClient._request(Http.DELETE, endpoint, params)
 
     @staticmethod
     @get_with_log('HTTPClient')
     def get_luns(params, storage_device_id, portId, hostGroupNumber):
-        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_LUNS, storage_device_id, '?{}={}&{}={}'.format(Api.PORTID, portId, Api.HOSTGROUPNUMBER, hostGroupNumber))
-        return HTTPClient._request(Http.GET, endpoint, params)
+        endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_LUNS, '?{}={}&{}={}'.format(Api.PORTID, portId, Api.HOSTGROUPNUMBER, hostGroupNumber))
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1334,50 +1535,32 @@ class HTTPClient(object):
     @get_with_log('HTTPClient')
     def put_ldevs_change_status(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(PfRestEndpoints.PUT_LDEVS_CHANGE_STATUS, params.ldev_id)
-        params.request_params = {
+        request_params = {
             "parameters": {
                 "status": "blk"
             }
         }
-        return HTTPClient._request(Http.PUT, endpoint, params)
+        return HTTPClient._request(Http.PUT, endpoint, params, body=request_params)
 
     @staticmethod
     @get_with_log('HTTPClient')
     def put_ldevs_shred(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(PfRestEndpoints.PUT_LDEVS_SHRED, params.ldev_id)
-        params.request_params = {
+        request_params = {
             "parameters": {
                 "operationType": "start",
                 "pattern": params.shredding_pattern
             }
         }
-        return HTTPClient._request(Http.PUT, endpoint, params)
+        return HTTPClient._request(Http.PUT, endpoint, params, body=request_params)
 
     @staticmethod
     @get_with_log('HTTPClient')
     def delete_ldevs(params, storage_device_id):
         endpoint = HTTPClient._format_endpoint(PfRestEndpoints.DELETE_LDEVS, params.ldev_id)
         delete_response = HTTPClient._request(Http.DELETE, endpoint, params)
-        job_id = delete_response[Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[Api.STATUS]
-            job_state = job_response[Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
-                        job_response[Api.ERROR][Api.MESSAGE] + ' ' +
-                        job_response[Api.ERROR][Api.CAUSE] + ' ' +
-                        job_response[Api.ERROR][Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, delete_response)
+        response = job_response[Api.AFFECTEDRESOURCES][0]
         return response
 
     @staticmethod
@@ -1385,7 +1568,29 @@ class HTTPClient(object):
     def get_host_iscsi_paths(params, storage_device_id):
         query = '$query=ldev.storageDeviceId eq \'{}\'&$query=iscsi.iscsiName eq \'{}\''.format(storage_device_id, params.iscsi_name)
         endpoint = HTTPClient._format_endpoint(PfRestEndpoints.GET_HOST_ISCSI_PATHS, urllib.parse.quote(query, safe='?&=\''))
-        return HTTPClient._request(Http.GET, endpoint, params)
+        return HTTPClient._request(Http.GET, endpoint, params, stream_key='data')
+
+    @staticmethod
+    def get_cached_id(params, kind, name):
+        ''' Returns the ID of the `kind` resource `name` from NAME_ID_CACHE, None on a miss '''
+        resource_id = NAME_ID_CACHE.get(HTTPClient._name_cache_scope(params), kind, name)
+        if resource_id is not None:
+            params.name_cache_hits.append((kind, name))
+        return resource_id
+
+    @staticmethod
+    def cache_names(params, kind, ids):
+        ''' Saves the {name: ID} of `kind` resources to NAME_ID_CACHE '''
+        NAME_ID_CACHE.put(HTTPClient._name_cache_scope(params), kind, ids)
+
+    @staticmethod
+    def invalidate_name(params, kind, name=None):
+        ''' Drops the cached ID of `name`, or of every name of `kind` '''
+        NAME_ID_CACHE.invalidate(HTTPClient._name_cache_scope(params), kind, name)
+
+    @staticmethod
+    def _name_cache_scope(params):
+        return ('block', params.management_address, params.management_port, params.user)
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1401,41 +1606,189 @@ class HTTPClient(object):
 
     @staticmethod
     @get_with_log('HTTPClient')
-    def _request(http_verb, endpoint, params):
+    def _poll_job(params, job):
+        ''' Returns `job`, the reply to a POST, PUT or DELETE, once the job completes.
+            With Response-Job-Status: Completed the reply is usually the completed job
+            already, only a job still running is polled. Returns None if it did not
+            complete in time.
+        '''
+        if job.get(Api.STATUS) == 'Completed':
+            return job
+        job_id = job[Api.JOBID]
+        return JobWaiter().wait(lambda: HTTPClient.get_jobs(params, job_id),
+                                lambda job_response: job_response[Api.STATUS] == 'Completed')
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _wait_job(params, job):
+        ''' Returns the job once it succeeds, raises HitachiBlockModuleException if it failed or timed out '''
+        job_response = HTTPClient._poll_job(params, job)
+        if job_response is None:
+            raise HitachiBlockModuleException(ErrorMessages.JOB_TIMEOUT_ERR.format(job[Api.JOBID]))
+        if job_response[Api.STATE] != 'Succeeded':
+            raise HitachiBlockModuleException(HTTPClient._job_error_message(job_response))
+        return job_response
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _poll_jobs(params, jobs, max_workers=1):
+        ''' Returns each of `jobs`, the replies to POST, PUT or DELETE requests, once completed,
+            in order. One JobWaiter polls the running jobs together, up to `max_workers`
+            at a time. A job that did not complete in time is None, and a job that could
+            not be polled is the exception raised by its poll.
+        '''
+        completed = [job if job.get(Api.STATUS) == 'Completed' else None for job in jobs]
+
+        def poll():
+            running = [index for index, job in enumerate(completed) if job is None]
+            outcomes = map_concurrently(
+                lambda index: HTTPClient.get_jobs(params, jobs[index][Api.JOBID]), running, max_workers)
+            for index, (job_response, error) in zip(running, outcomes):
+                if error is not None:
+                    # Reported for this job only, the other jobs are still polled
+                    completed[index] = error
+                elif job_response[Api.STATUS] == 'Completed':
+                    completed[index] = job_response
+            return completed
+
+        if None in completed:
+            JobWaiter().wait(poll, lambda completed: None not in completed)
+        return completed
+
+    @staticmethod
+    def _job_error_message(job_response):
+        return (job_response[Api.ERROR][Api.MESSAGEID] + ' ' +
+                job_response[Api.ERROR][Api.MESSAGE] + ' ' +
+                job_response[Api.ERROR][Api.CAUSE] + ' ' +
+                job_response[Api.ERROR][Api.SOLUTION])
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _request(http_verb, endpoint, params, stream_key=None, body=None):
+        ''' Sends the request and returns the decoded response.
+            `body` is the request body of a POST, PUT or PATCH. Nothing but the session
+            is taken from or written to `params`, so requests can be sent from worker threads.
+            With `stream_key`, the array under that key is decoded item by item from the stream.
+        '''
         try:
-            headers = Http.HEADERS_JSON
-            if params.session_id is None:
-                if headers.get('Authorization') is not None:
-                    del headers['Authorization']
-            else:
-                headers['Authorization'] = 'Session ' + params.session_id
+            return HTTPClient._send_request(http_verb, endpoint, params, stream_key, body)
+        except HitachiBlockHttpException as err:
+            # A cached or long running session token may have expired on the storage system
+            if getattr(err, 'code', None) != HTTPStatus.UNAUTHORIZED or params.session is None:
+                raise
+            if not params.session.renew(params):
+                raise
+            return HTTPClient._send_request(http_verb, endpoint, params, stream_key, body)
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _send_request(http_verb, endpoint, params, stream_key=None, body=None):
+        try:
+            with HTTPClient._open(http_verb, endpoint, params, body) as response:
+                if stream_key is not None:
+                    return HTTPClient._load_response_stream(response, stream_key)
+                return HTTPClient._load_response(response)
+        except (urllib_error.URLError, socket.timeout) as err:
+            raise HitachiBlockHttpException(err)
+        except HTTPException as err:
+            raise HitachiBlockHttpException(err)
+
+    @staticmethod
+    def _iter_request(endpoint, params, stream_key):
+        ''' Yields the items of the `stream_key` array of a GET response while they are
+            decoded from the stream, so a caller can stop at a match without the rest of
+            the list being decoded. The connection is held until the items are exhausted
+            or the generator is closed.
+        '''
+        items = HTTPClient._send_stream(endpoint, params, stream_key)
+        try:
+            item = next(items)
+        except StopIteration:
+            return
+        except HitachiBlockHttpException as err:
+            # Same as _request, nothing was yielded before the status was checked
+            if getattr(err, 'code', None) != HTTPStatus.UNAUTHORIZED or params.session is None:
+                raise
+            if not params.session.renew(params):
+                raise
+            items = HTTPClient._send_stream(endpoint, params, stream_key)
+        else:
+            yield item
+        for item in items:
+            yield item
 
-            url = HTTPClient._format_url(params, endpoint)
+    @staticmethod
+    def _send_stream(endpoint, params, stream_key):
+        try:
+            with HTTPClient._open(Http.GET, endpoint, params) as response:
+                parser = JsonStreamParser(response)
+                try:
+                    for item in parser.iter_items(stream_key, {}):
+                        yield item
+                    parser.finish()
+                except ValueError as err:
+                    raise HitachiBlockHttpException(err)
+                finally:
+                    get_logger().debug(LogMessages.API_RESPONSE.format(to_native(parser.log_text())))
+        except (urllib_error.URLError, socket.timeout) as err:
+            raise HitachiBlockHttpException(err)
+        except HTTPException as err:
+            raise HitachiBlockHttpException(err)
 
-            logger = get_logger()
-            logger.debug(LogMessages.API_REQUEST_START.format(
-                         http_verb, urlparse.urlparse(url).path))
+    @staticmethod
+    @contextlib.contextmanager
+    def _open(http_verb, endpoint, params, body=None):
+        ''' Sends the request and yields the response to read the body from.
+            An error status is raised as urllib HTTPError.
+        '''
+        # Build the headers per request, Http.HEADERS_JSON is shared by every call
+        headers = dict(Http.HEADERS_JSON)
+        if params.session_token is not None:
+            headers[Http.AUTHORIZATION] = Http.SESSION + params.session_token
+
+        url = HTTPClient._format_url(params, endpoint)
+
+        logger = get_logger()
+        logger.debug(LogMessages.API_REQUEST_START.format(
+                     http_verb, urlparse.urlparse(url).path))
+
+        data = None
+        if (http_verb == Http.POST or http_verb == Http.PUT) and body is not None:
+            data = json.dumps(body)
 
-            data = None
-            if (http_verb == Http.POST or http_verb == Http.PUT) and params.request_params is not None:
-                data = json.dumps(params.request_params)
+        if CONNECTION_POOL.is_proxied(url):
             response = open_url(
                 url,
                 headers=headers,
-                url_username=params.user if (params.session_id is None) else None,
-                url_password=params.password if (params.session_id is None) else None,
+                url_username=params.user if (params.session_token is None) else None,
+                url_password=params.password if (params.session_token is None) else None,
                 method=http_verb,
-                force_basic_auth=True if (params.session_id is None) else False,
+                force_basic_auth=True if (params.session_token is None) else False,
                 validate_certs=HTTPClient._is_validate_certs(params),
                 timeout=Http.OPEN_URL_TIMEOUT,
                 http_agent=Http.USER_AGENT,
                 data=data
             )
-            return HTTPClient._load_response(response)
-        except (urllib_error.URLError, socket.timeout) as err:
-            raise HitachiBlockHttpException(err)
-        except HTTPException as err:
-            raise HitachiBlockHttpException(err)
+            try:
+                yield response
+            finally:
+                response.close()
+            return
+
+        if params.session_token is None:
+            headers[Http.AUTHORIZATION] = basic_auth_header(params.user, params.password)
+        headers['User-Agent'] = Http.USER_AGENT
+        with CONNECTION_POOL.request(
+            http_verb,
+            url,
+            data=data,
+            headers=headers,
+            validate_certs=HTTPClient._is_validate_certs(params),
+            timeout=Http.OPEN_URL_TIMEOUT
+        ) as response:
+            if response.status >= 400:
+                raise urllib_error.HTTPError(url, response.status, response.reason, response.msg, io.BytesIO(response.read()))
+            yield response
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1467,6 +1820,20 @@ class HTTPClient(object):
     def _is_validate_certs(params):
         return False
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _load_response_stream(response, stream_key):
+        ''' Same as _load_response for list responses, without reading the whole body first.
+            The `stream_key` array is decoded item by item and only the start of the body is logged.
+        '''
+        parser = JsonStreamParser(response)
+        try:
+            return parser.load(stream_key)
+        except ValueError as err:
+            raise HitachiBlockHttpException(err)
+        finally:
+            get_logger().debug(LogMessages.API_RESPONSE.format(to_native(parser.log_text())))
+
     @staticmethod
     @get_with_log('HTTPClient')
     def _load_response(response):
@@ -1495,6 +1862,9 @@ class Executors(object):
             self.params = Params(params)
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def create_ldev(self):
         if self.params.check_mode:
             result = {
@@ -1513,6 +1883,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def expand_ldev(self):
         if self.params.check_mode:
             result = {
@@ -1529,6 +1902,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def change_nickname(self):
         if self.params.check_mode:
             result = {
@@ -1545,6 +1921,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def add_chap_user(self):
         logger = get_logger()
         if self.params.check_mode:
@@ -1575,6 +1954,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def add_host(self):
         if self.params.check_mode:
             result = {
@@ -1591,6 +1973,9 @@ class Executors(object):
 
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def delete_host(self):
         if self.params.check_mode:
             result = {
@@ -1613,6 +1998,9 @@ class Executors(object):
         return result
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def create_hg(self):
         logger = get_logger()
         if self.params.check_mode:
@@ -1649,6 +2037,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def add_lun(self):
         if self.params.check_mode:
             result = {
@@ -1667,6 +2058,128 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    def add_luns(self):
+        ''' Maps the LDEV to every port_settings target, up to max_workers targets at a time '''
+        targets = []
+        for setting in self.params.port_settings or []:
+            for key in (ModuleArgs.PORT_ID, ModuleArgs.HOST_GROUP_NUMBER):
+                if setting.get(key) is None:
+                    raise HitachiBlockModuleException(
+                        ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.PORT_SETTINGS + '.' + key))
+            target = (setting[ModuleArgs.PORT_ID], setting[ModuleArgs.HOST_GROUP_NUMBER])
+            if target not in [(t[ModuleArgs.PORT_ID], t[ModuleArgs.HOST_GROUP_NUMBER]) for t in targets]:
+                targets.append(setting)
+        if not targets:
+            raise HitachiBlockModuleException(ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.PORT_SETTINGS))
+
+        outcomes = map_concurrently(
+            lambda setting: self._do_add_lun_to_target(self.params, setting),
+            targets, self.params.max_workers)
+        outputs = []
+        failed = 0
+        for setting, (result, error) in zip(targets, outcomes):
+            result = result or {
+                ModuleArgs.PORT_ID: setting[ModuleArgs.PORT_ID],
+                ModuleArgs.HOST_GROUP_NUMBER: setting[ModuleArgs.HOST_GROUP_NUMBER],
+                Api.CHANGED: False,
+            }
+            if error is not None:
+                failed += 1
+                if isinstance(error, HitachiBlockException):
+                    result.update(error.error_response())
+                else:
+                    result[Api.MSG] = str(error)
+            outputs.append(result)
+        if failed:
+            err = HitachiBlockModuleException('Failed to map the LDEV to {} of {} targets.'.format(failed, len(targets)))
+            err.error[Api.OUTPUTS] = outputs
+            raise err
+        return {
+            Api.CHANGED: any(result[Api.CHANGED] for result in outputs),
+            Api.OUTPUTS: outputs,
+        }
+
+    @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    def provision_iscsi_targets(self):
+        ''' Creates the port_settings iSCSI targets with their iSCSI name, nickname and the
+            chap_settings CHAP users, adding only what is missing, up to max_workers targets at a time '''
+        targets = []
+        for setting in self.params.port_settings or []:
+            self._validate_setting(ModuleArgs.PORT_SETTINGS, setting, (ModuleArgs.PORT_ID, ModuleArgs.HOST_GROUP_NUMBER))
+            if self._setting_target(setting) not in [self._setting_target(t) for t in targets]:
+                targets.append(setting)
+        if not targets:
+            raise HitachiBlockModuleException(ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.PORT_SETTINGS))
+        chap_settings = dict()
+        for setting in self.params.chap_settings or []:
+            self._validate_setting(ModuleArgs.CHAP_SETTINGS, setting,
+                                   (ModuleArgs.PORT_ID, ModuleArgs.HOST_GROUP_NUMBER,
+                                    ModuleArgs.CHAP_USER_NAME, ModuleArgs.WAY_OF_CHAP_USER))
+            chap_settings.setdefault(self._setting_target(setting), []).append(setting)
+        for target in chap_settings:
+            if target not in [self._setting_target(t) for t in targets]:
+                targets.append({ModuleArgs.PORT_ID: target[0], ModuleArgs.HOST_GROUP_NUMBER: target[1]})
+
+        # Read the current state once per port
+        port_ids = list(dict.fromkeys(setting[ModuleArgs.PORT_ID] for setting in targets))
+        outcomes = map_concurrently(
+            lambda port_id: self._do_get_port_state(self.params, port_id), port_ids, self.params.max_workers)
+        for result, error in outcomes:
+            if error is not None:
+                raise error
+        port_states = dict((port_id, result) for port_id, (result, error) in zip(port_ids, outcomes))
+
+        outcomes = map_concurrently(
+            lambda setting: self._do_provision_iscsi_target(
+                self.params, setting, chap_settings.get(self._setting_target(setting), []),
+                port_states[setting[ModuleArgs.PORT_ID]]),
+            targets, self.params.max_workers)
+        outputs = []
+        failed = 0
+        for setting, (result, error) in zip(targets, outcomes):
+            if error is not None:
+                failed += 1
+                changes = getattr(error, 'changes', [])
+                result = {
+                    ModuleArgs.PORT_ID: setting[ModuleArgs.PORT_ID],
+                    ModuleArgs.HOST_GROUP_NUMBER: setting[ModuleArgs.HOST_GROUP_NUMBER],
+                    Api.CHANGED: len(changes) > 0,
+                    'changes': changes,
+                }
+                if isinstance(error, HitachiBlockException):
+                    result.update(error.error_response())
+                else:
+                    result[Api.MSG] = str(error)
+            outputs.append(result)
+        if failed:
+            err = HitachiBlockModuleException('Failed to provision {} of {} iSCSI targets.'.format(failed, len(targets)))
+            err.error[Api.OUTPUTS] = outputs
+            raise err
+        return {
+            Api.CHANGED: any(result[Api.CHANGED] for result in outputs),
+            Api.OUTPUTS: outputs,
+        }
+
+    @staticmethod
+    def _setting_target(setting):
+        return (setting[ModuleArgs.PORT_ID], setting[ModuleArgs.HOST_GROUP_NUMBER])
+
+    @staticmethod
+    def _validate_setting(parameter, setting, keys):
+        for key in keys:
+            if setting.get(key) is None:
+                raise HitachiBlockModuleException(
+                    ErrorMessages.REQUIRED_VALUE_ERR.format(parameter + '.' + key))
+
+    @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def create_si(self):
         if self.params.check_mode:
             result = {
@@ -1683,6 +2196,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def create_ti(self):
         if self.params.check_mode:
             result = {
@@ -1699,6 +2215,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def create_ti_with_generations(self):
         if self.params.check_mode:
             result = {
@@ -1717,6 +2236,31 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    def create_ti_bulk(self):
+        ''' Creates a Thin Image pair of every pvol_ldev_ids P-VOL in the snapshot group.
+            Every pair is requested before any job is waited for, so they are created
+            as close in time as max_workers allows. '''
+        pvol_ldev_ids = list(dict.fromkeys(self.params.pvol_ldev_ids or []))
+        if not pvol_ldev_ids:
+            raise HitachiBlockModuleException(ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.PVOL_LDEV_IDS))
+        for pvol_ldev_id in pvol_ldev_ids:
+            Params.validate_non_bool(ModuleArgs.PVOL_LDEV_IDS, pvol_ldev_id)
+            Params.validate_size_value(ModuleArgs.PVOL_LDEV_IDS, pvol_ldev_id)
+        if self.params.check_mode:
+            return {
+                Api.CHANGED: True,
+                Api.OUTPUTS: [{ModuleArgs.PVOL_LDEV_ID: pvol_ldev_id, Api.CHANGED: True}
+                              for pvol_ldev_id in pvol_ldev_ids],
+            }
+        return self._do_create_ti_bulk(self.params, pvol_ldev_ids)
+
+    @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def split_si(self):
         if self.params.check_mode:
             result = {
@@ -1733,6 +2277,10 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def split_ti(self):
         if self.params.check_mode:
             result = {
@@ -1749,6 +2297,10 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def resync_si(self):
         if self.params.check_mode:
             result = {
@@ -1765,6 +2317,10 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def resync_ti(self):
         if self.params.check_mode:
             result = {
@@ -1781,6 +2337,10 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def restore_ti(self):
         if self.params.check_mode:
             result = {
@@ -1797,6 +2357,10 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def resync_ti_oldest(self):
         if self.params.check_mode:
             result = {
@@ -1813,6 +2377,53 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
+    def snapshot_group_action(self):
+        ''' Splits, resyncs or restores every snapshot of the snapshot group with one request '''
+        if self.params.action is None:
+            raise HitachiBlockModuleException(ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.ACTION))
+        if self.params.check_mode:
+            result = {
+                Api.CHANGED: False
+            }
+            return result
+        outputs = self._do_snapshot_group_action(self.params, '')
+
+        response = {
+            Api.CHANGED: True,
+            Api.OUTPUTS: outputs,
+        }
+        return response
+
+    @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
+    def copy_group_action(self):
+        ''' Splits, resyncs or restores every pair of the local clone copy group with one request '''
+        if self.params.action is None:
+            raise HitachiBlockModuleException(ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.ACTION))
+        if self.params.check_mode:
+            result = {
+                Api.CHANGED: False
+            }
+            return result
+        outputs = self._do_copy_group_action(self.params, '')
+
+        response = {
+            Api.CHANGED: True,
+            Api.OUTPUTS: outputs,
+        }
+        return response
+
+    @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def createExtVol(self):
         if self.params.check_mode:
             result = {
@@ -1823,6 +2434,9 @@ class Executors(object):
         return self._do_map_external_volume(self.params, self.params.storage_device_id)
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def delete_volume(self):
         if self.params.check_mode:
             result = {
@@ -1838,6 +2452,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def delete_tenant(self):
         if self.params.check_mode:
             result = {
@@ -1888,6 +2505,116 @@ class Executors(object):
     def _do_add_lun(self, params):
         return HTTPClient.post_luns(params)
 
+    @get_with_log('Executors')
+    def _do_add_lun_to_target(self, params, setting):
+        ''' Adds the iSCSI name and the LUN of the LDEV to one target unless they are already there.
+            Reads host-iscsis and luns of the target once each. '''
+        worker_params = copy.copy(params)
+        worker_params.port_id = setting[ModuleArgs.PORT_ID]
+        worker_params.host_group_number = setting[ModuleArgs.HOST_GROUP_NUMBER]
+        worker_params.iscsi_name = setting.get(ModuleArgs.ISCSI_NAME)
+        result = {
+            ModuleArgs.PORT_ID: worker_params.port_id,
+            ModuleArgs.HOST_GROUP_NUMBER: worker_params.host_group_number,
+            Api.CHANGED: False,
+        }
+        check_mode = worker_params.check_mode
+        if worker_params.iscsi_name is not None:
+            iscsiNamesInfo = HTTPClient.get_host_iscsis(worker_params, worker_params.port_id, worker_params.host_group_number)
+            if not any(iscsi[Api.ISCSINAME] == worker_params.iscsi_name for iscsi in iscsiNamesInfo['data']):
+                if not check_mode:
+                    HTTPClient.post_host_iscsis(worker_params)
+                result[Api.CHANGED] = True
+        lunsInfo = HTTPClient.get_luns(worker_params, '', worker_params.port_id, worker_params.host_group_number)
+        lun = next((lun for lun in lunsInfo['data'] if lun[Api.LDEVID] == worker_params.ldev_id), None)
+        if lun is None:
+            result[Api.CHANGED] = True
+            if check_mode:
+                return result
+            lun = self._do_get_by_uri(worker_params, HTTPClient.post_luns(worker_params))
+        if params.return_detail == ReturnDetailConstants.FIELDS:
+            lun = project_outputs(lun, params.return_fields)
+        elif params.return_detail == ReturnDetailConstants.ID and Api.ID not in lun:
+            lun = {Api.ID: lun.get(Api.LUNID)}
+        result[Api.OUTPUTS] = lun
+        return result
+
+    @get_with_log('Executors')
+    def _do_get_port_state(self, params, port_id):
+        ''' Returns the defined host groups, iSCSI names and CHAP users of a port by host group number '''
+        host_groups = dict()
+        for host_group in HTTPClient.get_host_groups_by_port(params, port_id)['data']:
+            if host_group[Api.HOSTGROUPNAME] != '-':
+                host_groups[host_group[Api.HOSTGROUPNUMBER]] = host_group
+        iscsi_names = dict()
+        for iscsi in HTTPClient.get_host_iscsis_by_port(params, port_id)['data']:
+            iscsi_names.setdefault(iscsi[Api.HOSTGROUPNUMBER], dict())[iscsi[Api.ISCSINAME]] = iscsi
+        chap_users = dict()
+        for chap_user in HTTPClient.get_chap_users_by_port(params, port_id)['data']:
+            chap_users.setdefault(chap_user[Api.HOSTGROUPNUMBER], set()).add(
+                (chap_user[Api.WAYOFCHAPUSER], chap_user[Api.CHAPUSERNAME]))
+        return {
+            'host_groups': host_groups,
+            'iscsi_names': iscsi_names,
+            'chap_users': chap_users,
+        }
+
+    @get_with_log('Executors')
+    def _do_provision_iscsi_target(self, params, setting, chap_settings, port_state):
+        ''' Applies the missing pieces of one iSCSI target in order: host group, iSCSI name,
+            nickname, CHAP users. The error raised on failure lists the changes already made. '''
+        worker_params = copy.copy(params)
+        worker_params.port_id = setting[ModuleArgs.PORT_ID]
+        worker_params.host_group_number = setting[ModuleArgs.HOST_GROUP_NUMBER]
+        host_group_number = worker_params.host_group_number
+        changes = []
+        try:
+            if host_group_number not in port_state['host_groups']:
+                if setting.get(ModuleArgs.HOST_GROUP_NAME) is None:
+                    raise HitachiBlockModuleException(
+                        ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.PORT_SETTINGS + '.' + ModuleArgs.HOST_GROUP_NAME))
+                worker_params.host_group_name = setting[ModuleArgs.HOST_GROUP_NAME]
+                worker_params.host_mode = setting.get(ModuleArgs.HOST_MODE)
+                if not worker_params.check_mode:
+                    HTTPClient.post_host_groups(worker_params, '')
+                changes.append('host_group')
+            iscsi_names = port_state['iscsi_names'].get(host_group_number, dict())
+            iscsi_name = setting.get(ModuleArgs.ISCSI_NAME)
+            if iscsi_name is not None:
+                worker_params.iscsi_name = iscsi_name
+                if iscsi_name not in iscsi_names:
+                    if not worker_params.check_mode:
+                        HTTPClient.post_host_iscsis(worker_params)
+                    changes.append('iscsi_name')
+                nick_name = setting.get(ModuleArgs.ISCSI_NICK_NAME)
+                if nick_name is not None and iscsi_names.get(iscsi_name, dict()).get(Api.ISCSINICKNAME) != nick_name:
+                    worker_params.nick_name = nick_name
+                    if not worker_params.check_mode:
+                        HTTPClient.put_host_iscsis(worker_params)
+                    changes.append('iscsi_nick_name')
+            chap_users = port_state['chap_users'].get(host_group_number, set())
+            for chap_setting in chap_settings:
+                chap_user = (chap_setting[ModuleArgs.WAY_OF_CHAP_USER], chap_setting[ModuleArgs.CHAP_USER_NAME])
+                if chap_user in chap_users:
+                    continue
+                worker_params.way_of_chap_user, worker_params.chap_user_name = chap_user
+                worker_params.chap_password = chap_setting.get(ModuleArgs.CHAP_PASSWORD)
+                if not worker_params.check_mode:
+                    HTTPClient.post_chap_users(worker_params, '')
+                    # Creating a CHAP user does not take its secret
+                    if worker_params.chap_password:
+                        HTTPClient.post_chap_users_single(worker_params)
+                changes.append('chap_user:' + chap_user[1])
+        except Exception as err:
+            err.changes = changes
+            raise
+        return {
+            ModuleArgs.PORT_ID: worker_params.port_id,
+            ModuleArgs.HOST_GROUP_NUMBER: host_group_number,
+            Api.CHANGED: len(changes) > 0,
+            'changes': changes,
+        }
+
     @get_with_log('Executors')
     def _do_add_iscsiname(self, params):
         affected_resource_uri = HTTPClient.post_host_iscsis(params)
@@ -1896,52 +2623,203 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_create_si(self, params, storage_device_id):
-        return HTTPClient.post_local_clone_copypairs(params, storage_device_id)
+        response = HTTPClient.post_local_clone_copypairs(params, storage_device_id)
+        HTTPClient.invalidate_name(params, NameCacheConstants.COPY_GROUP, params.copy_group_name)
+        HTTPClient.invalidate_name(params, NameCacheConstants.COPY_PAIR, params.copy_group_name + ',' +
+                                   HTTPClient.local_clone_copypair_name(params.pvol_ldev_id, params.svol_ldev_id))
+        return response
 
     @get_with_log('Executors')
     def _do_create_ti(self, params):
-        return HTTPClient.post_snapshots(params)
+        response = HTTPClient.post_snapshots(params)
+        HTTPClient.invalidate_name(params, NameCacheConstants.SNAPSHOT_GROUP, params.snapshot_group_name)
+        return response
 
     @get_with_log('Executors')
     def _do_create_ti_with_generations(self, params):
-        outputs = []
+        ''' Creates the generations with up to `params.max_workers` requests in flight.
+            Stops submitting after the first failure and attaches the generations
+            created so far to the raised error. The generations are returned in the
+            order the storage system created them, by MU number. '''
         params.auto_split = True
-        for index in range(params.generations):
-            affected_resource_uri = HTTPClient.post_snapshots(params)
-            outputs.append(self._do_get_by_uri(self.params, affected_resource_uri))
+
+        def create_generation(index):
+            worker_params = copy.copy(params)
+            affected_resource_uri = HTTPClient.post_snapshots(worker_params)
+            return self._do_get_by_uri(worker_params, affected_resource_uri)
+
+        outcomes = map_concurrently(create_generation, range(params.generations),
+                                    params.max_workers, stop_on_error=True)
+        HTTPClient.invalidate_name(params, NameCacheConstants.SNAPSHOT_GROUP, params.snapshot_group_name)
+        # Concurrent requests complete, and get their MU numbers, in any order
+        outputs = sorted((result for result, error in outcomes if error is None), key=self._mu_number)
+        errors = [error for result, error in outcomes
+                  if error is not None and not isinstance(error, concurrent.futures.CancelledError)]
+        if errors:
+            err = errors[0]
+            if not isinstance(err, HitachiBlockException):
+                err = HitachiBlockModuleException(str(err))
+            err.error[Api.OUTPUTS] = outputs
+            raise err
         return outputs
 
+    @staticmethod
+    def _mu_number(snapshot):
+        ''' Returns the MU number of a snapshot, read back or only its "pvolLdevId,muNumber" ID '''
+        if snapshot.get(Api.MUNUMBER) is not None:
+            return snapshot[Api.MUNUMBER]
+        mu_number = str(snapshot.get(Api.ID, '')).rpartition(',')[2]
+        return int(mu_number) if mu_number.isdigit() else -1
+
+    @get_with_log('Executors')
+    def _do_create_ti_bulk(self, params, pvol_ldev_ids):
+        # Request every pair first, then wait for all of the jobs together
+        submitted_at = dict()
+        # A pair split by its own job is split when that job runs. In a new consistency group
+        # the pairs are created unsplit and the group is split once, at one point in time.
+        # Splitting a group that holds earlier pairs would split those too, or fail on them
+        split_group = bool(params.is_consistency_group) and bool(params.auto_split) and \
+            self._is_new_snapshot_group(params)
+
+        def submit(pvol_ldev_id):
+            worker_params = copy.copy(params)
+            worker_params.pvol_ldev_id = pvol_ldev_id
+            if split_group:
+                worker_params.auto_split = False
+            job = HTTPClient.submit_snapshots(worker_params)
+            submitted_at[pvol_ldev_id] = time.time()
+            return job
+
+        submissions = map_concurrently(submit, pvol_ldev_ids, params.max_workers)
+        submitted = [(pvol_ldev_id, job) for pvol_ldev_id, (job, error) in zip(pvol_ldev_ids, submissions)
+                     if error is None]
+        completed = HTTPClient._poll_jobs(params, [job for pvol_ldev_id, job in submitted], params.max_workers)
+        HTTPClient.invalidate_name(params, NameCacheConstants.SNAPSHOT_GROUP, params.snapshot_group_name)
+
+        errors = dict((pvol_ldev_id, error) for pvol_ldev_id, (job, error) in zip(pvol_ldev_ids, submissions)
+                      if error is not None)
+        uris = dict()
+        for (pvol_ldev_id, job), job_response in zip(submitted, completed):
+            if job_response is None:
+                errors[pvol_ldev_id] = HitachiBlockModuleException(ErrorMessages.JOB_TIMEOUT_ERR.format(job[Api.JOBID]))
+            elif isinstance(job_response, Exception):
+                errors[pvol_ldev_id] = job_response
+            elif job_response[Api.STATE] != 'Succeeded':
+                errors[pvol_ldev_id] = HitachiBlockModuleException(HTTPClient._job_error_message(job_response))
+            else:
+                uris[pvol_ldev_id] = job_response[Api.AFFECTEDRESOURCES][0]
+
+        split_error = None
+        if split_group and uris:
+            try:
+                self._do_split_snapshot_group(params)
+            except HitachiBlockException as err:
+                # The pairs exist but are not split
+                split_error = err
+
+        created = [pvol_ldev_id for pvol_ldev_id in pvol_ldev_ids if pvol_ldev_id in uris]
+        readbacks = map_concurrently(lambda pvol_ldev_id: self._do_get_by_uri(params, uris[pvol_ldev_id]),
+                                     created, params.max_workers)
+        snapshots = dict()
+        for pvol_ldev_id, (snapshot, error) in zip(created, readbacks):
+            if error is not None:
+                snapshot = {Api.ID: resource_id_from_uri(uris[pvol_ldev_id])}
+            snapshots[pvol_ldev_id] = snapshot
+
+        outputs = []
+        for pvol_ldev_id in pvol_ldev_ids:
+            result = {
+                ModuleArgs.PVOL_LDEV_ID: pvol_ldev_id,
+                Api.CHANGED: pvol_ldev_id in snapshots,
+            }
+            if pvol_ldev_id in snapshots:
+                snapshot = snapshots[pvol_ldev_id]
+                if params.return_detail == ReturnDetailConstants.FIELDS:
+                    snapshot = project_outputs(snapshot, params.return_fields)
+                result[Api.OUTPUTS] = snapshot
+            error = errors.get(pvol_ldev_id)
+            if error is None and pvol_ldev_id in snapshots:
+                error = split_error
+            if error is not None:
+                if isinstance(error, HitachiBlockException):
+                    result.update(error.error_response())
+                else:
+                    result[Api.MSG] = str(error)
+            outputs.append(result)
+
+        response = {
+            Api.CHANGED: bool(snapshots),
+            Api.OUTPUTS: outputs,
+            Api.SUBMIT_SKEW_SECONDS: self._skew(submitted_at.values()),
+            Api.SPLIT_SKEW_SECONDS: self._skew(
+                self._parse_split_time(snapshot.get(Api.SPLITTIME)) for snapshot in snapshots.values()),
+        }
+        if errors:
+            err = HitachiBlockModuleException('Failed to create the Thin Image pairs of {} of {} P-VOLs.'.format(
+                len(errors), len(pvol_ldev_ids)))
+        elif split_error is not None:
+            err = HitachiBlockModuleException('Created the Thin Image pairs of {} P-VOLs, but failed to split the snapshot group.'.format(
+                len(snapshots)))
+        else:
+            return response
+        err.error.update(response)
+        raise err
+
+    @get_with_log('Executors')
+    def _is_new_snapshot_group(self, params):
+        ''' Returns True if params.snapshot_group_name does not exist yet or holds no pairs '''
+        group_params = copy.copy(params)
+        group_params.snapshot_group_id = HTTPClient.get_snapshot_group_id_by_name(group_params, '')
+        if group_params.snapshot_group_id is None:
+            return True
+        if HTTPClient.get_snapshot_groups_one(group_params, '').get('snapshots'):
+            get_logger().info('The snapshot group %s already holds pairs, each new pair is split by its own job',
+                              params.snapshot_group_name)
+            return False
+        return True
+
+    @get_with_log('Executors')
+    def _do_split_snapshot_group(self, params):
+        ''' Splits every pair of params.snapshot_group_name with one request '''
+        group_params = copy.copy(params)
+        group_params.action = 'split'
+        group_params.snapshot_group_id = HTTPClient.get_snapshot_group_id_by_name(group_params, '')
+        if group_params.snapshot_group_id is None:
+            raise HitachiBlockModuleException('The Snapshot Group is not found specified by snapshot_group_name.')
+        HTTPClient.post_snapshot_groups_action(group_params, '')
+
+    @staticmethod
+    def _parse_split_time(value):
+        ''' Returns the splitTime of a snapshot as seconds since the epoch, None if it is not split '''
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S').timestamp()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _skew(times):
+        ''' Returns the seconds between the first and the last of `times`, None without two of them '''
+        times = [value for value in times if value is not None]
+        if len(times) < 2:
+            return None
+        return round(max(times) - min(times), 3)
+
     @get_with_log('Executors')
     def _do_split_si(self, params, storage_device_id):
-        ''' Get all local-clone-copygroups '''
-        copygroups = HTTPClient.get_local_clone_copygroups(params, storage_device_id)['data']
         logger = get_logger()
-        logger.debug('copygroups: %s', copygroups)
         logger.debug('params.copy_group_name: %s', params.copy_group_name)
-        ''' Select local-clone-copygroup by name '''
-        for cg in copygroups:
-            if cg['copyGroupName'] is not None and cg['copyGroupName'] == params.copy_group_name:
-                params.local_clone_copygroup_id = cg['localCloneCopygroupId']
-                break
-
-        if params.local_clone_copygroup_id is None:
-            raise HitachiBlockModuleException('The Copy Group is not found specified by copy_group_name.')
-        ''' Get local-clone-copypair by local_clone_copygroup_id '''
-        copypairs = HTTPClient.get_local_clone_copygroups_one(params, storage_device_id)['copyPairs']
-        ''' Select local-clone-copypair by name '''
-        for cp in copypairs:
-            if cp['copyPairName'] is not None and cp['copyPairName'] == params.copy_pair_name:
-                params.local_clone_copypair_id = cp['localCloneCopypairId']
-                break
-
+        ''' Select local-clone-copypair by copy_group_name and copy_pair_name '''
+        params.local_clone_copypair_id = HTTPClient.get_local_clone_copypair_id_by_name(params, storage_device_id)
         if params.local_clone_copypair_id is None:
-            raise HitachiBlockModuleException('The Copy Pair is not found specified by copy_pair_name.')
+            raise HitachiBlockModuleException(
+                'The Copy Pair is not found specified by copy_pair_name or pvol_ldev_id and svol_ldev_id.')
 
         return HTTPClient.post_local_clone_copypairs_split(params, storage_device_id)
 
-    @get_with_log('Executors')
-    def _do_split_ti(self, params, storage_device_id):
-
+    @staticmethod
+    def _validate_mu_number(params):
         if params.mu_number is not None:
             value = params.mu_number
             Params.validate_non_bool(ModuleArgs.MU_NUMBER, value)
@@ -1951,24 +2829,14 @@ class Executors(object):
                 raise HitachiBlockModuleException(
                     ErrorMessages.INVALID_RANGE_VALUE.format(
                         ModuleArgs.MU_NUMBER, value, min, max))
-        
-        ''' Get all snapshot-groups '''
-        snapshotgroups = HTTPClient.get_snapshot_groups(params, storage_device_id)['data']
-        ''' Find snapshot-group by name '''
-        for sg in snapshotgroups:
-            if sg['snapshotGroupName'] is not None and sg['snapshotGroupName'] == params.snapshot_group_name:
-                params.snapshot_group_id = sg['snapshotGroupId']
-                break
-        if params.snapshot_group_id is None:
-            raise HitachiBlockModuleException('The Snapshot Group is not found specified by snapshot_group_name.')
-        ''' Find snapshots by pvol_ldev_id '''
-        snapshots = HTTPClient.get_snapshot_groups_one(params, storage_device_id)['snapshots']
 
-        for ss in snapshots:
-            if ss['pvolLdevId'] is not None and ss['pvolLdevId'] == params.pvol_ldev_id:
-                if params.mu_number is None or params.mu_number is not None and ss['muNumber'] == params.mu_number:
-                    params.snapshot_id = ss['snapshotId']
-                    break
+    @get_with_log('Executors')
+    def _do_split_ti(self, params, storage_device_id):
+
+        Executors._validate_mu_number(params)
+
+        ''' Find snapshot by snapshot_group_name, pvol_ldev_id and mu_number '''
+        params.snapshot_id = HTTPClient.get_snapshot_id(params, storage_device_id)
         if params.snapshot_id is None:
             raise HitachiBlockModuleException('The Snapshot is not found specified by pvol_ldev_id.')
 
@@ -1979,59 +2847,22 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_resync_si(self, params, storage_device_id):
-        ''' Get all local-clone-copygroups '''
-        copygroups = HTTPClient.get_local_clone_copygroups(params, storage_device_id)['data']
-        ''' Select local-clone-copygroup by name '''
-
-        for cg in copygroups:
-            if cg['copyGroupName'] is not None and cg['copyGroupName'] == params.copy_group_name:
-                params.local_clone_copygroup_id = cg['localCloneCopygroupId']
-                break
-
-        if params.local_clone_copygroup_id is None:
-            raise HitachiBlockModuleException('The Copy Group is not found specified by copy_group_name.')
-        ''' Get local-clone-copypair by local_clone_copygroup_id '''
-        copypairs = HTTPClient.get_local_clone_copygroups_one(params, storage_device_id)['copyPairs']
-        ''' Select local-clone-copypair by name '''
-        for cp in copypairs:
-            if cp['copyPairName'] is not None and cp['copyPairName'] == params.copy_pair_name:
-                params.local_clone_copypair_id = cp['localCloneCopypairId']
-                break
-
+        ''' Select local-clone-copypair by copy_group_name and copy_pair_name '''
+        params.local_clone_copypair_id = HTTPClient.get_local_clone_copypair_id_by_name(params, storage_device_id)
         if params.local_clone_copypair_id is None:
-            raise HitachiBlockModuleException('The Copy Pair is not found specified by copy_pair_name.')
+            raise HitachiBlockModuleException(
+                'The Copy Pair is not found specified by copy_pair_name or pvol_ldev_id and svol_ldev_id.')
 
         return HTTPClient.post_local_clone_copypairs_resync(params, storage_device_id)
 
     @get_with_log('Executors')
     def _do_resync_ti(self, params, storage_device_id):
 
-        if params.mu_number is not None:
-            value = params.mu_number
-            Params.validate_non_bool(ModuleArgs.MU_NUMBER, value)
-            min=0
-            max=1023
-            if value < min or value > max:
-                raise HitachiBlockModuleException(
-                    ErrorMessages.INVALID_RANGE_VALUE.format(
-                        ModuleArgs.MU_NUMBER, value, min, max))
+        Executors._validate_mu_number(params)
 
-        ''' Get all snapshot-groups '''
-        snapshotgroups = HTTPClient.get_snapshot_groups(params, storage_device_id)['data']
-        ''' Find snapshot-group by name '''
-        for sg in snapshotgroups:
-            if sg['snapshotGroupName'] is not None and sg['snapshotGroupName'] == params.snapshot_group_name:
-                params.snapshot_group_id = sg['snapshotGroupId']
-                break
-        if params.snapshot_group_id is None:
-            raise HitachiBlockModuleException('The Snapshot Group is not found specified by snapshot_group_name.')
-        ''' Find snapshots by pvol_ldev_id '''
-        snapshots = HTTPClient.get_snapshot_groups_one(params, storage_device_id)['snapshots']
-
-        for ss in snapshots:
-            if ss['pvolLdevId'] is not None and ss['pvolLdevId'] == params.pvol_ldev_id and ss['muNumber'] is not None and ss['muNumber'] == params.mu_number:
-                params.snapshot_id = ss['snapshotId']
-                break
+        ''' Find snapshot by snapshot_group_name, pvol_ldev_id and mu_number '''
+        if params.mu_number is not None:
+            params.snapshot_id = HTTPClient.get_snapshot_id(params, storage_device_id)
         if params.snapshot_id is None:
             raise HitachiBlockModuleException('The Snapshot is not found specified by snapshot_group_name and pvol_ldev_id and mu_number.')
 
@@ -2040,32 +2871,11 @@ class Executors(object):
     @get_with_log('Executors')
     def _do_restore_ti(self, params, storage_device_id):
 
-        if params.mu_number is not None:
-            value = params.mu_number
-            Params.validate_non_bool(ModuleArgs.MU_NUMBER, value)
-            min=0
-            max=1023
-            if value < min or value > max:
-                raise HitachiBlockModuleException(
-                    ErrorMessages.INVALID_RANGE_VALUE.format(
-                        ModuleArgs.MU_NUMBER, value, min, max))
-            
-        ''' Get all snapshot-groups '''
-        snapshotgroups = HTTPClient.get_snapshot_groups(params, storage_device_id)['data']
-        ''' Find snapshot-group by name '''
-        for sg in snapshotgroups:
-            if sg['snapshotGroupName'] is not None and sg['snapshotGroupName'] == params.snapshot_group_name:
-                params.snapshot_group_id = sg['snapshotGroupId']
-                break
-        if params.snapshot_group_id is None:
-            raise HitachiBlockModuleException('The Snapshot Group is not found specified by snapshot_group_name.')
-        ''' Find snapshots by pvol_ldev_id '''
-        snapshots = HTTPClient.get_snapshot_groups_one(params, storage_device_id)['snapshots']
+        Executors._validate_mu_number(params)
 
-        for ss in snapshots:
-            if ss['pvolLdevId'] is not None and ss['pvolLdevId'] == params.pvol_ldev_id and ss['muNumber'] is not None and ss['muNumber'] == params.mu_number:
-                params.snapshot_id = ss['snapshotId']
-                break
+        ''' Find snapshot by snapshot_group_name, pvol_ldev_id and mu_number '''
+        if params.mu_number is not None:
+            params.snapshot_id = HTTPClient.get_snapshot_id(params, storage_device_id)
         if params.snapshot_id is None:
             raise HitachiBlockModuleException('The Snapshot is not found specified by snapshot_group_name and pvol_ldev_id and mu_number.')
 
@@ -2073,17 +2883,8 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_resync_ti_oldest(self, params, storage_device_id):
-        ''' Get all snapshot-groups '''
-        snapshotgroups = HTTPClient.get_snapshot_groups(params, storage_device_id)['data']
-        ''' Find snapshot-group by name '''
-        for sg in snapshotgroups:
-            if sg['snapshotGroupName'] is not None and sg['snapshotGroupName'] == params.snapshot_group_name:
-                params.snapshot_group_id = sg['snapshotGroupId']
-                break
-        if params.snapshot_group_id is None:
-            raise HitachiBlockModuleException('The Snapshot Group is not found specified by snapshot_group_name.')
-        ''' Find snapshots by pvol_ldev_id '''
-        snapshots = HTTPClient.get_snapshot_groups_one(params, storage_device_id)['snapshots']
+        ''' Find snapshots by snapshot_group_name and pvol_ldev_id '''
+        snapshots = HTTPClient.find_snapshots(params, storage_device_id)
 
         oldest_date = '2099-12-31T23:59:59'
         for ss in snapshots:
@@ -2095,8 +2896,31 @@ class Executors(object):
 
         return HTTPClient.post_snapshots_resync(params, storage_device_id)
 
+    @get_with_log('Executors')
+    def _do_snapshot_group_action(self, params, storage_device_id):
+        params.snapshot_group_id = HTTPClient.get_snapshot_group_id_by_name(params, storage_device_id)
+        if params.snapshot_group_id is None:
+            raise HitachiBlockModuleException('The Snapshot Group is not found specified by snapshot_group_name.')
+        HTTPClient.post_snapshot_groups_action(params, storage_device_id)
+        if params.return_detail == ReturnDetailConstants.ID:
+            return {Api.ID: params.snapshot_group_id}
+        return HTTPClient.get_snapshot_groups_one(params, storage_device_id)
+
+    @get_with_log('Executors')
+    def _do_copy_group_action(self, params, storage_device_id):
+        params.local_clone_copygroup_id = HTTPClient.get_local_clone_copygroup_id_by_name(params, storage_device_id)
+        if params.local_clone_copygroup_id is None:
+            raise HitachiBlockModuleException('The Copy Group is not found specified by copy_group_name.')
+        HTTPClient.post_local_clone_copygroups_action(params, storage_device_id)
+        if params.return_detail == ReturnDetailConstants.ID:
+            return {Api.ID: params.local_clone_copygroup_id}
+        return HTTPClient.get_local_clone_copygroups_one(params, storage_device_id)
+
     @get_with_log('Executors')
     def _do_get_by_uri(self, params, uri):
+        if params.return_detail == ReturnDetailConstants.ID:
+            # The caller only needs the ID, skip reading the resource back
+            return {Api.ID: resource_id_from_uri(uri)}
         endpoint = uri.split('/', 2)[2]
         response = HTTPClient.get_by_uri(params, endpoint)
 
@@ -2128,6 +2952,10 @@ class Executors(object):
     def _get_advisor_params(self, params, storage_device_id):
         ctl1Ip = HTTPClient.get_storages_one(params, storage_device_id)["ctl1Ip"]
         advisor_params = copy.deepcopy(params)
+        # The advisor opens its own session, never reuse the storage session
+        advisor_params.session_id = None
+        advisor_params.session_token = None
+        advisor_params.session = None
         advisor_params.management_address = ctl1Ip
         advisor_params.management_port = params.advisor_port
         return advisor_params
@@ -2191,12 +3019,10 @@ class Executors(object):
                     raise HitachiBlockModuleException('The external path group is in use.')
                 # map external volume
                 statusResource = HTTPClient.post_external_volumes(advisor_params)["statusResource"].replace(Http.BASE_URL, "")
-                commandStatus = HTTPClient.get_by_uri(advisor_params, statusResource)
                 # Wait for the job to complete.
-                while commandStatus["progress"] is not None and commandStatus["progress"] != "completed":
-                    #print(commandStatus["progress"])
-                    time.sleep(10)
-                    commandStatus = HTTPClient.get_by_uri(advisor_params, statusResource)
+                commandStatus = JobWaiter(timeout=None).wait(
+                    lambda: HTTPClient.get_by_uri(advisor_params, statusResource),
+                    lambda status: status["progress"] is None or status["progress"] == "completed")
 
                 if ("normal" != commandStatus["status"]):
                     raise HitachiBlockModuleException(commandStatus["errorMessage"] + json.dumps(commandStatus["errorCode"] if commandStatus["errorCode"] is not None else ""))
@@ -2272,29 +3098,49 @@ class Executors(object):
     def _do_delete_tenant(self, params, storage_device_id):
         # Get ldev's information from views
         viewsInfos = HTTPClient.get_host_iscsi_paths(self.params, storage_device_id)
-        deleted_iscsiTargets = list()
-        deleted_ldevs = list()
-        # Delete iSCSI name from iSCSI target
+        # Group the paths by iSCSI target, an LDEV may be mapped to several of them
+        host_groups = dict()
+        ldev_host_groups = dict()
         for viewsInfo in viewsInfos['data']:
-            params.port_id = viewsInfo['hostGroup']['portId']
-            params.host_group_number = viewsInfo['hostGroup']['hostGroupNumber']
-            HTTPClient.delete_host_iscsis(self.params, storage_device_id)
-            # Get iSCSI target information
-            iscsiNamesInfo = HTTPClient.get_host_iscsis(self.params, viewsInfo['hostGroup']['portId'], viewsInfo['hostGroup']['hostGroupNumber'])
-            # if iSCSI target has no iSCSI name, delete LUN, iSCSI target and LDEV
-            if len(iscsiNamesInfo['data']) <= 0:
-                # Get LUN information
-                lunsInfo = HTTPClient.get_luns(self.params, storage_device_id, viewsInfo['hostGroup']['portId'], viewsInfo['hostGroup']['hostGroupNumber'])
-                for lun in lunsInfo['data']:
-                    # Delete all LUN
-                    HTTPClient.delete_luns(self.params, storage_device_id, lun['portId'], lun['hostGroupNumber'], lun['lun'])
-                # Delete iSCSI target
-                deleted_iscsiTargets.append(viewsInfo['hostGroup']['iscsiName'])
-                HTTPClient.delete_host_groups(self.params, storage_device_id, viewsInfo['hostGroup']['portId'], viewsInfo['hostGroup']['hostGroupNumber'])
-                # Delete LDEV
-                deleted_ldevs.append(viewsInfo['ldev']['ldevId'])
-                params.ldev_id = viewsInfo['ldev']['ldevId']
-                HTTPClient.delete_ldevs(self.params, storage_device_id)
+            key = (viewsInfo['hostGroup']['portId'], viewsInfo['hostGroup']['hostGroupNumber'])
+            host_groups.setdefault(key, viewsInfo['hostGroup'])
+            ldev_host_groups.setdefault(viewsInfo['ldev']['ldevId'], set()).add(key)
+
+        # Delete the iSCSI targets independently of each other
+        keys = list(host_groups)
+        outcomes = map_concurrently(
+            lambda key: self._do_delete_tenant_host_group(params, storage_device_id, key),
+            keys, params.max_workers)
+        deleted_host_groups = set()
+        errors = list()
+        for key, (deleted, error) in zip(keys, outcomes):
+            if error is not None:
+                errors.append(error)
+            elif deleted:
+                deleted_host_groups.add(key)
+        deleted_iscsiTargets = [host_groups[key]['iscsiName'] for key in keys if key in deleted_host_groups]
+
+        # Delete an LDEV once every iSCSI target it was mapped to is gone
+        ldev_ids = [ldev_id for ldev_id, mapped in ldev_host_groups.items() if mapped <= deleted_host_groups]
+        outcomes = map_concurrently(
+            lambda ldev_id: self._do_delete_tenant_ldev(params, storage_device_id, ldev_id),
+            ldev_ids, params.max_workers)
+        deleted_ldevs = list()
+        for ldev_id, (result, error) in zip(ldev_ids, outcomes):
+            if error is not None:
+                errors.append(error)
+            else:
+                deleted_ldevs.append(ldev_id)
+
+        if errors:
+            err = errors[0]
+            if not isinstance(err, HitachiBlockException):
+                err = HitachiBlockModuleException(str(err))
+            err.error[Api.OUTPUTS] = {
+                'ldevs': deleted_ldevs,
+                'iscsi_targets': deleted_iscsiTargets
+            }
+            raise err
         return {
             Api.CHANGED: True,
             Api.OUTPUTS: {
@@ -2303,6 +3149,37 @@ class Executors(object):
             }
         }
 
+    @get_with_log('Executors')
+    def _do_delete_tenant_host_group(self, params, storage_device_id, key):
+        ''' Removes the iSCSI name from the iSCSI target, then deletes its LUNs and the
+            iSCSI target itself once no iSCSI name is left. Returns True if it was deleted. '''
+        port_id, host_group_number = key
+        worker_params = copy.copy(params)
+        worker_params.port_id = port_id
+        worker_params.host_group_number = host_group_number
+        # Delete iSCSI name from iSCSI target
+        HTTPClient.delete_host_iscsis(worker_params, storage_device_id)
+        # Get iSCSI target information
+        iscsiNamesInfo = HTTPClient.get_host_iscsis(worker_params, port_id, host_group_number)
+        if len(iscsiNamesInfo['data']) > 0:
+            return False
+        # Delete all LUN, the iSCSI target can only be deleted after them. They are deleted
+        # one by one, this already runs on one of the max_workers threads of _do_delete_tenant
+        lunsInfo = HTTPClient.get_luns(worker_params, storage_device_id, port_id, host_group_number)
+        for lun in lunsInfo['data']:
+            HTTPClient._wait_job(worker_params, HTTPClient.delete_luns(
+                worker_params, storage_device_id, lun['portId'], lun['hostGroupNumber'], lun['lun']))
+        # Delete iSCSI target
+        HTTPClient._wait_job(worker_params, HTTPClient.delete_host_groups(
+            worker_params, storage_device_id, port_id, host_group_number))
+        return True
+
+    @get_with_log('Executors')
+    def _do_delete_tenant_ldev(self, params, storage_device_id, ldev_id):
+        worker_params = copy.copy(params)
+        worker_params.ldev_id = ldev_id
+        return HTTPClient.delete_ldevs(worker_params, storage_device_id)
+
 class AdvisorSession:
     def __init__(self, advisor_params):
         self.advisor_params = advisor_params
@@ -2310,8 +3187,175 @@ class AdvisorSession:
     @get_with_log('AdvisorSession')
     def __enter__(self):
         self.advisor_params.session_id = HTTPClient.post_sessions(self.advisor_params)["sessionId"]
+        self.advisor_params.session_token = self.advisor_params.session_id
         return self
 
     @get_with_log('AdvisorSession')
     def __exit__(self, exception_type, exception_value, traceback):
         HTTPClient.delete_sessions(self.advisor_params)
+
+
+class BlockSession:
+    ''' Opens one REST API session on the storage system for an Executors operation.
+
+        Requests made inside the block authenticate with the session token
+        instead of sending the user and password with basic auth. Nested
+        blocks reuse the outer session.
+
+        When the session token cache is enabled, the token is taken from and
+        saved to SESSION_TOKEN_CACHE and the session is left open for the
+        next module process. A 401 reply renews the token once.
+    '''
+    def __init__(self, params):
+        self.params = params
+        self.is_owner = False
+        self.is_cached = False
+        self.lock = threading.RLock()
+
+    @get_with_log('BlockSession')
+    def __enter__(self):
+        if self.params.session_token is not None or self.params.check_mode:
+            return self
+        try:
+            self._open()
+        except HitachiBlockHttpException as err:
+            get_logger().warning('Failed to create a session, using basic authentication. %s',
+                                 json.dumps(err.error_response(), ensure_ascii=False))
+            return self
+        self.params.session = self
+        self.is_owner = True
+        return self
+
+    @get_with_log('BlockSession')
+    def __exit__(self, exception_type, exception_value, traceback):
+        if not self.is_owner:
+            return
+        try:
+            if not self.is_cached:
+                HTTPClient.delete_objects_sessions(self.params)
+        except HitachiBlockException as err:
+            get_logger().debug('Failed to delete the session: %s',
+                               json.dumps(err.error_response(), ensure_ascii=False))
+        finally:
+            self.params.session_id = None
+            self.params.session_token = None
+            self.params.session = None
+            self.is_owner = False
+
+    @get_with_log('BlockSession')
+    def renew(self, params):
+        ''' Replaces the session token `params` was rejected with, returns False if the operation
+            of `params` already renewed it. Workers sharing the session get the token renewed by
+            another worker.
+        '''
+        with self.lock:
+            if params.session_token == self.params.session_token:
+                if params.session_renewed:
+                    return False
+                params.session_renewed = True
+                if not self._renew():
+                    return False
+            params.session_id = self.params.session_id
+            params.session_token = self.params.session_token
+            return True
+
+    def _renew(self):
+        get_logger().debug('The session %s was rejected, creating a new one', self.params.session_id)
+        if self.is_cached:
+            SESSION_TOKEN_CACHE.invalidate(self._cache_key())
+        self.params.session_id = None
+        self.params.session_token = None
+        try:
+            self._open()
+        except HitachiBlockHttpException as err:
+            get_logger().warning('Failed to renew the session. %s',
+                                 json.dumps(err.error_response(), ensure_ascii=False))
+            return False
+        return True
+
+    def _open(self):
+        if SESSION_TOKEN_CACHE.is_enabled():
+            token, session_id = SESSION_TOKEN_CACHE.get_or_create(self._cache_key(), self._create)
+            self.is_cached = True
+        else:
+            token, session_id = self._create()
+        self.params.session_id = session_id
+        self.params.session_token = token
+
+    def _create(self):
+        response = HTTPClient.post_objects_sessions(self.params)
+        return response[Api.TOKEN], response[Api.SESSIONID]
+
+    def _cache_key(self):
+        return ('block', self.params.management_address, self.params.management_port,
+                self.params.user, self.params.password)
+
+
+class BlockClient(object):
+    ''' Client object for Python programs that run many operations in one process.
+
+        Holds the base URL and credentials of one VSP storage system, and, while it is
+        open, one REST API session shared by every operation. Requests go through
+        the process-wide CONNECTION_POOL and names are resolved through NAME_ID_CACHE,
+        so connections and looked up IDs are reused from one operation to the next.
+
+        Every public Executors operation is a method taking the module arguments of
+        that operation as keyword arguments, and returns what the module returns.
+        Operations are thread-safe and can be run from a thread pool:
+
+            with BlockClient('storage.example.com', 'admin', 'secret') as client:
+                client.create_ldev(ldev_id=100, pool_id=0, capacity_mb=1024)
+
+        HitachiBlockException is raised where the module would fail.
+    '''
+    connection_pool = CONNECTION_POOL
+    name_cache = NAME_ID_CACHE
+
+    def __init__(self, management_address, user, password, management_port=Api.SERVER_PORT_DEFAULT, **module_args):
+        self.module_args = dict(module_args)
+        self.module_args.update({
+            ModuleArgs.SERVER: management_address,
+            ModuleArgs.SERVER_PORT: management_port,
+            ModuleArgs.USER: user,
+            ModuleArgs.PASSWORD: password,
+        })
+        self.module_args.setdefault(ModuleArgs.CHECK_MODE, False)
+        self.params = Params(self.module_args)
+        self.session = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @get_with_log('BlockClient')
+    def open(self):
+        ''' Opens the session the operations share until close() '''
+        if self.session is None:
+            self.session = BlockSession(self.params).__enter__()
+
+    @get_with_log('BlockClient')
+    def close(self):
+        session, self.session = self.session, None
+        if session is not None:
+            session.__exit__(None, None, None)
+
+    def run(self, operation, **module_args):
+        ''' Runs the Executors `operation`, e.g. 'create_ldev', with `module_args`
+            on top of the arguments the client was created with '''
+        if operation.startswith('_') or not callable(getattr(Executors, operation, None)):
+            raise HitachiBlockModuleException(ErrorMessages.UNKNOWN_OPERATION_ERR.format(operation))
+        executors = Executors(dict(self.module_args, **module_args))
+        if self.session is not None and self.params.session is not None:
+            # The new Params let this operation renew the long lived session once
+            executors.params.session = self.session
+            executors.params.session_id = self.params.session_id
+            executors.params.session_token = self.params.session_token
+        return getattr(executors, operation)()
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not callable(getattr(Executors, name, None)):
+            raise AttributeError(name)
+        return functools.partial(self.run, name)
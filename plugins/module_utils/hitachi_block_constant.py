@@ -14,6 +14,7 @@ class Api(object):
     CHANGED = 'changed'
     MSG = 'msg'
     OUTPUTS = 'outputs'
+    ID = 'id'
     API_ERROR = 'api_error'
     SINGLE_QUOTE = "'"
     SERVER_DEFAULT = 'localhost'
@@ -45,17 +46,22 @@ class Api(object):
     SNAPSHOTPOOLID = 'snapshotPoolId'
     MUNUMBER = 'muNumber'
     AUTOSPLIT = 'autoSplit'
+    SPLITTIME = 'splitTime'
+    SPLIT_SKEW_SECONDS = 'split_skew_seconds'
+    SUBMIT_SKEW_SECONDS = 'submit_skew_seconds'
     ISCSIIPADDRESS = 'iscsiIpAddress'
     ISCSINAME = 'iscsiName'
     ISCSINICKNAME = 'iscsiNickname'
     TCPPORT = 'tcpPort'
     STARTID = 'startId'
     COUNT = 'count'
+    HEADLDEVID = 'headLdevId'
     EXTERNALPARITYGROUPID = 'externalParityGroupId'
     EXTERNALPATHGROUPID = 'externalPathGroupId'
     EXTERNALPORTIPADDRESS = 'externalPortIpAddress'
     EXTERNALPORTISCSINAME = 'externalPortIscsiName'
     LUN = 'lun'
+    LUNID = 'lunId'
     CHAPUSERNAME = 'chapUserName'
     WAYOFCHAPUSER = 'wayOfChapUser'
     CHAPPASSWORD = 'chapPassword'
@@ -64,6 +70,8 @@ class Api(object):
     DATA_REDUCTION_MODE = 'dataReductionMode'
     DATA_REDUCTION_MODE_DISABLE = 'disabled'
     HOSTMODE = 'hostMode'
+    TOKEN = 'token'
+    SESSIONID = 'sessionId'
 
 
 class Endpoints(object):
@@ -87,14 +95,18 @@ class Endpoints(object):
     GET_LOCAL_CLONE_COPYGROUPS = 'v1/objects/storages/{}/local-clone-copygroups'
     POST_LOCAL_CLONE_COPYPAIRS = 'v1/objects/storages/{}/local-clone-copypairs'
     GET_LOCAL_CLONE_COPYGROUPS_ONE = 'v1/objects/storages/{}/local-clone-copygroups/{}'
+    GET_LOCAL_CLONE_COPYPAIRS_ONE = 'v1/objects/storages/{}/local-clone-copypairs/{}'
     POST_LOCAL_CLONE_COPYPAIRS_SPLIT = 'v1/objects/storages/{}/local-clone-copypairs/{}/actions/split/invoke'
     POST_LOCAL_CLONE_COPYPAIRS_RESYNC = 'v1/objects/storages/{}/local-clone-copypairs/{}/actions/resync/invoke'
     POST_SNAPSHOTS = 'v1/objects/storages/{}/snapshots'
+    GET_SNAPSHOTS = 'v1/objects/storages/{}/snapshots{}'
     GET_SNAPSHOT_GROUPS = 'v1/objects/storages/{}/snapshot-groups'
     GET_SNAPSHOT_GROUPS_ONE = 'v1/objects/storages/{}/snapshot-groups/{}'
     POST_SNAPSHOTS_SPLIT = 'v1/objects/storages/{}/snapshots/{}/actions/split/invoke'
     POST_SNAPSHOTS_RESYNC = 'v1/objects/storages/{}/snapshots/{}/actions/resync/invoke'
     POST_SNAPSHOTS_RESTORE = 'v1/objects/storages/{}/snapshots/{}/actions/restore/invoke'
+    POST_SNAPSHOT_GROUPS_ACTION = 'v1/objects/storages/{}/snapshot-groups/{}/actions/{}/invoke'
+    POST_LOCAL_CLONE_COPYGROUPS_ACTION = 'v1/objects/storages/{}/local-clone-copygroups/{}/actions/{}/invoke'
     GET_JOBS = 'v1/objects/storages/{}/jobs/{}'
     PUT_ISCSI_PORTS_DISCOVER = 'v1/objects/storages/{}/iscsi-ports/{}/actions/discover/invoke'
     PUT_ISCSI_PORTS_REGISTER = 'v1/objects/storages/{}/iscsi-ports/{}/actions/register/invoke'
@@ -110,6 +122,8 @@ class Endpoints(object):
     POST_EXTERNAL_VOLUMES = 'simple/v1/objects/external-volumes'
     POST_SESSIONS = 'simple/v1/objects/sessions'
     DELETE_SESSIONS = 'simple/v1/objects/sessions/{}'
+    POST_OBJECTS_SESSIONS = 'v1/objects/storages/{}/sessions'
+    DELETE_OBJECTS_SESSIONS = 'v1/objects/storages/{}/sessions/{}'
     GET_COMMAND_STATUS = 'simple/v1/objects/command-status/{}'
     DELETE_COMMAND_STATUS = 'simple/v1/objects/command-status/{}'
     GET_HOST_ISCSI_PATHS = 'v1/views/host-iscsi-paths?{}'
@@ -117,12 +131,14 @@ class Endpoints(object):
 
 class PfRestEndpoints(object):
     POST_LDEVS = 'v1/objects/ldevs'
+    GET_LDEVS = 'v1/objects/ldevs'
     GET_LDEVS_ONE = 'v1/objects/ldevs/{}'
     PUT_LDEVS_CHANGE_STATUS = 'v1/objects/ldevs/{}/actions/change-status/invoke'
     PUT_LDEVS_SHRED = 'v1/objects/ldevs/{}/actions/shred/invoke'
     DELETE_LDEVS = 'v1/objects/ldevs/{}'
     POST_HOST_GROUPS = 'v1/objects/host-groups'
     GET_HOST_GROUPS = 'v1/objects/host-groups/{},{}'
+    GET_HOST_GROUPS_BY_PORT = 'v1/objects/host-groups?portId={}'
     DELETE_HOST_GROUPS = 'v1/objects/host-groups/{},{}'
     GET_HOST_ISCSIS = 'v1/objects/host-iscsis{}'
     POST_HOST_ISCSIS = 'v1/objects/host-iscsis'
@@ -130,20 +146,25 @@ class PfRestEndpoints(object):
     POST_CHAP_USERS = 'v1/objects/chap-users'
     PUT_CHAP_USERS_SINGLE = 'v1/objects/chap-users/{},{},{},{}'
     GET_CHAP_USER = 'v1/objects/chap-users/{},{},{},{}'
+    GET_CHAP_USERS = 'v1/objects/chap-users?portId={}'
     POST_LUNS = 'v1/objects/luns'
     GET_LUNS = 'v1/objects/luns{}'
     DELETE_LUNS = 'v1/objects/luns/{},{},{}'
     GET_LOCAL_CLONE_COPYGROUPS = 'v1/objects/local-clone-copygroups'
     POST_LOCAL_CLONE_COPYPAIRS = 'v1/objects/local-clone-copypairs'
     GET_LOCAL_CLONE_COPYGROUPS_ONE = 'v1/objects/local-clone-copygroups/{}'
+    GET_LOCAL_CLONE_COPYPAIRS_ONE = 'v1/objects/local-clone-copypairs/{}'
     POST_LOCAL_CLONE_COPYPAIRS_SPLIT = 'v1/objects/local-clone-copypairs/{}/actions/split/invoke'
     POST_LOCAL_CLONE_COPYPAIRS_RESYNC = 'v1/objects/local-clone-copypairs/{}/actions/resync/invoke'
     POST_SNAPSHOTS = 'v1/objects/snapshots'
+    GET_SNAPSHOTS = 'v1/objects/snapshots{}'
     GET_SNAPSHOT_GROUPS = 'v1/objects/snapshot-groups'
     GET_SNAPSHOT_GROUPS_ONE = 'v1/objects/snapshot-groups/{}'
     POST_SNAPSHOTS_SPLIT = 'v1/objects/snapshots/{}/actions/split/invoke'
     POST_SNAPSHOTS_RESYNC = 'v1/objects/snapshots/{}/actions/resync/invoke'
     POST_SNAPSHOTS_RESTORE = 'v1/objects/snapshots/{}/actions/restore/invoke'
+    POST_SNAPSHOT_GROUPS_ACTION = 'v1/objects/snapshot-groups/{}/actions/{}/invoke'
+    POST_LOCAL_CLONE_COPYGROUPS_ACTION = 'v1/objects/local-clone-copygroups/{}/actions/{}/invoke'
     GET_JOBS = 'v1/objects/jobs/{}'
     PUT_ISCSI_PORTS_DISCOVER = 'v1/objects/iscsi-ports/{}/actions/discover/invoke'
     PUT_ISCSI_PORTS_REGISTER = 'v1/objects/iscsi-ports/{}/actions/register/invoke'
@@ -159,6 +180,8 @@ class PfRestEndpoints(object):
     POST_EXTERNAL_VOLUMES = 'simple/v1/objects/external-volumes'
     POST_SESSIONS = 'simple/v1/objects/sessions'
     DELETE_SESSIONS = 'simple/v1/objects/sessions/{}'
+    POST_OBJECTS_SESSIONS = 'v1/objects/sessions'
+    DELETE_OBJECTS_SESSIONS = 'v1/objects/sessions/{}'
     GET_COMMAND_STATUS = 'simple/v1/objects/command-status/{}'
     DELETE_COMMAND_STATUS = 'simple/v1/objects/command-status/{}'
     GET_HOST_ISCSI_PATHS = 'v1/views/host-iscsi-paths?{}'
@@ -174,6 +197,8 @@ class Http(object):
     APPLICATION_JSON = 'application/json'
     RESPONSE_JOB_STATUS = 'Response-Job-Status'
     COMPLETED = 'Completed'
+    AUTHORIZATION = 'Authorization'
+    SESSION = 'Session '
     HEADERS_JSON = {
         CONTENT_TYPE: APPLICATION_JSON,
         RESPONSE_JOB_STATUS: COMPLETED
@@ -213,9 +238,18 @@ class ModuleArgs(object):
     SNAPSHOT_POOL_ID = 'snapshot_pool_id'
     COPY_SPEED = 'copy_speed'
     IS_CONSISTENCY_GROUP = 'is_consistency_group'
+    AUTO_SPLIT = 'auto_split'
+    PVOL_LDEV_IDS = 'pvol_ldev_ids'
     COPY_PAIR_NAME = 'copy_pair_name'
     MU_NUMBER = 'mu_number'
     GENERATIONS = 'generations'
+    MAX_WORKERS = 'max_workers'
+    RETURN_DETAIL = 'return_detail'
+    RETURN_FIELDS = 'return_fields'
+    PORT_SETTINGS = 'port_settings'
+    CHAP_SETTINGS = 'chap_settings'
+    ISCSI_NICK_NAME = 'iscsi_nick_name'
+    ACTION = 'action'
     EXTERNAL_PORT_ID = 'external_port_id'
     EXTERNAL_LUN = 'external_lun'
     EXTERNAL_PARITYGROUP_ID = 'external_paritygroup_id'
@@ -259,6 +293,8 @@ class AutomationConstants(object):
     POOL_ID_MAX = 256
     LDEV_ID_MIN = 0
     LDEV_ID_MAX = 65535
+    # Actions invoked on a whole snapshot group or local clone copy group
+    GROUP_ACTIONS = ('split', 'resync', 'restore')
 
 
 class ErrorMessages(object):
@@ -287,8 +323,16 @@ class ErrorMessages(object):
     NOT_AVAILABLE = 'Not Available.'
     REQUIRED_VALUE_ERR = 'The value for the parameter is' +\
         ' required. ({}) Specify a valid value.'
+    INVALID_CHOICE_VALUE = 'The specified value is invalid' +\
+        ' ({}: {}). Specify one of: {}.'
     API_TIMEOUT_ERR = 'A timeout occurred because no response' +\
         ' was received from the server.'
+    JOB_TIMEOUT_ERR = 'The job ({}) did not complete.' +\
+        ' Terminated due to timeout.'
+    UNKNOWN_PARAMETER_ERR = 'The parameter is unknown ({}).' +\
+        ' Specify a parameter of the operation.'
+    UNKNOWN_OPERATION_ERR = 'The operation is unknown ({}).' +\
+        ' Specify an operation of Executors.'
     INVALID_TYPE_VALUE = 'The specified value is not an integer' +\
         ' type ({}: {}). Specify an integer value.'
     INVALID_NAME_SIZE = 'The argument of the parameter is invalid' +\
@@ -0,0 +1,283 @@
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import io
+import json
+from http import HTTPStatus
+
+from ansible.module_utils.urls import urllib_error, socket
+from ansible.module_utils.six.moves.urllib import parse as urlparse
+from ansible.module_utils.six.moves.http_client import HTTPException
+from ansible.module_utils.hitachi_vssb_constant import (
+    VSSB_Api,
+    Endpoints,
+    Http,
+    ErrorMessages,
+    LogMessages,
+)
+from ansible.module_utils.hitachi_vssb_client import (
+    get_logger,
+    customize_capacity_response,
+    Executors,
+    HTTPClient,
+    HitachiBlockHttpException,
+    HitachiBlockModuleException,
+    VssbSession,
+)
+from ansible.module_utils.hitachi_ansible_common import (
+    basic_auth_header,
+    ASYNC_CONNECTION_POOL,
+    CONNECTION_POOL,
+    AsyncJobWaiter,
+    project_outputs,
+    resource_id_from_uri,
+)
+from ansible.module_utils.hitachi_ansible_common_constant import (
+    ConcurrencyConstants,
+    JobWaiterConstants,
+    NameCacheConstants,
+    ReturnDetailConstants,
+)
+
+
+class AsyncHTTPClient(object):
+    ''' asyncio counterpart of HTTPClient.
+
+        Requests are sent over ASYNC_CONNECTION_POOL on the running event loop and
+        jobs are awaited with AsyncJobWaiter, so many requests and job polls overlap
+        in one thread. Responses are decoded by HTTPClient.
+    '''
+
+    @staticmethod
+    async def _request(http_verb, endpoint, params, body=None):
+        try:
+            return await AsyncHTTPClient._send_request(http_verb, endpoint, params, body)
+        except HitachiBlockHttpException as err:
+            # A cached session token may have expired on the storage cluster
+            if getattr(err, 'code', None) != HTTPStatus.UNAUTHORIZED or params.session is None:
+                raise
+            # Renewing logs in with the blocking client, keep it off the event loop
+            renewed = await asyncio.get_running_loop().run_in_executor(None, params.session.renew, params)
+            if not renewed:
+                raise
+            return await AsyncHTTPClient._send_request(http_verb, endpoint, params, body)
+
+    @staticmethod
+    async def _send_request(http_verb, endpoint, params, body=None):
+        url = HTTPClient._format_url(params, endpoint)
+        if CONNECTION_POOL.is_proxied(url):
+            # AsyncConnectionPool does not speak to proxies, open_url does
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(HTTPClient._send_request, http_verb, endpoint, params, body=body))
+        try:
+            headers = dict(Http.HEADERS_JSON)
+            if params.session_token is not None:
+                headers[Http.AUTHORIZATION] = Http.SESSION + params.session_token
+            else:
+                headers[Http.AUTHORIZATION] = basic_auth_header(params.user, params.password)
+            headers['User-Agent'] = Http.USER_AGENT
+
+            get_logger().debug(LogMessages.API_REQUEST_START.format(
+                               http_verb, urlparse.urlparse(url).path))
+
+            data = None
+            if (http_verb == Http.POST or http_verb == Http.PUT or http_verb == Http.PATCH) and body is not None:
+                data = json.dumps(body)
+
+            response = await ASYNC_CONNECTION_POOL.request(
+                http_verb,
+                url,
+                data=data,
+                headers=headers,
+                validate_certs=HTTPClient._is_validate_certs(params),
+                timeout=Http.OPEN_URL_TIMEOUT
+            )
+            if response.status >= 400:
+                raise urllib_error.HTTPError(url, response.status, response.reason, response.msg, io.BytesIO(response.read()))
+            return HTTPClient._load_response(response)
+        except (urllib_error.URLError, socket.timeout) as err:
+            raise HitachiBlockHttpException(err)
+        except HTTPException as err:
+            raise HitachiBlockHttpException(err)
+
+    @staticmethod
+    async def get_by_uri(params, uri):
+        return await AsyncHTTPClient._request(Http.GET, uri, params)
+
+    @staticmethod
+    async def get_jobs(params, job_id):
+        endpoint = HTTPClient._format_endpoint(
+            Endpoints.GET_JOBS, job_id)
+        return await AsyncHTTPClient._request(Http.GET, endpoint, params)
+
+    @staticmethod
+    async def _poll_job(params, job_id, timeout=JobWaiterConstants.TIMEOUT, on_progress=None):
+        ''' Same as HTTPClient._poll_job '''
+        def is_done(job_response):
+            if job_response[VSSB_Api.STATUS] == 'Completed':
+                return True
+            if on_progress is not None:
+                on_progress(job_response)
+            return False
+        return await AsyncJobWaiter(timeout).wait(lambda: AsyncHTTPClient.get_jobs(params, job_id), is_done)
+
+    @staticmethod
+    async def _wait_job(params, job_id, timeout=JobWaiterConstants.TIMEOUT, on_progress=None):
+        ''' Same as HTTPClient._wait_job '''
+        job_response = await AsyncHTTPClient._poll_job(params, job_id, timeout, on_progress)
+        if job_response is not None and job_response[VSSB_Api.STATE] != 'Succeeded':
+            raise HitachiBlockModuleException(HTTPClient._job_error_message(job_response))
+        return job_response
+
+    @staticmethod
+    async def get_volumes_by_name(params):
+        endpoint = HTTPClient._format_endpoint(Endpoints.GET_VOLUMES_AND_QUERY, params.volume_name)
+        get_response = await AsyncHTTPClient._request(Http.GET, endpoint, params)
+        if len(get_response[VSSB_Api.DATA]) < 1:
+            return None
+        return get_response[VSSB_Api.DATA][0]
+
+    @staticmethod
+    async def post_volumes(params):
+        endpoint = HTTPClient._format_endpoint(Endpoints.POST_VOLUMES)
+        post_response = await AsyncHTTPClient._request(Http.POST, endpoint, params, body=HTTPClient.volumes_body(params))
+        get_logger().info("Job ID: %s", post_response[VSSB_Api.JOBID])
+        # Creating many volumes can take long, wait until the job completes
+        job_response = await AsyncHTTPClient._wait_job(params, post_response[VSSB_Api.JOBID], timeout=None,
+                                                       on_progress=HTTPClient.volumes_progress_logger(params))
+        return job_response[VSSB_Api.AFFECTEDRESOURCES]
+
+    @staticmethod
+    async def post_volumes_expand(params):
+        endpoint = HTTPClient._format_endpoint(Endpoints.POST_VOLUMES_EXPAND, params.volume_id)
+        request_params = {
+            VSSB_Api.ADDITIONALCAPACITY: params.additional_capacity
+        }
+        post_response = await AsyncHTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_response = await AsyncHTTPClient._wait_job(params, post_response[VSSB_Api.JOBID])
+        return None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
+
+
+class AsyncExecutors(object):
+    ''' asyncio counterpart of Executors.
+
+        Used as an async context manager, one session is opened for every operation
+        awaited inside when the session token cache is enabled. Each operation runs on
+        its own copy of the Params, and its keyword arguments override the Params
+        attributes of the same name, so one AsyncExecutors can drive many operations
+        with asyncio.gather:
+
+            async with AsyncExecutors(module_params) as executors:
+                results = await asyncio.gather(*[executors.expand_volume(volume_name=name)
+                                                 for name in volume_names])
+
+        expand_volume and create_volume send their requests and poll their jobs on the
+        event loop. The pool and volume lookups of create_volume, which may read the
+        name cache file, and any other Executors operation awaited with run(), such as
+        add_paths, use one of `max_threads` worker threads instead, so at most
+        `max_threads` of those are in flight at a time.
+    '''
+
+    def __init__(self, params=None, max_threads=ConcurrencyConstants.ASYNC_MAX_CONCURRENCY_DEFAULT):
+        self.executors = Executors(params)
+        self.params = self.executors.params
+        self.max_threads = max_threads
+        self.session = None
+        self._threads = None
+
+    async def __aenter__(self):
+        self._threads = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_threads)
+        self.session = VssbSession(self.params)
+        await self._in_thread(self.session.__enter__)
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        session, self.session = self.session, None
+        try:
+            await self._in_thread(session.__exit__, exception_type, exception_value, traceback)
+        finally:
+            threads, self._threads = self._threads, None
+            threads.shutdown(wait=False)
+
+    async def create_volume(self, **overrides):
+        params = self._context(overrides)
+        if params.check_mode:
+            return {VSSB_Api.CHANGED: False}
+        executors = self._executors(params)
+        await self._in_thread(executors._do_number_volumes, params)
+        affected_resource_uris = await AsyncHTTPClient.post_volumes(params)
+        # Invalidating locks and rewrites the name cache file
+        await self._in_thread(HTTPClient.invalidate_name, params, NameCacheConstants.VOLUME)
+        outputs = await self._in_thread(executors._do_get_volumes_by_uris, params, affected_resource_uris)
+        volumes = []
+        for get_response in outputs:
+            customize_capacity_response(get_response)
+            if VSSB_Api.NAME in get_response:
+                volumes.append(get_response[VSSB_Api.NAME])
+        return self._projected(params, {
+            VSSB_Api.CHANGED: True,
+            VSSB_Api.OUTPUTS: outputs,
+            VSSB_Api.VOLUMES: volumes
+        })
+
+    async def expand_volume(self, **overrides):
+        params = self._context(overrides)
+        if params.check_mode:
+            return {VSSB_Api.CHANGED: False}
+        if params.capacity_mb < 1:
+            raise HitachiBlockModuleException('Specified value of capacity_mb argument is out of range. Specify a number greater than 0.')
+        get_response = await AsyncHTTPClient.get_volumes_by_name(params)
+        if get_response is None:
+            raise HitachiBlockModuleException('The volume specified by the name argument was not found. Revise the value specified for the name argument.')
+        if params.capacity_mb <= get_response[VSSB_Api.TOTALCAPACITY]:
+            customize_capacity_response(get_response)
+            return self._projected(params, {
+                VSSB_Api.CHANGED: False,
+                VSSB_Api.OUTPUTS: get_response
+            })
+        params.volume_id = get_response[VSSB_Api.ID]
+        params.additional_capacity = params.capacity_mb - get_response[VSSB_Api.TOTALCAPACITY]
+        affected_resource_uri = await AsyncHTTPClient.post_volumes_expand(params)
+        outputs = await self._get_by_uri(params, affected_resource_uri)
+        customize_capacity_response(outputs)
+        return self._projected(params, {
+            VSSB_Api.CHANGED: True,
+            VSSB_Api.OUTPUTS: outputs
+        })
+
+    async def run(self, operation, **overrides):
+        ''' Awaits the Executors `operation`, e.g. 'attach_volume', run in a worker thread '''
+        executors = self._executors(self._context(overrides))
+        return await self._in_thread(getattr(executors, operation))
+
+    async def _in_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._threads, func, *args)
+
+    def _executors(self, params):
+        executors = copy.copy(self.executors)
+        executors.params = params
+        return executors
+
+    def _context(self, overrides):
+        params = self.params.copy()
+        for name, value in overrides.items():
+            if not hasattr(params, name):
+                raise HitachiBlockModuleException(ErrorMessages.UNKNOWN_PARAMETER_ERR.format(name))
+            setattr(params, name, value)
+        return params
+
+    @staticmethod
+    async def _get_by_uri(params, uri):
+        if params.return_detail == ReturnDetailConstants.ID:
+            # The caller only needs the ID, skip reading the resource back
+            return {VSSB_Api.ID: resource_id_from_uri(uri)}
+        endpoint = uri.split('/', 3)[3]
+        return await AsyncHTTPClient.get_by_uri(params, endpoint)
+
+    @staticmethod
+    def _projected(params, response):
+        if params.return_detail == ReturnDetailConstants.FIELDS and \
+                isinstance(response, dict) and VSSB_Api.OUTPUTS in response:
+            response[VSSB_Api.OUTPUTS] = project_outputs(response[VSSB_Api.OUTPUTS], params.return_fields)
+        return response
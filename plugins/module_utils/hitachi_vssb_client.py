@@ -1,8 +1,11 @@
 from ast import Param
 from datetime import datetime
 import functools
+import contextlib
+import io
 import json
 import copy
+import threading
 import time
 import urllib.parse
 
@@ -24,7 +27,22 @@ from ansible.module_utils.hitachi_vssb_constant import (
 )
 from ansible.module_utils.hitachi_ansible_common import (
     initialize_filehandler_logger,
-    
+    basic_auth_header,
+    CONNECTION_POOL,
+    SESSION_TOKEN_CACHE,
+    NAME_ID_CACHE,
+    JobWaiter,
+    JsonStreamParser,
+    map_concurrently,
+    paginate,
+    project_outputs,
+    resource_id_from_uri,
+)
+from ansible.module_utils.hitachi_ansible_common_constant import (
+    ConcurrencyConstants,
+    JobWaiterConstants,
+    NameCacheConstants,
+    ReturnDetailConstants,
 )
 
 
@@ -102,6 +120,58 @@ def get_with_log(class_name=''):
     return with_log
 
 
+def with_request_context(func):
+    ''' Decorates an Executors operation to run on its own copy of the Params, so operations
+        of one Executors can run concurrently from worker threads '''
+    @functools.wraps(func)
+    def in_context(self, *args, **kwargs):
+        context = copy.copy(self)
+        context.params = self.params.copy()
+        return func(context, *args, **kwargs)
+    return in_context
+
+
+def with_session(func):
+    ''' Decorates an Executors operation to run inside one VssbSession '''
+    @functools.wraps(func)
+    def in_session(self, *args, **kwargs):
+        with VssbSession(self.params):
+            return func(self, *args, **kwargs)
+    return in_session
+
+
+def with_name_cache(func):
+    ''' Decorates an Executors operation to run again with fresh lookups when the
+        storage cluster answers 404 Not Found to an ID taken from NAME_ID_CACHE '''
+    @functools.wraps(func)
+    def resolved(self, *args, **kwargs):
+        del self.params.name_cache_hits[:]
+        try:
+            return func(self, *args, **kwargs)
+        except HitachiBlockHttpException as err:
+            if getattr(err, 'code', None) != HTTPStatus.NOT_FOUND or not self.params.name_cache_hits:
+                raise
+            for kind, name in self.params.name_cache_hits:
+                HTTPClient.invalidate_name(self.params, kind, name)
+            del self.params.name_cache_hits[:]
+            get_logger().info('A cached resource ID is not found, looking the names up again')
+            return func(self, *args, **kwargs)
+    return resolved
+
+
+def with_return_detail(func):
+    ''' Decorates an Executors operation to reduce its outputs to the return_fields
+        when return_detail is fields '''
+    @functools.wraps(func)
+    def projected(self, *args, **kwargs):
+        response = func(self, *args, **kwargs)
+        if self.params.return_detail == ReturnDetailConstants.FIELDS and \
+                isinstance(response, dict) and VSSB_Api.OUTPUTS in response:
+            response[VSSB_Api.OUTPUTS] = project_outputs(response[VSSB_Api.OUTPUTS], self.params.return_fields)
+        return response
+    return projected
+
+
 class Params(object):
     def __init__(self, params=None):
         if params is not None:
@@ -119,7 +189,6 @@ class Params(object):
             self.hba_id = None
             self.target_port_name = params.get(ModuleArgs.TARGET_PORT_NAME)
             self.port_id = None
-            self.request_params = None
             self.pool_name = params.get(ModuleArgs.POOL_NAME, ModuleArgs.NULL)
             self.pool_id = None
             self.number = params.get(ModuleArgs.NUMBER, ModuleArgs.NULL)
@@ -149,6 +218,27 @@ class Params(object):
             self.time_b = params.get(ModuleArgs.TIME_B)
             self.time_c = params.get(ModuleArgs.TIME_C)
             self.time_d = params.get(ModuleArgs.TIME_D)
+            self.max_workers = params.get(ModuleArgs.MAX_WORKERS, ConcurrencyConstants.MAX_WORKERS_DEFAULT)
+            self.return_detail = params.get(ModuleArgs.RETURN_DETAIL, ReturnDetailConstants.FULL)
+            self.return_fields = params.get(ModuleArgs.RETURN_FIELDS)
+            self.port_settings = params.get(ModuleArgs.PORT_SETTINGS)
+            if self.return_detail == ReturnDetailConstants.FIELDS and not self.return_fields:
+                raise HitachiBlockModuleException(
+                    ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.RETURN_FIELDS))
+            self.session_id = None
+            self.session_token = None
+            self.session = None
+            # Set once the running operation has renewed the session token, see renew()
+            self.session_renewed = False
+            # (kind, name) of the IDs taken from NAME_ID_CACHE by the running operation
+            self.name_cache_hits = []
+
+    def copy(self):
+        ''' Returns a shallow copy for one Executors operation. IDs looked up and other
+            values set during the operation stay on the copy. '''
+        params = copy.copy(self)
+        params.name_cache_hits = []
+        return params
 
     @property
     def management_address(self):
@@ -381,6 +471,35 @@ class Params(object):
     def time_d(self, value):
         self._time_d = value
 
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        if value is None:
+            value = ConcurrencyConstants.MAX_WORKERS_DEFAULT
+        Params.validate_non_bool(ModuleArgs.MAX_WORKERS, value)
+        if value < 1 or value > ConcurrencyConstants.MAX_WORKERS_LIMIT:
+            raise HitachiBlockModuleException(
+                ErrorMessages.INVALID_RANGE_VALUE.format(
+                    ModuleArgs.MAX_WORKERS, value, 1, ConcurrencyConstants.MAX_WORKERS_LIMIT))
+        self._max_workers = value
+
+    @property
+    def return_detail(self):
+        return self._return_detail
+
+    @return_detail.setter
+    def return_detail(self, value):
+        if value is None:
+            value = ReturnDetailConstants.FULL
+        if value not in ReturnDetailConstants.CHOICES:
+            raise HitachiBlockModuleException(
+                ErrorMessages.INVALID_CHOICE_VALUE.format(
+                    ModuleArgs.RETURN_DETAIL, value, ', '.join(ReturnDetailConstants.CHOICES)))
+        self._return_detail = value
+
     @property
     def expand_pool_process1_info(self):
         return self._expand_pool_process1_info
@@ -505,43 +624,33 @@ class HitachiBlockHttpException(HitachiBlockException):
             self.reason)
 
 class HTTPClient(object):
+    # (endpoint, filter names) pairs the storage cluster answered with 400 Bad Request
+    _unsupported_filters = set()
+    # Endpoints the storage cluster answered with 400 Bad Request to offset/limit
+    _unpaged_endpoints = set()
+
     @staticmethod
     @get_with_log('HTTPClient')
     def get_servers(params):
-        endpoint = HTTPClient._format_endpoint(Endpoints.GET_SERVERS)
-        get_response = HTTPClient._request(Http.GET, endpoint, params)
-        return get_response[VSSB_Api.DATA]
+        return list(HTTPClient.iter_servers(params))
+
+    @staticmethod
+    def iter_servers(params, filters=None):
+        return HTTPClient._iter_filtered(params, filters or {}, Endpoints.GET_SERVERS)
 
     @staticmethod
     @get_with_log('HTTPClient')
     def post_servers(params):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_SERVERS)
-        params.request_params = {
+        request_params = {
             VSSB_Api.SERVERNICKNAME: params.server_nickname,
             VSSB_Api.OSTYPE: params.os_type
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, job_id)
+        response = None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
         return response
 
@@ -549,11 +658,10 @@ class HTTPClient(object):
     @get_with_log('HTTPClient')
     def get_servers_by_name(params):
         logger = get_logger()
-        get_response = HTTPClient.get_servers(params)
-        logger.info("servers : %s", get_response)
         logger.info("server_nickname : %s", params.server_nickname)
-        for server in get_response:
+        for server in HTTPClient.iter_servers(params, {VSSB_Api.NICKNAME: params.server_nickname}):
             if server[VSSB_Api.NICKNAME] == params.server_nickname:
+                logger.info("server : %s", server)
                 return server
         raise HitachiBlockModuleException(params.server_nickname + " not found.")
 
@@ -564,25 +672,8 @@ class HTTPClient(object):
         endpoint = HTTPClient._format_endpoint(Endpoints.DELETE_SERVERS, params.server_id)
         delete_response = HTTPClient._request(Http.DELETE, endpoint, params)
         job_id = delete_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, job_id)
+        response = None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
         return response
 
@@ -600,25 +691,8 @@ class HTTPClient(object):
         delete_response = HTTPClient._request(Http.DELETE, endpoint, params)
         logger.debug(f"Delete volume response {delete_response}")
         job_id = delete_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, job_id)
+        response = None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
                 
         logger.debug(f"Delete volume final response {response}")
         return response
@@ -628,31 +702,14 @@ class HTTPClient(object):
     def post_hbas(params):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_HBAS, params.server_id)
-        params.request_params = {
+        request_params = {
             VSSB_Api.PROTOCOL: VSSB_Api.ISCSI,
             VSSB_Api.ISCSINAME: params.iscsi_name
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, job_id)
+        response = None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
         return response
 
@@ -663,12 +720,22 @@ class HTTPClient(object):
         get_response = HTTPClient._request(Http.GET, endpoint, params)
         return get_response[VSSB_Api.DATA]
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def get_hbas_by_name(params):
+        for hba in HTTPClient._iter_filtered(params, {VSSB_Api.NAME: params.iscsi_name}, Endpoints.GET_HBAS, params.server_id):
+            if hba[VSSB_Api.NAME] == params.iscsi_name:
+                return hba
+        return None
+
     @staticmethod
     @get_with_log('HTTPClient')
     def get_ports(params):
-        endpoint = HTTPClient._format_endpoint(Endpoints.GET_PORTS)
-        get_response = HTTPClient._request(Http.GET, endpoint, params)
-        return get_response[VSSB_Api.DATA]
+        return list(HTTPClient.iter_ports(params))
+
+    @staticmethod
+    def iter_ports(params, filters=None):
+        return HTTPClient._iter_filtered(params, filters or {}, Endpoints.GET_PORTS)
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -680,9 +747,7 @@ class HTTPClient(object):
     @staticmethod
     @get_with_log('HTTPClient')
     def get_ports_by_name(params):
-        logger = get_logger()
-        get_response = HTTPClient.get_ports(params)
-        for port in get_response:
+        for port in HTTPClient.iter_ports(params, {VSSB_Api.NICKNAME: params.target_port_name}):
             if port[VSSB_Api.NICKNAME] == params.target_port_name:
                 return port
         return None
@@ -692,33 +757,14 @@ class HTTPClient(object):
     def post_paths(params):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_PATHS, params.server_id)
-        params.request_params = {
+        request_params = {
             VSSB_Api.HBAID: params.hba_id,
             VSSB_Api.PORTID: params.port_id
         }
-        logger.debug(f"params.request_params >>>>>>>>>>>>>>>>>>>>>{params.request_params}")
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        logger.debug(f"request_params >>>>>>>>>>>>>>>>>>>>>{request_params}")
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
-        response = False
-        retryCount = 0
-        while (not response  and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = False
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = True
-                    #response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        response = HTTPClient._wait_job(params, job_id) is not None
 
         return response
 
@@ -736,13 +782,13 @@ class HTTPClient(object):
     @get_with_log('HTTPClient')
     def get_volumes_by_nickname(params):
         logger = get_logger()
-        endpoint = HTTPClient._format_endpoint(Endpoints.GET_VOLUMES_AND_NICKNAME, params.base_name)
-        get_response = HTTPClient._request(Http.GET, endpoint, params)
+        get_response = list(HTTPClient.iter_volumes_by_nickname(params))
         logger.debug(f"Response{get_response}")
-        if len(get_response[VSSB_Api.DATA]) < 1:
-            return []
-        else:
-            return get_response[VSSB_Api.DATA]
+        return get_response
+
+    @staticmethod
+    def iter_volumes_by_nickname(params):
+        return HTTPClient._iter_data(params, {VSSB_Api.NICKNAME: params.base_name}, Endpoints.GET_VOLUMES)
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -760,7 +806,22 @@ class HTTPClient(object):
     def post_volumes(params):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_VOLUMES)
-        params.request_params = {
+        request_params = HTTPClient.volumes_body(params)
+        logger.debug("request params: %s", request_params)
+        
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+        job_id = post_response[VSSB_Api.JOBID]
+        
+        logger.info("Job ID: %s", job_id)
+
+        # Creating many volumes can take long, wait until the job completes
+        job_response = HTTPClient._wait_job(params, job_id, timeout=None,
+                                            on_progress=HTTPClient.volumes_progress_logger(params))
+        return job_response[VSSB_Api.AFFECTEDRESOURCES]
+
+    @staticmethod
+    def volumes_body(params):
+        return {
             VSSB_Api.CAPACITY: params.capacity_mb,
             VSSB_Api.NUMBER: params.number,
             VSSB_Api.NAMEPARAM: {
@@ -770,34 +831,15 @@ class HTTPClient(object):
             },
             VSSB_Api.POOLID:params.pool_id
         }
-        logger.debug("request params: %s", params.request_params)
-        
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
-        job_id = post_response[VSSB_Api.JOBID]
-        
-        logger.info("Job ID: %s", job_id)
-        response = None
-        number_of_resources = 0
-        while (number_of_resources <= params.number+1):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = job_response[VSSB_Api.AFFECTEDRESOURCES]
-            number_of_resources = len(response)
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES]
-                    return response
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                logger.info(f"Volume creation Progress: {number_of_resources} created out of {params.number}")
-                time.sleep(15)
-        return response
+
+    @staticmethod
+    def volumes_progress_logger(params):
+        logger = get_logger()
+
+        def log_progress(job_response):
+            number_of_resources = len(job_response[VSSB_Api.AFFECTEDRESOURCES])
+            logger.info(f"Volume creation Progress: {number_of_resources} created out of {params.number}")
+        return log_progress
         
 
     @staticmethod
@@ -811,35 +853,84 @@ class HTTPClient(object):
         else:
             return get_response[VSSB_Api.DATA][0]
 
+    @staticmethod
+    def get_server_id_by_name(params, use_cache=True):
+        return HTTPClient._resolve_id(params, NameCacheConstants.SERVER, params.server_nickname,
+                                      lambda: HTTPClient.get_servers_by_name(params), use_cache)
+
+    @staticmethod
+    def get_port_id_by_name(params):
+        return HTTPClient._resolve_id(params, NameCacheConstants.PORT, params.target_port_name,
+                                      lambda: HTTPClient.get_ports_by_name(params))
+
+    @staticmethod
+    def get_pool_id_by_name(params):
+        return HTTPClient._resolve_id(params, NameCacheConstants.POOL, params.pool_name,
+                                      lambda: HTTPClient.get_pools_by_name(params))
+
+    @staticmethod
+    def get_volume_id_by_name(params, use_cache=True):
+        return HTTPClient._resolve_id(params, NameCacheConstants.VOLUME, params.volume_name,
+                                      lambda: HTTPClient.get_volumes_by_name(params), use_cache)
+
+    @staticmethod
+    def get_cached_id(params, kind, name):
+        ''' Returns the ID of the `kind` resource `name` from NAME_ID_CACHE, None on a miss '''
+        resource_id = NAME_ID_CACHE.get(HTTPClient._name_cache_scope(params), kind, name)
+        if resource_id is not None:
+            params.name_cache_hits.append((kind, name))
+        return resource_id
+
+    @staticmethod
+    def cache_names(params, kind, ids):
+        ''' Saves the {name: ID} of `kind` resources to NAME_ID_CACHE '''
+        NAME_ID_CACHE.put(HTTPClient._name_cache_scope(params), kind, ids)
+
+    @staticmethod
+    def invalidate_name(params, kind, name=None):
+        ''' Drops the cached ID of `name`, or of every name of `kind` '''
+        NAME_ID_CACHE.invalidate(HTTPClient._name_cache_scope(params), kind, name)
+
+    @staticmethod
+    def _resolve_id(params, kind, name, lookup, use_cache=True):
+        ''' Returns the ID of the `kind` resource `name` from NAME_ID_CACHE, or on a miss
+            the ID of the resource `lookup()` returns, None if it returns None.
+            Without `use_cache` the name is always looked up, as for deletions: a cached ID
+            may by now belong to a resource renamed outside this collection. '''
+        if use_cache:
+            resource_id = HTTPClient.get_cached_id(params, kind, name)
+            if resource_id is not None:
+                return resource_id
+        resource = lookup()
+        if resource is None:
+            return None
+        HTTPClient.cache_names(params, kind, {name: resource[VSSB_Api.ID]})
+        return resource[VSSB_Api.ID]
+
+    @staticmethod
+    def _name_cache_scope(params):
+        return ('vssb', params.management_address, params.management_port, params.user)
+
     @staticmethod
     @get_with_log('HTTPClient')
     def post_volume_server_connections(params):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_VOLUME_SERVER_CONNECTIONS)
-        params.request_params = {
+        request_params = {
             VSSB_Api.VOLUMEID: params.volume_id,
             VSSB_Api.SERVERID: params.server_id
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
+        job_response = HTTPClient._poll_job(params, job_id)
         response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE],
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE],
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        if job_response is not None:
+            if job_response[VSSB_Api.STATE] != 'Succeeded':
+                raise HitachiBlockModuleException(
+                    job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE],
+                    job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE],
+                    job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
+            response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
         return response
 
@@ -847,30 +938,13 @@ class HTTPClient(object):
     @get_with_log('HTTPClient')
     def post_volumes_expand(params):
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_VOLUMES_EXPAND, params.volume_id)
-        params.request_params = {
+        request_params = {
             VSSB_Api.ADDITIONALCAPACITY: params.additional_capacity
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, job_id)
+        response = None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
         return response
 
@@ -890,33 +964,16 @@ class HTTPClient(object):
     def post_chapusers(params):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_CHAPUSERS)
-        params.request_params = {
+        request_params = {
             VSSB_Api.TARGETCHAPUSERNAME: params.target_chap_user_name,
             VSSB_Api.TARGETCHAPSECRET: params.target_chap_secret,
             VSSB_Api.INITIATORCHAPUSERNAME: params.initiator_chap_user_name,
             VSSB_Api.INITIATORCHAPSECRET: params.initiator_chap_secret
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, job_id)
+        response = None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
         return response
 
@@ -927,25 +984,8 @@ class HTTPClient(object):
         endpoint = HTTPClient._format_endpoint(Endpoints.DELETE_CHAPUSERS, params.chap_user_id)
         delete_response = HTTPClient._request(Http.DELETE, endpoint, params)
         job_id = delete_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        job_response = HTTPClient._wait_job(params, job_id)
+        response = None if job_response is None else job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
         return response
 
@@ -965,33 +1005,13 @@ class HTTPClient(object):
     def post_port_auth_settings_chapusers(params):
         logger = get_logger()
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_PORT_AUTH_SETTINGS_CHAPUSERS, params.port_id)
-        params.request_params = {
+        request_params = {
             VSSB_Api.CHAPUSERID: params.chap_user_id
         }
 
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
-        response = False
-        retryCount = 0
-        while (not response  and retryCount < 30):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = False
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = True
-                    # if len(job_response[VSSB_Api.AFFECTEDRESOURCES]) > 0:
-                    #     response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
+        response = HTTPClient._wait_job(params, job_id) is not None
 
         return response
 
@@ -1005,9 +1025,11 @@ class HTTPClient(object):
     @staticmethod
     @get_with_log('HTTPClient')
     def get_drives(params):
-        endpoint = HTTPClient._format_endpoint(Endpoints.GET_DRIVES)
-        get_response = HTTPClient._request(Http.GET, endpoint, params)
-        return get_response[VSSB_Api.DATA]
+        return list(HTTPClient.iter_drives(params))
+
+    @staticmethod
+    def iter_drives(params):
+        return HTTPClient._iter_data(params, {}, Endpoints.GET_DRIVES)
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1026,35 +1048,17 @@ class HTTPClient(object):
     @get_with_log('HTTPClient')
     def post_pools_expand(params):
         endpoint = HTTPClient._format_endpoint(Endpoints.POST_POOLS_EXPAND, params.pool_id)
-        params.request_params = {
+        request_params = {
             VSSB_Api.DRIVEIDS: params.additional_drives
         }
-        post_response = HTTPClient._request(Http.POST, endpoint, params)
+        post_response = HTTPClient._request(Http.POST, endpoint, params, body=request_params)
         job_id = post_response[VSSB_Api.JOBID]
-        response = None
-        retryCount = 0
-        while (response is None and retryCount <= params.time_b * 6):
-            job_response = HTTPClient.get_jobs(params, job_id)
-            job_status = job_response[VSSB_Api.STATUS]
-            job_state = job_response[VSSB_Api.STATE]
-            response = None
-            if job_status == 'Completed':
-                if job_state == 'Succeeded':
-                    response = job_response[VSSB_Api.AFFECTEDRESOURCES][0]
-                else:
-                    raise HitachiBlockModuleException(
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
-                        job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
-            else:
-                retryCount = retryCount + 1
-                time.sleep(10)
-
-        if retryCount > params.time_b * 6:
+        # job_time(time_b) is given in minutes
+        job_response = HTTPClient._wait_job(params, job_id, timeout=params.time_b * 60)
+        if job_response is None:
             raise HitachiBlockModuleException('Pools expand job did not complete. Terminated due to timeout.')
 
-        return response
+        return job_response[VSSB_Api.AFFECTEDRESOURCES][0]
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1063,6 +1067,19 @@ class HTTPClient(object):
         get_response = HTTPClient._request(Http.GET, endpoint, params)
         return get_response[VSSB_Api.DATA]
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def post_sessions(params):
+        endpoint = HTTPClient._format_endpoint(Endpoints.POST_SESSIONS)
+        request_params = None
+        return HTTPClient._request(Http.POST, endpoint, params, body=request_params)
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def delete_sessions(params):
+        endpoint = HTTPClient._format_endpoint(Endpoints.DELETE_SESSIONS, params.session_id)
+        return HTTPClient._request(Http.DELETE, endpoint, params)
+
     @staticmethod
     @get_with_log('HTTPClient')
     def get_by_uri(params, uri):
@@ -1077,36 +1094,159 @@ class HTTPClient(object):
 
     @staticmethod
     @get_with_log('HTTPClient')
-    def _request(http_verb, endpoint, params):
+    def _poll_job(params, job_id, timeout=JobWaiterConstants.TIMEOUT, on_progress=None):
+        ''' Returns the job once it completes, or None if it did not complete within `timeout` seconds '''
+        def is_done(job_response):
+            if job_response[VSSB_Api.STATUS] == 'Completed':
+                return True
+            if on_progress is not None:
+                on_progress(job_response)
+            return False
+        return JobWaiter(timeout).wait(lambda: HTTPClient.get_jobs(params, job_id), is_done)
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _wait_job(params, job_id, timeout=JobWaiterConstants.TIMEOUT, on_progress=None):
+        ''' Same as _poll_job, and raises HitachiBlockModuleException if the job failed '''
+        job_response = HTTPClient._poll_job(params, job_id, timeout, on_progress)
+        if job_response is not None and job_response[VSSB_Api.STATE] != 'Succeeded':
+            raise HitachiBlockModuleException(HTTPClient._job_error_message(job_response))
+        return job_response
+
+    @staticmethod
+    def _job_error_message(job_response):
+        return (job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGEID] + ' ' +
+                job_response[VSSB_Api.ERROR][VSSB_Api.MESSAGE] + ' ' +
+                job_response[VSSB_Api.ERROR][VSSB_Api.CAUSE] + ' ' +
+                job_response[VSSB_Api.ERROR][VSSB_Api.SOLUTION])
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _request(http_verb, endpoint, params, stream_key=None, body=None):
+        ''' Sends the request and returns the decoded response.
+            `body` is the request body of a POST, PUT or PATCH. Nothing but the session
+            is taken from or written to `params`, so requests can be sent from worker threads.
+            With `stream_key`, the array under that key is decoded item by item from the stream.
+        '''
+        try:
+            return HTTPClient._send_request(http_verb, endpoint, params, stream_key, body)
+        except HitachiBlockHttpException as err:
+            # A cached session token may have expired on the storage cluster
+            if getattr(err, 'code', None) != HTTPStatus.UNAUTHORIZED or params.session is None:
+                raise
+            if not params.session.renew(params):
+                raise
+            return HTTPClient._send_request(http_verb, endpoint, params, stream_key, body)
+
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _send_request(http_verb, endpoint, params, stream_key=None, body=None):
+        try:
+            with HTTPClient._open(http_verb, endpoint, params, body) as response:
+                if stream_key is not None:
+                    return HTTPClient._load_response_stream(response, stream_key)
+                return HTTPClient._load_response(response)
+        except (urllib_error.URLError, socket.timeout) as err:
+            raise HitachiBlockHttpException(err)
+        except HTTPException as err:
+            raise HitachiBlockHttpException(err)
+
+    @staticmethod
+    def _iter_request(endpoint, params, stream_key):
+        ''' Yields the items of the `stream_key` array of a GET response while they are
+            decoded from the stream, so a caller can stop at a match without the rest of
+            the list being decoded. The connection is held until the items are exhausted
+            or the generator is closed.
+        '''
+        items = HTTPClient._send_stream(endpoint, params, stream_key)
         try:
-            headers = Http.HEADERS_JSON
+            item = next(items)
+        except StopIteration:
+            return
+        except HitachiBlockHttpException as err:
+            # Same as _request, nothing was yielded before the status was checked
+            if getattr(err, 'code', None) != HTTPStatus.UNAUTHORIZED or params.session is None:
+                raise
+            if not params.session.renew(params):
+                raise
+            items = HTTPClient._send_stream(endpoint, params, stream_key)
+        else:
+            yield item
+        for item in items:
+            yield item
 
-            url = HTTPClient._format_url(params, endpoint)
+    @staticmethod
+    def _send_stream(endpoint, params, stream_key):
+        try:
+            with HTTPClient._open(Http.GET, endpoint, params) as response:
+                parser = JsonStreamParser(response)
+                try:
+                    for item in parser.iter_items(stream_key, {}):
+                        yield item
+                    parser.finish()
+                except ValueError as err:
+                    raise HitachiBlockHttpException(err)
+                finally:
+                    get_logger().debug(LogMessages.API_RESPONSE.format(to_native(parser.log_text())))
+        except (urllib_error.URLError, socket.timeout) as err:
+            raise HitachiBlockHttpException(err)
+        except HTTPException as err:
+            raise HitachiBlockHttpException(err)
 
-            logger = get_logger()
-            logger.debug(LogMessages.API_REQUEST_START.format(
-                         http_verb, urlparse.urlparse(url).path))
+    @staticmethod
+    @contextlib.contextmanager
+    def _open(http_verb, endpoint, params, body=None):
+        ''' Sends the request and yields the response to read the body from.
+            An error status is raised as urllib HTTPError.
+        '''
+        # Build the headers per request, Http.HEADERS_JSON is shared by every call
+        headers = dict(Http.HEADERS_JSON)
+        if params.session_token is not None:
+            headers[Http.AUTHORIZATION] = Http.SESSION + params.session_token
+
+        url = HTTPClient._format_url(params, endpoint)
+
+        logger = get_logger()
+        logger.debug(LogMessages.API_REQUEST_START.format(
+                     http_verb, urlparse.urlparse(url).path))
+
+        data = None
+        if (http_verb == Http.POST or http_verb == Http.PUT or http_verb == Http.PATCH) and body is not None:
+            data = json.dumps(body)
 
-            data = None
-            if (http_verb == Http.POST or http_verb == Http.PUT or http_verb == Http.PATCH) and params.request_params is not None:
-                data = json.dumps(params.request_params)
+        if CONNECTION_POOL.is_proxied(url):
             response = open_url(
                 url,
                 headers=headers,
-                url_username=params.user,
-                url_password=params.password,
+                url_username=params.user if (params.session_token is None) else None,
+                url_password=params.password if (params.session_token is None) else None,
                 method=http_verb,
-                force_basic_auth=True,
+                force_basic_auth=True if (params.session_token is None) else False,
                 validate_certs=HTTPClient._is_validate_certs(params),
                 timeout=Http.OPEN_URL_TIMEOUT,
                 http_agent=Http.USER_AGENT,
                 data=data
             )
-            return HTTPClient._load_response(response)
-        except (urllib_error.URLError, socket.timeout) as err:
-            raise HitachiBlockHttpException(err)
-        except HTTPException as err:
-            raise HitachiBlockHttpException(err)
+            try:
+                yield response
+            finally:
+                response.close()
+            return
+
+        if params.session_token is None:
+            headers[Http.AUTHORIZATION] = basic_auth_header(params.user, params.password)
+        headers['User-Agent'] = Http.USER_AGENT
+        with CONNECTION_POOL.request(
+            http_verb,
+            url,
+            data=data,
+            headers=headers,
+            validate_certs=HTTPClient._is_validate_certs(params),
+            timeout=Http.OPEN_URL_TIMEOUT
+        ) as response:
+            if response.status >= 400:
+                raise urllib_error.HTTPError(url, response.status, response.reason, response.msg, io.BytesIO(response.read()))
+            yield response
 
     @staticmethod
     @get_with_log('HTTPClient')
@@ -1117,6 +1257,85 @@ class HTTPClient(object):
 #            VSSB_Api.SINGLE_QUOTE, VSSB_Api.SINGLE_QUOTE * 2)), args))
         return endpoint.format(*args)
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _format_query(endpoint, filters):
+        ''' Appends the `filters` that are not None to `endpoint` as an encoded query string '''
+        query = urllib.parse.urlencode([(key, value) for key, value in filters.items() if value is not None])
+        if not query:
+            return endpoint
+        return endpoint + '?' + query
+
+    @staticmethod
+    def _iter_data(params, query, endpoint, *args):
+        ''' Yields the data items of the list `endpoint` matching `query`, one offset/limit
+            page at a time, so only the pages the caller consumes are fetched and each item
+            is decoded from the response stream when the caller asks for it.
+            If the storage cluster rejects offset/limit with 400, the list is fetched in one GET.
+            A 400 caused by `query` itself is raised to the caller.
+        '''
+        template = endpoint
+        endpoint = HTTPClient._format_endpoint(endpoint, *args)
+        if template not in HTTPClient._unpaged_endpoints:
+            def get_page(offset, limit, page_query=query):
+                page_query = dict(page_query)
+                page_query[VSSB_Api.OFFSET] = offset
+                page_query[VSSB_Api.LIMIT] = limit
+                return HTTPClient._iter_request(HTTPClient._format_query(endpoint, page_query), params, VSSB_Api.DATA)
+            items = paginate(get_page)
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except HitachiBlockHttpException as err:
+                if getattr(err, 'code', None) != HTTPStatus.BAD_REQUEST:
+                    raise
+                if query:
+                    # Tell a rejected query from unsupported paging with one unfiltered item
+                    try:
+                        list(get_page(0, 1, page_query={}))
+                    except HitachiBlockHttpException as probe_err:
+                        if getattr(probe_err, 'code', None) != HTTPStatus.BAD_REQUEST:
+                            raise
+                    else:
+                        raise err
+                get_logger().warning('Paging %s is not supported, getting the full list.', endpoint)
+                HTTPClient._unpaged_endpoints.add(template)
+            else:
+                yield item
+                for item in items:
+                    yield item
+                return
+        for item in HTTPClient._iter_request(HTTPClient._format_query(endpoint, query), params, VSSB_Api.DATA):
+            yield item
+
+    @staticmethod
+    def _iter_filtered(params, filters, endpoint, *args):
+        ''' Same as _iter_data for `filters` that only narrow the list on the storage cluster.
+            Callers still check each item, the result may be a superset of the matches.
+            A filter the storage cluster rejects with 400 is dropped for the rest of the run.
+        '''
+        endpoint_key = (endpoint, tuple(sorted(filters)))
+        if filters and endpoint_key not in HTTPClient._unsupported_filters:
+            items = HTTPClient._iter_data(params, filters, endpoint, *args)
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except HitachiBlockHttpException as err:
+                if getattr(err, 'code', None) != HTTPStatus.BAD_REQUEST:
+                    raise
+                get_logger().warning('Filtering %s by %s is not supported, getting the full list.',
+                                     endpoint, ', '.join(sorted(filters)))
+                HTTPClient._unsupported_filters.add(endpoint_key)
+            else:
+                yield item
+                for item in items:
+                    yield item
+                return
+        for item in HTTPClient._iter_data(params, {}, endpoint, *args):
+            yield item
+
     @staticmethod
     @get_with_log('HTTPClient')
     def _format_url(params, endpoint):
@@ -1138,6 +1357,20 @@ class HTTPClient(object):
     def _is_validate_certs(params):
         return False
 
+    @staticmethod
+    @get_with_log('HTTPClient')
+    def _load_response_stream(response, stream_key):
+        ''' Same as _load_response for list responses, without reading the whole body first.
+            The `stream_key` array is decoded item by item and only the start of the body is logged.
+        '''
+        parser = JsonStreamParser(response)
+        try:
+            return parser.load(stream_key)
+        except ValueError as err:
+            raise HitachiBlockHttpException(err)
+        finally:
+            get_logger().debug(LogMessages.API_RESPONSE.format(to_native(parser.log_text())))
+
     @staticmethod
     @get_with_log('HTTPClient')
     def _load_response(response):
@@ -1163,6 +1396,9 @@ class Executors(object):
             self.params = Params(params)
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def add_computenode(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1178,6 +1414,7 @@ class Executors(object):
             get_response = HTTPClient.get_servers_by_name(params)
         except HitachiBlockModuleException:
             affected_resource_uri = HTTPClient.post_servers(params)
+            HTTPClient.invalidate_name(params, NameCacheConstants.SERVER, params.server_nickname)
             outputs = self._do_get_by_uri(self.params, affected_resource_uri)
             response = {
                 VSSB_Api.CHANGED: True,
@@ -1185,6 +1422,7 @@ class Executors(object):
             }
             return response
         else:
+            HTTPClient.cache_names(params, NameCacheConstants.SERVER, {params.server_nickname: get_response[VSSB_Api.ID]})
             response = {
                 VSSB_Api.CHANGED: False,
                 VSSB_Api.OUTPUTS: get_response,
@@ -1192,6 +1430,10 @@ class Executors(object):
             return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def add_hbas(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1203,14 +1445,9 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_add_hbas(self, params):
-        get_data = HTTPClient.get_servers_by_name(params)
-        params.server_id = get_data[VSSB_Api.ID]
-        get_hbas = HTTPClient.get_hbas(params)
-        hba_id = None
-        for hba in get_hbas:
-            if hba[VSSB_Api.NAME] == params.iscsi_name:
-                hba_id = hba[VSSB_Api.ID]
-                break
+        params.server_id = HTTPClient.get_server_id_by_name(params)
+        hba = HTTPClient.get_hbas_by_name(params)
+        hba_id = None if hba is None else hba[VSSB_Api.ID]
         if hba_id is None:
             affected_resource_uri = HTTPClient.post_hbas(params)
             outputs = self._do_get_by_uri(self.params, affected_resource_uri)
@@ -1228,6 +1465,10 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def add_paths(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1240,20 +1481,13 @@ class Executors(object):
     @get_with_log('Executors')
     def _do_add_paths(self, params):
         logger = get_logger()
-        get_data = HTTPClient.get_servers_by_name(params)
-        logger.info("server info: %s", get_data)
-        params.server_id = get_data[VSSB_Api.ID]
-        get_data = HTTPClient.get_hbas(params)
-        for hba in get_data:
-            if hba[VSSB_Api.NAME] == params.iscsi_name:
-                params.hba_id = hba[VSSB_Api.ID]
-                logger.debug(f"params.hba_id>>>>>>>>>>>>>>>>>>>>>{params.hba_id}")
-                break
-        get_data = HTTPClient.get_ports(params)
-        for port in get_data:
-            if port[VSSB_Api.NICKNAME] == params.target_port_name:
-                params.port_id = port[VSSB_Api.ID]
-                break
+        params.server_id = HTTPClient.get_server_id_by_name(params)
+        logger.info("server id: %s", params.server_id)
+        hba = HTTPClient.get_hbas_by_name(params)
+        if hba is not None:
+            params.hba_id = hba[VSSB_Api.ID]
+            logger.debug(f"params.hba_id>>>>>>>>>>>>>>>>>>>>>{params.hba_id}")
+        params.port_id = HTTPClient.get_port_id_by_name(params)
         if params.port_id is None:
             raise HitachiBlockModuleException('The target port name specified by the target_port_name in port_settings argument was not found. Revise the value specified for the port_settings argument.')
         
@@ -1289,6 +1523,155 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    def add_paths_bulk(self):
+        ''' Adds the paths of every port_settings (iscsi_name, target_port_name) pair to the compute node '''
+        pairs = []
+        for setting in self.params.port_settings or []:
+            for key in (ModuleArgs.ISCSI_NAME, ModuleArgs.TARGET_PORT_NAME):
+                if not setting.get(key):
+                    raise HitachiBlockModuleException(
+                        ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.PORT_SETTINGS + '.' + key))
+            pair = (setting[ModuleArgs.ISCSI_NAME], setting[ModuleArgs.TARGET_PORT_NAME])
+            if pair not in pairs:
+                pairs.append(pair)
+        if not pairs:
+            raise HitachiBlockModuleException(ErrorMessages.REQUIRED_VALUE_ERR.format(ModuleArgs.PORT_SETTINGS))
+        return self._do_add_paths_bulk(self.params, pairs)
+
+    @get_with_log('Executors')
+    def _do_add_paths_bulk(self, params, pairs):
+        # Resolve the compute node, its HBAs and paths, and the ports once
+        params.server_id = HTTPClient.get_server_id_by_name(params)
+        hba_ids = dict((hba[VSSB_Api.NAME], hba[VSSB_Api.ID]) for hba in HTTPClient.get_hbas(params))
+        paths = dict(((path[VSSB_Api.HBANAME], path[VSSB_Api.PORTNICKNAME]), path) for path in HTTPClient.get_paths(params))
+        missing = [pair for pair in pairs if pair not in paths]
+        # Take the port IDs from NAME_ID_CACHE, read all ports once if any is not there
+        port_names = list(dict.fromkeys(pair[1] for pair in missing))
+        port_ids = dict()
+        for port_name in port_names:
+            port_id = HTTPClient.get_cached_id(params, NameCacheConstants.PORT, port_name)
+            if port_id is not None:
+                port_ids[port_name] = port_id
+        cached_port_names = set(port_ids)
+        if len(port_ids) < len(port_names):
+            port_ids = self._do_get_port_ids(params)
+            cached_port_names = set()
+
+        errors = dict()
+        for pair in missing:
+            if pair[1] not in port_ids:
+                errors[pair] = self._port_not_found_error()
+        if params.check_mode:
+            added = dict((pair, None) for pair in missing if pair not in errors)
+        else:
+            # Add the missing HBAs, then the missing paths
+            iscsi_names = list(dict.fromkeys(
+                pair[0] for pair in missing if pair not in errors and pair[0] not in hba_ids))
+
+            def add_hba(iscsi_name):
+                worker_params = copy.copy(params)
+                worker_params.iscsi_name = iscsi_name
+                affected_resource_uri = HTTPClient.post_hbas(worker_params)
+                if affected_resource_uri is None:
+                    raise HitachiBlockModuleException('Failed to add path.')
+                return resource_id_from_uri(affected_resource_uri)
+
+            outcomes = map_concurrently(add_hba, iscsi_names, params.max_workers)
+            for iscsi_name, (hba_id, error) in zip(iscsi_names, outcomes):
+                if error is None:
+                    hba_ids[iscsi_name] = hba_id
+                    continue
+                for pair in missing:
+                    if pair[0] == iscsi_name:
+                        errors[pair] = error
+
+            def add_path(pair):
+                worker_params = copy.copy(params)
+                worker_params.iscsi_name, worker_params.target_port_name = pair
+                worker_params.hba_id = hba_ids[pair[0]]
+                worker_params.port_id = port_ids[pair[1]]
+                if not HTTPClient.post_paths(worker_params):
+                    raise HitachiBlockModuleException('Failed to add path.')
+                return Http.BASE_URL + HTTPClient._format_endpoint(Endpoints.POST_PATHS, params.server_id) + \
+                    '/' + worker_params.hba_id + ',' + worker_params.port_id
+
+            adding = [pair for pair in missing if pair not in errors]
+            outcomes = map_concurrently(add_path, adding, params.max_workers)
+            # A port ID cached by an earlier run may be stale, look the ports up again and retry those paths
+            stale = [pair for pair, (uri, error) in zip(adding, outcomes)
+                     if pair[1] in cached_port_names and getattr(error, 'code', None) == HTTPStatus.NOT_FOUND]
+            if stale:
+                for port_name in set(pair[1] for pair in stale):
+                    HTTPClient.invalidate_name(params, NameCacheConstants.PORT, port_name)
+                port_ids = self._do_get_port_ids(params)
+                retrying = [pair for pair in stale if pair[1] in port_ids]
+                retried = dict(zip(retrying, map_concurrently(add_path, retrying, params.max_workers)))
+                outcomes = [retried.get(pair, outcome) if pair not in stale or pair in retried
+                            else (None, self._port_not_found_error())
+                            for pair, outcome in zip(adding, outcomes)]
+            added = dict()
+            for pair, (uri, error) in zip(adding, outcomes):
+                if error is None:
+                    added[pair] = uri
+                else:
+                    errors[pair] = error
+
+        outputs = []
+        for pair in pairs:
+            result = {
+                ModuleArgs.ISCSI_NAME: pair[0],
+                ModuleArgs.TARGET_PORT_NAME: pair[1],
+                VSSB_Api.CHANGED: pair in added,
+            }
+            if pair in errors:
+                if isinstance(errors[pair], HitachiBlockException):
+                    result.update(errors[pair].error_response())
+                else:
+                    result[VSSB_Api.MSG] = str(errors[pair])
+            elif pair in paths:
+                result[VSSB_Api.OUTPUTS] = self._project_resource(params, paths[pair])
+            elif added[pair] is not None:
+                result[VSSB_Api.OUTPUTS] = self._project_resource(params, self._do_get_by_uri(params, added[pair]))
+            outputs.append(result)
+        if errors:
+            err = HitachiBlockModuleException('Failed to add {} of {} paths.'.format(len(errors), len(pairs)))
+            err.error[VSSB_Api.OUTPUTS] = outputs
+            raise err
+        return {
+            VSSB_Api.CHANGED: len(added) > 0,
+            VSSB_Api.OUTPUTS: outputs,
+        }
+
+    @get_with_log('Executors')
+    def _do_get_port_ids(self, params):
+        ''' Returns the {nickname: ID} of every port, and saves them to NAME_ID_CACHE '''
+        port_ids = dict((port[VSSB_Api.NICKNAME], port[VSSB_Api.ID]) for port in HTTPClient.iter_ports(params))
+        HTTPClient.cache_names(params, NameCacheConstants.PORT, port_ids)
+        return port_ids
+
+    @staticmethod
+    def _port_not_found_error():
+        return HitachiBlockModuleException(
+            'The target port name specified by the target_port_name in port_settings argument was not found.'
+            ' Revise the value specified for the port_settings argument.')
+
+    @staticmethod
+    def _project_resource(params, resource):
+        ''' Reduces a resource to what return_detail asks for '''
+        if params.return_detail == ReturnDetailConstants.FIELDS:
+            return project_outputs(resource, params.return_fields)
+        if params.return_detail == ReturnDetailConstants.ID:
+            return {VSSB_Api.ID: resource.get(VSSB_Api.ID)}
+        return resource
+
+    @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def create_volume(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1297,13 +1680,12 @@ class Executors(object):
             }
             return result
         affected_resource_uri = self._do_create_volume(self.params)
-        outputs = []
+        outputs = self._do_get_volumes_by_uris(self.params, affected_resource_uri)
         volumes = []
-        for uri in affected_resource_uri:
-            get_response = self._do_get_by_uri(self.params, uri)
+        for get_response in outputs:
             customize_capacity_response(get_response)
-            outputs.append(get_response)
-            volumes.append(get_response[VSSB_Api.NAME])
+            if VSSB_Api.NAME in get_response:
+                volumes.append(get_response[VSSB_Api.NAME])
 
         response = {
             VSSB_Api.CHANGED: True,
@@ -1314,13 +1696,20 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_create_volume(self, params):
+        self._do_number_volumes(params)
+        response = HTTPClient.post_volumes(params)
+        HTTPClient.invalidate_name(params, NameCacheConstants.VOLUME)
+        return response
+
+    @get_with_log('Executors')
+    def _do_number_volumes(self, params):
+        ''' Sets params.pool_id, and params.start_number to follow the volumes already named after params.base_name '''
         logger = get_logger()
-        get_data = HTTPClient.get_pools_by_name(params)
-        if get_data is None:
+        params.pool_id = HTTPClient.get_pool_id_by_name(params)
+        if params.pool_id is None:
             logger.error('The pool specified by the pool_name argument was not found. Revise the value specified for the pool_name argument.')
             raise HitachiBlockModuleException('The pool specified by the pool_name argument was not found. Revise the value specified for the pool_name argument.')
 
-        params.pool_id = get_data[VSSB_Api.ID]
         get_volumes = HTTPClient.get_volumes_by_nickname(params)
         maxNumber = 0
         for volume in get_volumes:
@@ -1333,9 +1722,12 @@ class Executors(object):
                 pass
         params.start_number = maxNumber
         logger.debug(f"Max volume number and prefix name to be created {params.start_number}")
-        return HTTPClient.post_volumes(params)
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def attach_volume(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1354,21 +1746,22 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_attach_volume(self, params):
-        get_data = HTTPClient.get_servers_by_name(params)
-        if get_data is None:
+        params.server_id = HTTPClient.get_server_id_by_name(params)
+        if params.server_id is None:
             raise HitachiBlockModuleException('The request could not be executed.',
                                               'The server specified by the server_nickname argument was not found.',
                                               'Revise the value specified for the server_nickname argument.')
-        params.server_id = get_data[VSSB_Api.ID]
-        get_data = HTTPClient.get_volumes_by_name(params)
-        if get_data is None:
+        params.volume_id = HTTPClient.get_volume_id_by_name(params)
+        if params.volume_id is None:
             raise HitachiBlockModuleException('The request could not be executed.',
                                               'The volume specified by the volume_name argument was not found.',
                                               'Revise the value specified for the volume_name argument.')
-        params.volume_id = get_data[VSSB_Api.ID]
         return HTTPClient.post_volume_server_connections(params)
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def expand_volume(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1409,6 +1802,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def create_chapuser(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1442,6 +1838,10 @@ class Executors(object):
             return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def add_chapuser_computeport(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1455,11 +1855,10 @@ class Executors(object):
     @get_with_log('Executors')
     def _do_add_chapuser_computeport(self, params):
         logger = get_logger()
-        get_response = HTTPClient.get_ports_by_name(params)
-        logger.info("response : %s", get_response)
-        if get_response is None:
+        params.port_id = HTTPClient.get_port_id_by_name(params)
+        logger.info("port id : %s", params.port_id)
+        if params.port_id is None:
             raise HitachiBlockModuleException('Specified compute port is not found.')
-        params.port_id = get_response[VSSB_Api.ID]
         
         get_response = HTTPClient.get_port_auth_settings_chapusers(params)
         logger.info("response2 : %s", get_response)
@@ -1494,6 +1893,10 @@ class Executors(object):
             return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def delete_computenode(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1507,14 +1910,15 @@ class Executors(object):
     @get_with_log('Executors')
     def _do_delete_volume(self, params):
         logger = get_logger()
-        get_response = HTTPClient.get_volumes_by_name(params)
-        logger.info(get_response)
-        if get_response is None:
+        params.volume_id = HTTPClient.get_volume_id_by_name(params, use_cache=False)
+        logger.info(params.volume_id)
+        if params.volume_id is None:
             logger.error('The volume specified by the name argument was not found. Revise the value specified for the name argument.')
             raise HitachiBlockModuleException('The volume specified volume name not found. Provide the correct volume name')
         else:
-            params.volume_id = get_response['id']
-            if HTTPClient.delete_volumes(params):
+            deleted = HTTPClient.delete_volumes(params)
+            HTTPClient.invalidate_name(params, NameCacheConstants.VOLUME, params.volume_name)
+            if deleted:
                 response = {
                 VSSB_Api.CHANGED: True,
                 VSSB_Api.OUTPUTS: "Delete volume successfully"
@@ -1525,14 +1929,14 @@ class Executors(object):
          
     @get_with_log('Executors')
     def _do_delete_computenode(self, params):
-        get_response = HTTPClient.get_servers_by_name(params)
-        if get_response is None:
+        params.server_id = HTTPClient.get_server_id_by_name(params, use_cache=False)
+        if params.server_id is None:
             raise HitachiBlockModuleException('The request could not be executed.',
                                               'Compute Node does not exist',
                                               'Revise the value specified for the server_nickname argument.')
         else:
-            params.server_id = get_response[VSSB_Api.ID]
             HTTPClient.delete_servers(params)
+            HTTPClient.invalidate_name(params, NameCacheConstants.SERVER, params.server_nickname)
             response = {
                 VSSB_Api.CHANGED: True
             }
@@ -1540,6 +1944,10 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def delete_tenant(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1552,28 +1960,54 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_delete_tenant(self, params):
-        get_response = HTTPClient.get_servers_by_name(params)
-        if get_response is None:
+        params.server_id = HTTPClient.get_server_id_by_name(params, use_cache=False)
+        if params.server_id is None:
             raise HitachiBlockModuleException('The request could not be executed.',
                                               'Specified compute node is not found.',
                                               'Revise the value specified for the server_nickname argument.')
-        params.server_id = get_response[VSSB_Api.ID]
         get_response = HTTPClient.get_volume_server_connections_by_serverId(params)
         # Delete compute node and connection info
         self._do_delete_computenode(self.params)
 
-        # Delete volumes
-        volumes = []
-        for volume in get_response:
-            params.volume_id = volume['volumeId']
-            HTTPClient.delete_volumes(params)
-            volumes.append(volume['volumeId'])
+        # Delete volumes, up to max_workers deletions in flight
+        volume_ids = [volume['volumeId'] for volume in get_response]
+
+        def delete_volume(volume_id):
+            worker_params = copy.copy(params)
+            worker_params.volume_id = volume_id
+            if HTTPClient.delete_volumes(worker_params) is None:
+                raise HitachiBlockModuleException(ErrorMessages.JOB_TIMEOUT_ERR.format(volume_id))
+
+        outcomes = map_concurrently(delete_volume, volume_ids, params.max_workers)
+        # The names of the deleted volumes are not known here, drop all of them
+        HTTPClient.invalidate_name(params, NameCacheConstants.VOLUME)
+        volumes = {}
+        failed = 0
+        for volume_id, (result, error) in zip(volume_ids, outcomes):
+            if error is None:
+                volumes[volume_id] = {'deleted': True}
+                continue
+            failed += 1
+            volumes[volume_id] = {'deleted': False}
+            if isinstance(error, HitachiBlockException):
+                volumes[volume_id].update(error.error_response())
+            else:
+                volumes[volume_id][VSSB_Api.MSG] = str(error)
+        if failed:
+            err = HitachiBlockModuleException('Failed to delete {} of {} volumes.'.format(failed, len(volume_ids)))
+            err.error[VSSB_Api.OUTPUTS] = {'volumes': volumes}
+            raise err
         response = {
-            VSSB_Api.CHANGED: True
+            VSSB_Api.CHANGED: True,
+            VSSB_Api.OUTPUTS: {'volumes': volumes}
         }
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_name_cache
+    @with_return_detail
     def delete_volume(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1585,6 +2019,9 @@ class Executors(object):
         return self._do_delete_volume(self.params)
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def expand_pool_process1(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1674,6 +2111,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def expand_pool_process2(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1767,6 +2207,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def add_storagenode_process1(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1810,6 +2253,9 @@ class Executors(object):
         return response
 
     @get_with_log('Executors')
+    @with_request_context
+    @with_session
+    @with_return_detail
     def add_storagenode_process2(self):
         if self.params.check_mode:
             # TODO: Check input parameters
@@ -1830,11 +2276,133 @@ class Executors(object):
 
     @get_with_log('Executors')
     def _do_get_by_uri(self, params, uri):
+        if params.return_detail == ReturnDetailConstants.ID:
+            # The caller only needs the ID, skip reading the resource back
+            return {VSSB_Api.ID: resource_id_from_uri(uri)}
         endpoint = uri.split('/', 3)[3]
         response = HTTPClient.get_by_uri(params, endpoint)
 
         return response
-    
+
+    @get_with_log('Executors')
+    def _do_get_volumes_by_uris(self, params, uris):
+        ''' Reads back the volumes of `uris` with the base_name list query, in the order of `uris`.
+            A volume the list does not return is read with its own GET. '''
+        volume_ids = [resource_id_from_uri(uri) for uri in uris]
+        if params.return_detail == ReturnDetailConstants.ID:
+            return [{VSSB_Api.ID: volume_id} for volume_id in volume_ids]
+        pending = set(volume_ids)
+        found = {}
+        for volume in HTTPClient.iter_volumes_by_nickname(params):
+            if volume[VSSB_Api.ID] in pending:
+                found[volume[VSSB_Api.ID]] = volume
+                pending.discard(volume[VSSB_Api.ID])
+                if not pending:
+                    break
+        if pending:
+            get_logger().debug('%d volumes not returned by the list query, getting them one by one.', len(pending))
+        return [found[volume_id] if volume_id in found else self._do_get_by_uri(params, uri)
+                for uri, volume_id in zip(uris, volume_ids)]
+
+
+class VssbSession:
+    ''' Authenticates an Executors operation with a REST API session.
+
+        A module operation only opens one when the session token cache is enabled,
+        otherwise its few requests keep sending the user and password with basic
+        auth. The token is then taken from and saved to SESSION_TOKEN_CACHE and the
+        session is left open for the next module process. With `always`, as for a
+        long lived VssbClient, a session is opened without the cache too and is
+        deleted on exit. A 401 reply renews the token once.
+    '''
+    def __init__(self, params, always=False):
+        self.params = params
+        self.always = always
+        self.is_owner = False
+        self.is_cached = False
+        self.lock = threading.RLock()
+
+    @get_with_log('VssbSession')
+    def __enter__(self):
+        if self.params.session_token is not None or self.params.check_mode:
+            return self
+        if not SESSION_TOKEN_CACHE.is_enabled() and not self.always:
+            return self
+        try:
+            self._open()
+        except HitachiBlockHttpException as err:
+            get_logger().warning('Failed to create a session, using basic authentication. %s',
+                                 json.dumps(err.error_response(), ensure_ascii=False))
+            return self
+        self.params.session = self
+        self.is_owner = True
+        return self
+
+    @get_with_log('VssbSession')
+    def __exit__(self, exception_type, exception_value, traceback):
+        if not self.is_owner:
+            return
+        try:
+            if not self.is_cached:
+                HTTPClient.delete_sessions(self.params)
+        except HitachiBlockException as err:
+            get_logger().debug('Failed to delete the session: %s',
+                               json.dumps(err.error_response(), ensure_ascii=False))
+        finally:
+            self.params.session_id = None
+            self.params.session_token = None
+            self.params.session = None
+            self.is_owner = False
+
+    @get_with_log('VssbSession')
+    def renew(self, params):
+        ''' Replaces the session token `params` was rejected with, returns False if the operation
+            of `params` already renewed it. Workers sharing the session get the token renewed by
+            another worker.
+        '''
+        with self.lock:
+            if params.session_token == self.params.session_token:
+                if params.session_renewed:
+                    return False
+                params.session_renewed = True
+                if not self._renew():
+                    return False
+            params.session_id = self.params.session_id
+            params.session_token = self.params.session_token
+            return True
+
+    def _renew(self):
+        get_logger().debug('The session %s was rejected, creating a new one', self.params.session_id)
+        if self.is_cached:
+            SESSION_TOKEN_CACHE.invalidate(self._cache_key())
+        self.params.session_id = None
+        self.params.session_token = None
+        try:
+            self._open()
+        except HitachiBlockHttpException as err:
+            get_logger().warning('Failed to renew the session. %s',
+                                 json.dumps(err.error_response(), ensure_ascii=False))
+            return False
+        return True
+
+    def _open(self):
+        if SESSION_TOKEN_CACHE.is_enabled():
+            token, session_id = SESSION_TOKEN_CACHE.get_or_create(self._cache_key(), self._create)
+            self.is_cached = True
+        else:
+            token, session_id = self._create()
+        self.params.session_id = session_id
+        self.params.session_token = token
+
+    def _create(self):
+        response = HTTPClient.post_sessions(self.params)
+        return response[VSSB_Api.TOKEN], response[VSSB_Api.SESSIONID]
+
+    def _cache_key(self):
+        return ('vssb', self.params.management_address, self.params.management_port,
+                self.params.user, self.params.password)
+
+
 def customize_capacity_response(response):
     if "dataReductionEffects" in response:
         if "compressedCapacity" in response["dataReductionEffects"]:
@@ -1853,3 +2421,73 @@ def customize_capacity_response(response):
         response["totalCapacity_mb"] = response.pop("totalCapacity")
     if "usedCapacity" in response:
         response["usedCapacity_mb"] = response.pop("usedCapacity")
+
+
+class VssbClient(object):
+    ''' Client object for Python programs that run many operations in one process.
+
+        Holds the base URL and credentials of one VSP One SDS Block storage cluster, and, while it is
+        open, one REST API session shared by every operation. Requests go through
+        the process-wide CONNECTION_POOL and names are resolved through NAME_ID_CACHE,
+        so connections and looked up IDs are reused from one operation to the next.
+
+        Every public Executors operation is a method taking the module arguments of
+        that operation as keyword arguments, and returns what the module returns.
+        Operations are thread-safe and can be run from a thread pool:
+
+            with VssbClient('sds.example.com', 'admin', 'secret') as client:
+                client.create_volume(pool_name='SP01', capacity_mb=1024, number=1, base_name='vol', number_of_digit=3)
+
+        HitachiBlockException is raised where the module would fail.
+    '''
+    connection_pool = CONNECTION_POOL
+    name_cache = NAME_ID_CACHE
+
+    def __init__(self, management_address, user, password, management_port=VSSB_Api.SERVER_PORT_DEFAULT, **module_args):
+        self.module_args = dict(module_args)
+        self.module_args.update({
+            ModuleArgs.SERVER: management_address,
+            ModuleArgs.SERVER_PORT: management_port,
+            ModuleArgs.USER: user,
+            ModuleArgs.PASSWORD: password,
+        })
+        self.module_args.setdefault(ModuleArgs.CHECK_MODE, False)
+        self.params = Params(self.module_args)
+        self.session = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @get_with_log('VssbClient')
+    def open(self):
+        ''' Opens the session the operations share until close() '''
+        if self.session is None:
+            self.session = VssbSession(self.params, always=True).__enter__()
+
+    @get_with_log('VssbClient')
+    def close(self):
+        session, self.session = self.session, None
+        if session is not None:
+            session.__exit__(None, None, None)
+
+    def run(self, operation, **module_args):
+        ''' Runs the Executors `operation`, e.g. 'create_volume', with `module_args`
+            on top of the arguments the client was created with '''
+        if operation.startswith('_') or not callable(getattr(Executors, operation, None)):
+            raise HitachiBlockModuleException(ErrorMessages.UNKNOWN_OPERATION_ERR.format(operation))
+        executors = Executors(dict(self.module_args, **module_args))
+        if self.session is not None and self.params.session is not None:
+            # The new Params let this operation renew the long lived session once
+            executors.params.session = self.session
+            executors.params.session_id = self.params.session_id
+            executors.params.session_token = self.params.session_token
+        return getattr(executors, operation)()
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not callable(getattr(Executors, name, None)):
+            raise AttributeError(name)
+        return functools.partial(self.run, name)
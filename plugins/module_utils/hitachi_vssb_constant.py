@@ -61,6 +61,10 @@ class VSSB_Api(object):
     DATAREBALANCESTATUS = 'dataRebalanceStatus'
     REDUNDANTTYPE = 'redundantType'
     TIME_DEFAULT = 10
+    TOKEN = 'token'
+    SESSIONID = 'sessionId'
+    OFFSET = 'offset'
+    LIMIT = 'limit'
 
 
 class Endpoints(object):
@@ -80,6 +84,7 @@ class Endpoints(object):
     GET_POOLS_AND_ID = 'v1/objects/pools/{}'                               
     GET_POOLS_AND_QUERY = 'v1/objects/pools?name={}'
     POST_VOLUMES = 'v1/objects/volumes'
+    GET_VOLUMES = 'v1/objects/volumes'
     GET_VOLUMES_AND_QUERY = 'v1/objects/volumes?name={}'
     GET_VOLUMES_AND_NICKNAME = 'v1/objects/volumes?nickname={}'
     GET_VOLUMES_AND_SERVERID = 'v1/objects/volumes?serverId={}'
@@ -95,6 +100,8 @@ class Endpoints(object):
     GET_DRIVES = 'v1/objects/drives'
     POST_POOLS_EXPAND = 'v1/objects/pools/{}/actions/expand/invoke'
     GET_STORAGE_CONTROLLERS = 'v1/objects/storage-controllers'
+    POST_SESSIONS = 'v1/objects/sessions'
+    DELETE_SESSIONS = 'v1/objects/sessions/{}'
 
 
 class Http(object):
@@ -115,6 +122,8 @@ class Http(object):
     DEFAULT_SSL_PORT = 443
     OPEN_URL_TIMEOUT = 300
     USER_AGENT = 'automation-module'
+    AUTHORIZATION = 'Authorization'
+    SESSION = 'Session '
 
 
 class ModuleArgs(object):
@@ -152,6 +161,10 @@ class ModuleArgs(object):
     TIME_B = 'time_b'
     TIME_C = 'time_c'
     TIME_D = 'time_d'
+    MAX_WORKERS = 'max_workers'
+    RETURN_DETAIL = 'return_detail'
+    RETURN_FIELDS = 'return_fields'
+    PORT_SETTINGS = 'port_settings'
 
 
 class AutomationConstants(object):
@@ -181,6 +194,8 @@ class ErrorMessages(object):
     NOT_AVAILABLE = 'Not Available.'
     REQUIRED_VALUE_ERR = 'The value for the parameter is' +\
         ' required. ({}) Specify a valid value.'
+    INVALID_CHOICE_VALUE = 'The specified value is invalid' +\
+        ' ({}: {}). Specify one of: {}.'
     API_TIMEOUT_ERR = 'A timeout occurred because no response' +\
         ' was received from the server.'
     INVALID_TYPE_VALUE = 'The specified value is not an integer' +\
@@ -193,6 +208,16 @@ class ErrorMessages(object):
         ' ({}: {}). Specify in a valid range.'
     INVALID_SECRET_SIZE = 'The specified value is invalid' +\
         ' ({}: {}). Secret should be 12 to 32 chars.'
+    INVALID_RANGE_VALUE = 'The specified value is invalid' +\
+        ' ({}: {}). Specify the value within a valid range (min: {}' +\
+        ', max: {}' +\
+        ').'
+    JOB_TIMEOUT_ERR = 'The job ({}) did not complete.' +\
+        ' Terminated due to timeout.'
+    UNKNOWN_PARAMETER_ERR = 'The parameter is unknown ({}).' +\
+        ' Specify a parameter of the operation.'
+    UNKNOWN_OPERATION_ERR = 'The operation is unknown ({}).' +\
+        ' Specify an operation of Executors.'
 
 
 class LogMessages(object):
@@ -46,6 +46,19 @@ options:
     description:
       - The name of the target CHAP user.
     required: true
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 '''
 
 EXAMPLES = '''
@@ -65,7 +78,9 @@ def hitachi_vssb_main():
         user=dict(type='str', required=True),
         password=dict(type='str', required=True, no_log=True),
         target_port_name=dict(type='str', required=True),
-        target_chap_user_name=dict(type='str', required=True)
+        target_chap_user_name=dict(type='str', required=True),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
@@ -0,0 +1,116 @@
+from __future__ import absolute_import, print_function
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible.module_utils.hitachi_vssb_client import (
+    init_logger,
+    Executors,
+    HitachiBlockException
+)
+from ansible.module_utils.hitachi_vssb_constant import (
+    VSSB_Api,
+    ModuleArgs
+)
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants
+
+DOCUMENTATION = '''
+---
+module: add_paths_bulk
+short_description: Adds several paths to a compute node.
+description:
+  - This module adds the paths of all port_settings to a compute node on a Hitachi Virtual Storage Platform One SDS Block storage system in a single run.
+  - The compute node, its HBAs and paths, and the compute ports are read once and only the missing HBAs and paths are added.
+options:
+  management_address:
+    description:
+      - The hostname or IP address of the storage system.
+    required: true
+  management_port:
+    description:
+      - The port number of the storage system.
+    required: false
+    default: 443
+  user:
+    description:
+      - The username used for authentication.
+    required: true
+  password:
+    description:
+      - The password used for authentication.
+    required: true
+    no_log: true
+  server_nickname:
+    description:
+      - The name of the compute node.
+    required: true
+  port_settings:
+    description:
+      - The paths, each with the iscsi_name of the initiator and the target_port_name of the compute port.
+    required: true
+  max_workers:
+    description:
+      - The number of HBAs and paths added concurrently (1-32).
+      - A path that fails does not stop the others. The result of each path is returned in C(outputs).
+    required: false
+    default: 8
+  return_detail:
+    description:
+      - How much of each path is returned in C(outputs).
+      - C(full) returns the path as read back after the operation.
+      - C(id) skips reading the path back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the path returned when I(return_detail=fields).
+    required: false
+'''
+
+EXAMPLES = '''
+  - name: Add paths to a Compute Node
+    add_paths_bulk:
+      management_address: "example.com"
+      user: "admin"
+      password:  "secret"
+      server_nickname: "example_name"
+      max_workers: 4
+      port_settings:
+        - {iscsi_name: "iqn.1991-05.com.microsoft:win-g7mqgirmfls12016", target_port_name: "001-iSCSI-001"}
+        - {iscsi_name: "iqn.1991-05.com.microsoft:win-g7mqgirmfls12016", target_port_name: "002-iSCSI-001"}
+'''
+
+def hitachi_vssb_main():
+    module_args = dict(
+        management_address=dict(type='str', required=True),
+        management_port=dict(type='int', required=False, default=VSSB_Api.SERVER_PORT_DEFAULT),
+        user=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        server_nickname=dict(type='str', required=True),
+        port_settings=dict(type='list', elements='dict', required=True),
+        max_workers=dict(type='int', required=False, default=ConcurrencyConstants.MAX_WORKERS_CREATE_DEFAULT),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    logger = init_logger(module)
+    try:
+        module.params[ModuleArgs.CHECK_MODE] = module.check_mode
+        executors = Executors(module.params)
+        response = executors.add_paths_bulk()
+
+    except HitachiBlockException as err:
+        import json
+        logger.exception(json.dumps(err.error_response(), ensure_ascii=False))
+        module.fail_json(**err.error_response())
+    except Exception as e:
+        logger.exception(repr(e))
+        module.fail_json(msg=str(e))
+    module.exit_json(**response)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    hitachi_vssb_main()
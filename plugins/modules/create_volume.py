@@ -54,7 +54,19 @@ options:
     description:
       - The base name of the volumes to create.
     required: true
-
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 """
 
 EXAMPLES = """
@@ -67,6 +79,20 @@ EXAMPLES = """
     capacity: 102400
     number: 5
     base_name: "volume"
+
+- name: Create volumes and return only their name and capacity
+  create_volume:
+    management_address: "storage.example.com"
+    user: "admin"
+    password: "secret"
+    pool_name: "example_pool"
+    capacity: 102400
+    number: 5
+    base_name: "volume"
+    return_detail: fields
+    return_fields:
+      - name
+      - totalCapacity_mb
 """
 
 
@@ -81,7 +107,9 @@ def hitachi_vssb_main():
         number=dict(type='int', required=True),
         base_name=dict(type='str', required=True),
         start_number=dict(type='int', required=False, default=VSSB_Api.VOLUME_BASENAME_START_NUMBER_DEFAULT),
-        number_of_digit=dict(type='int', required=False, default=VSSB_Api.VOLUME_BASENAME_NUMBER_OF_DIGIT_DEFAULT)
+        number_of_digit=dict(type='int', required=False, default=VSSB_Api.VOLUME_BASENAME_NUMBER_OF_DIGIT_DEFAULT),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
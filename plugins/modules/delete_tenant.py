@@ -13,6 +13,7 @@ from ansible.module_utils.hitachi_vssb_constant import (
     VSSB_Api,
     ModuleArgs
 )
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants
 
 DOCUMENTATION = '''
 ---
@@ -43,6 +44,13 @@ options:
     description:
       - The name of the compute node.
     required: true
+  max_workers:
+    description:
+      - The number of volumes deleted concurrently (1-32).
+      - A volume that fails to delete does not stop the others. The result of each
+        volume is returned in C(outputs.volumes).
+    required: false
+    default: 4
 '''
 
 EXAMPLES = '''
@@ -52,6 +60,14 @@ EXAMPLES = '''
     user: "admin"
     password: "secret"
     server_nickname: "example_name"
+
+- name: Delete tenant with 8 volume deletions in flight
+  delete_tenant:
+    management_address: "example.com"
+    user: "admin"
+    password: "secret"
+    server_nickname: "example_name"
+    max_workers: 8
 '''
 
 def hitachi_vssb_main():
@@ -61,6 +77,7 @@ def hitachi_vssb_main():
         user=dict(type='str', required=True),
         password=dict(type='str', required=True, no_log=True),
         server_nickname=dict(type='str', required=True),
+        max_workers=dict(type='int', required=False, default=ConcurrencyConstants.MAX_WORKERS_DELETE_DEFAULT),
     )
     module = AnsibleModule(
         argument_spec=module_args,
@@ -72,6 +89,7 @@ def hitachi_vssb_main():
     logger.debug('management_port: %d', module.params['management_port'])
     logger.debug('user: %s', module.params['user'])
     logger.debug('server_nickname %s', module.params['server_nickname'])
+    logger.debug('max_workers %d', module.params['max_workers'])
     try:
         module.params[ModuleArgs.CHECK_MODE] = module.check_mode
         executors = Executors(module.params)
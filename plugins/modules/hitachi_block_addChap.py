@@ -57,6 +57,19 @@ options:
       - The CHAP password.
     required: true
     no_log: true
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 """
 
 EXAMPLES = """
@@ -83,7 +96,9 @@ def hitachi_block_main():
         host_group_number=dict(type='int', required=True),
         chap_user_name=dict(type='str', required=True),
         way_of_chap_user=dict(type='str', required=True),
-        chap_password=dict(type='str', required=True, no_log=True)
+        chap_password=dict(type='str', required=True, no_log=True),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
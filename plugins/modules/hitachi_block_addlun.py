@@ -51,6 +51,19 @@ options:
             - The password used for authentication.
         required: true
         nolog: true
+    return_detail:
+        description:
+            - How much of the resource is returned in C(outputs).
+            - C(full) returns the resource as read back after the operation.
+            - C(id) skips reading the resource back and returns only its ID.
+            - C(fields) returns only the keys listed in I(return_fields).
+        required: false
+        choices: ['full', 'id', 'fields']
+        default: full
+    return_fields:
+        description:
+            - The keys of the resource returned when I(return_detail=fields).
+        required: false
 """
 
 EXAMPLES = """
@@ -75,7 +88,9 @@ def hitachi_block_main():
         ldev_id=dict(type='int', required=True),
         iscsi_name=dict(type='str', required=False),
         user=dict(type='str', required=True),
-        password=dict(type='str', required=True, no_log=True)
+        password=dict(type='str', required=True, no_log=True),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
@@ -0,0 +1,169 @@
+from __future__ import absolute_import, print_function
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible.module_utils.hitachi_block_client import (
+    init_logger,
+    Executors,
+    HitachiBlockException
+)
+from ansible.module_utils.hitachi_block_constant import (
+    Api,
+    ModuleArgs
+)
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants
+
+DOCUMENTATION = """
+---
+module: hitachi_block_addlun_bulk
+short_description: Adds LUNs of one LDEV to several iSCSI targets.
+description:
+  - This module maps one LDEV to every iSCSI target in port_settings in a single run.
+  - The iSCSI name and the LUN are only added to the targets that do not have them yet.
+options:
+  management_address:
+    description:
+      - The management address of the storage system.
+    required: true
+  management_port:
+    description:
+      - The management port of the storage system.
+    required: false
+    default: 443
+  user:
+    description:
+      - The username used for authentication.
+    required: true
+  password:
+    description:
+      - The password used for authentication.
+    required: true
+    no_log: true
+  ldev_id:
+    description:
+      - The ID of the Logical Device (LDEV).
+    required: true
+  port_settings:
+    description:
+      - The iSCSI targets the LDEV is mapped to.
+    required: true
+    suboptions:
+      port_id:
+        description:
+          - The port number of the storage system.
+        required: true
+      host_group_number:
+        description:
+          - The host group number of the port.
+        required: true
+      iscsi_name:
+        description:
+          - The iSCSI name added to the iSCSI target if it does not have it yet.
+        required: false
+      host_group_name:
+        description:
+          - Not used by this module, accepted so the port_settings of the playbook vars can be passed.
+        required: false
+      host_mode:
+        description:
+          - Not used by this module, accepted so the port_settings of the playbook vars can be passed.
+        required: false
+      iscsi_nick_name:
+        description:
+          - Not used by this module, accepted so the port_settings of the playbook vars can be passed.
+        required: false
+      chap_user_name:
+        description:
+          - Not used by this module, accepted so the port_settings of the playbook vars can be passed.
+        required: false
+      way_of_chap_user:
+        description:
+          - Not used by this module, accepted so the port_settings of the playbook vars can be passed.
+        required: false
+      chap_password:
+        description:
+          - Not used by this module, accepted so the port_settings of the playbook vars can be passed.
+          - It is not logged.
+        required: false
+        no_log: true
+  max_workers:
+    description:
+      - The number of iSCSI targets mapped concurrently (1-32).
+      - A target that fails does not stop the others. The result of each target is returned in C(outputs).
+    required: false
+    default: 8
+  return_detail:
+    description:
+      - How much of each LUN is returned in C(outputs).
+      - C(full) returns the LUN as read back after the operation.
+      - C(id) skips reading the LUN back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the LUN returned when I(return_detail=fields).
+    required: false
+"""
+
+EXAMPLES = """
+- name: Add LUN to all iSCSI targets
+  hitachi_block_addlun_bulk:
+    management_address: "storage.example.com"
+    user: "admin"
+    password: "secret"
+    ldev_id: 456
+    max_workers: 4
+    port_settings:
+      - {port_id: 'CL1-C', host_group_number: 1, iscsi_name: 'iqn.1994-04.jp.co.hitachi:example.1'}
+      - {port_id: 'CL2-C', host_group_number: 1, iscsi_name: 'iqn.1994-04.jp.co.hitachi:example.1'}
+"""
+
+
+def hitachi_block_main():
+    module_args = dict(
+        management_address=dict(type='str', required=True),
+        management_port=dict(type='int', required=False, default=Api.SERVER_PORT_DEFAULT),
+        user=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        ldev_id=dict(type='int', required=True),
+        port_settings=dict(type='list', elements='dict', required=True, options=dict(
+            port_id=dict(type='str', required=True),
+            host_group_number=dict(type='int', required=True),
+            iscsi_name=dict(type='str', required=False),
+            host_group_name=dict(type='str', required=False),
+            host_mode=dict(type='str', required=False),
+            iscsi_nick_name=dict(type='str', required=False),
+            chap_user_name=dict(type='str', required=False),
+            way_of_chap_user=dict(type='str', required=False),
+            chap_password=dict(type='str', required=False, no_log=True)
+        )),
+        max_workers=dict(type='int', required=False, default=ConcurrencyConstants.MAX_WORKERS_CREATE_DEFAULT),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    logger = init_logger(module)
+    logger.info("Initializing the addlun_bulk task")
+    try:
+        module.params[ModuleArgs.CHECK_MODE] = module.check_mode
+        executors = Executors(module.params)
+        response = executors.add_luns()
+
+    except HitachiBlockException as err:
+        import json
+        logger.exception(json.dumps(err.error_response(), ensure_ascii=False))
+        module.fail_json(**err.error_response())
+    except Exception as e:
+        logger.exception(repr(e))
+        module.fail_json(msg=str(e))
+    logger.info("Finished the addlun_bulk task")
+
+    module.exit_json(**response)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    hitachi_block_main()
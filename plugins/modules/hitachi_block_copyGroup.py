@@ -0,0 +1,115 @@
+from __future__ import absolute_import, print_function
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible.module_utils.hitachi_block_client import (
+    init_logger,
+    Executors,
+    HitachiBlockException
+)
+from ansible.module_utils.hitachi_block_constant import (
+    Api,
+    ModuleArgs
+)
+
+
+DOCUMENTATION = """
+---
+module: hitachi_block_copyGroup
+short_description: Splits, resyncs or restores all ShadowImage pairs of a copy group.
+description:
+  - This module splits, resyncs or restores every ShadowImage pair of a copy group with a single request
+    and a single job, instead of one hitachi_block_splitSI or hitachi_block_resyncSI run per copy pair.
+options:
+  management_address:
+    description:
+      - The management address of the storage system.
+    required: true
+  management_port:
+    description:
+      - The management port of the storage system.
+    required: false
+    default: 443
+  user:
+    description:
+      - The username used for authentication.
+    required: true
+  password:
+    description:
+      - The password used for authentication.
+    required: true
+    no_log: true
+  copy_group_name:
+    description:
+      - The name of the copy group.
+    required: true
+  action:
+    description:
+      - The operation invoked on the pairs of the copy group.
+    required: true
+    choices: ['split', 'resync', 'restore']
+  copy_pace:
+    description:
+      - The copy pace of split and resync.
+    required: false
+    default: 3
+  return_detail:
+    description:
+      - How much of the copy group is returned in C(outputs).
+      - C(full) returns the copy group with its pairs as read back after the operation.
+      - C(id) skips reading the copy group back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the copy group returned when I(return_detail=fields).
+    required: false
+"""
+
+EXAMPLES = """
+- name: Resync all ShadowImage pairs of a copy group
+  hitachi_block_copyGroup:
+    management_address: "storage.example.com"
+    user: "admin"
+    password: "secret"
+    copy_group_name: "CG001"
+    action: resync
+    copy_pace: 5
+"""
+
+
+def hitachi_block_main():
+    module_args = dict(
+        management_address=dict(type='str', required=True),
+        management_port=dict(type='int', required=False, default=Api.SERVER_PORT_DEFAULT),
+        user=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        copy_group_name=dict(type='str', required=True),
+        action=dict(type='str', required=True, choices=['split', 'resync', 'restore']),
+        copy_pace=dict(type='int', required=False, default=3),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    logger = init_logger(module)
+    try:
+        module.params[ModuleArgs.CHECK_MODE] = module.check_mode
+        executors = Executors(module.params)
+        response = executors.copy_group_action()
+
+    except HitachiBlockException as err:
+        import json
+        logger.exception(json.dumps(err.error_response(), ensure_ascii=False))
+        module.fail_json(**err.error_response())
+    except Exception as e:
+        logger.exception(repr(e))
+        module.fail_json(msg=str(e))
+    module.exit_json(**response)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    hitachi_block_main()
@@ -58,6 +58,19 @@ options:
     description:
       - Specify the consistency group ID (0 to 127).
     required: true
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 """
 
 EXAMPLES = """
@@ -83,7 +96,9 @@ def hitachi_block_main():
         pvol_ldev_id=dict(type='int', required=True),
         svol_ldev_id=dict(type='int', required=True),
         copy_pace=dict(type='int', required=False, default=3),
-        consistency_group_id=dict(type='int', required=True)
+        consistency_group_id=dict(type='int', required=True),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
@@ -0,0 +1,144 @@
+from __future__ import absolute_import, print_function
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible.module_utils.hitachi_block_client import (
+    init_logger,
+    Executors,
+    HitachiBlockException
+)
+from ansible.module_utils.hitachi_block_constant import (
+    Api,
+    ModuleArgs
+)
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants
+
+
+DOCUMENTATION = """
+---
+module: hitachi_block_createTI_bulk
+short_description: Creates the Thin Image pairs of several P-VOLs in one snapshot group.
+description:
+  - This module creates a Thin Image pair of every P-VOL of pvol_ldev_ids in the same snapshot group.
+  - All of the pairs are requested before any of them is waited for, and the jobs are then polled together.
+  - C(split_skew_seconds) is the time between the first and the last split of the created pairs, and
+    C(submit_skew_seconds) the time between the first and the last accepted request.
+  - With I(auto_split=true) and I(is_consistency_group=true), the pairs are created unsplit and the
+    snapshot group is then split with one request, so every P-VOL is split at the same point in time.
+    This needs a new or empty snapshot group. When the snapshot group already holds pairs, each new
+    pair is split by its own job instead.
+options:
+  management_address:
+    description:
+      - The management address of the storage system.
+    required: true
+  management_port:
+    description:
+      - The management port of the storage system.
+    required: false
+    default: 443
+  user:
+    description:
+      - The username used for authentication.
+    required: true
+  password:
+    description:
+      - The password used for authentication.
+    required: true
+    no_log: true
+  snapshot_group_name:
+    description:
+      - The name of the snapshot group. Value should not exceed 32 characters.
+    required: true
+  snapshot_pool_id:
+    description:
+      - Specify the snapshot pool ID. Value should be equal to or greater than 0.
+    required: true
+  pvol_ldev_ids:
+    description:
+      - The LDEV numbers of the P-VOLs with decimal (base 10) numbers.
+    required: true
+  is_consistency_group:
+    description:
+      - Set it to true to create the snapshot group in the consistency group mode.
+    required: false
+    default: false
+  auto_split:
+    description:
+      - Set it to true to split the pairs once they are created.
+      - With I(is_consistency_group=true) and a new or empty snapshot group, the whole snapshot group is
+        split at once after all of the pairs are created, otherwise each pair is split by its own job.
+    required: false
+    default: false
+  max_workers:
+    description:
+      - The number of pairs requested and polled concurrently (1-32).
+      - A pair that fails does not stop the others. The result of each P-VOL is returned in C(outputs).
+      - Set it to the number of P-VOLs, up to 32, to request every pair at once for the smallest skew.
+    required: false
+    default: 8
+  return_detail:
+    description:
+      - How much of each pair is returned in C(outputs).
+      - C(full) returns the pair as read back after the operation.
+      - C(id) skips reading the pair back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the pair returned when I(return_detail=fields).
+    required: false
+"""
+
+EXAMPLES = """
+- name: Create ThinImage pairs of several P-VOLs in a consistency group
+  hitachi_block_createTI_bulk:
+    management_address: "storage.example.com"
+    user: "admin"
+    password: "secret"
+    pvol_ldev_ids: [10005, 10006, 10007]
+    snapshot_pool_id: 1
+    snapshot_group_name: ABC
+    is_consistency_group: true
+    auto_split: true
+"""
+
+
+def hitachi_block_main():
+    module_args = dict(
+        management_address=dict(type='str', required=True),
+        management_port=dict(type='int', required=False, default=Api.SERVER_PORT_DEFAULT),
+        user=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        snapshot_group_name=dict(type='str', required=True),
+        snapshot_pool_id=dict(type='int', required=True),
+        pvol_ldev_ids=dict(type='list', elements='int', required=True),
+        is_consistency_group=dict(type='bool', required=False),
+        auto_split=dict(type='bool', required=False),
+        max_workers=dict(type='int', required=False, default=ConcurrencyConstants.MAX_WORKERS_CREATE_DEFAULT),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    logger = init_logger(module)
+    try:
+        module.params[ModuleArgs.CHECK_MODE] = module.check_mode
+        executors = Executors(module.params)
+        response = executors.create_ti_bulk()
+
+    except HitachiBlockException as err:
+        import json
+        logger.exception(json.dumps(err.error_response(), ensure_ascii=False))
+        module.fail_json(**err.error_response())
+    except Exception as e:
+        logger.exception(repr(e))
+        module.fail_json(msg=str(e))
+    module.exit_json(**response)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    hitachi_block_main()
@@ -10,6 +10,7 @@ from ansible.module_utils.hitachi_block_constant import (
     Api,
     ModuleArgs
 )
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants
 
 DOCUMENTATION = """
 ---
@@ -57,6 +58,27 @@ options:
     description:
       - Specify true to split after it is created. 
     required: true
+  max_workers:
+    description:
+      - The number of generations created concurrently (1-32).
+      - The generations are returned in the order they were requested.
+      - If a generation fails, no further generations are submitted and the generations
+        already created are returned in C(outputs) with the error.
+    required: false
+    default: 8
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 """
 
 EXAMPLES = """
@@ -69,6 +91,17 @@ EXAMPLES = """
     snapshot_pool_id: 1
     snapshot_group_name: ABC
     generations: 1 
+
+- name: Create 64 generations with 8 requests in flight
+  hitachi_block_createTI_with_gen:
+    management_address: "storage.example.com"
+    user: "admin"
+    password: "secret"
+    pvol_ldev_id: 10005
+    snapshot_pool_id: 1
+    snapshot_group_name: ABC
+    generations: 64
+    max_workers: 8
 """
 
 
@@ -83,7 +116,10 @@ def hitachi_block_main():
         snapshot_pool_id=dict(type='int', required=True),
         pvol_ldev_id=dict(type='int', required=True),
         is_consistency_group=dict(type='bool', required=False),
-        generations=dict(type='int', required=True)
+        generations=dict(type='int', required=True),
+        max_workers=dict(type='int', required=False, default=ConcurrencyConstants.MAX_WORKERS_CREATE_DEFAULT),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
@@ -49,6 +49,19 @@ options:
     description:
       - The capacity of each volume in megabytes.
     required: true
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 '''
 
 EXAMPLES = '''
@@ -60,6 +73,16 @@ EXAMPLES = '''
     ldev_id: 10005
     port_id: 2
     capacity_mb: 1000
+
+- name: Create a volume and return only its LDEV ID
+  hitachi_block_createVol:
+    management_address: "example.com"
+    user: "admin"
+    password: "secret"
+    ldev_id: 10005
+    port_id: 2
+    capacity_mb: 1000
+    return_detail: id
 '''
 
 
@@ -73,7 +96,9 @@ def hitachi_block_main():
         ldev_id=dict(type='int', required=True),
         data_reduction_mode=dict(type='str', required=False, default=Api.DATA_REDUCTION_MODE_DISABLE),
         user=dict(type='str', required=True),
-        password=dict(type='str', required=True, no_log=True)
+        password=dict(type='str', required=True, no_log=True),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
@@ -0,0 +1,187 @@
+from __future__ import absolute_import, print_function
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible.module_utils.hitachi_block_client import (
+    init_logger,
+    Executors,
+    HitachiBlockException
+)
+from ansible.module_utils.hitachi_block_constant import (
+    Api,
+    ModuleArgs
+)
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants
+
+DOCUMENTATION = """
+---
+module: hitachi_block_createhg_bulk
+short_description: Provisions several iSCSI targets with their iSCSI names and CHAP users.
+description:
+  - This module creates the iSCSI targets of port_settings, adds their iSCSI name, sets its nickname
+    and adds the CHAP users of chap_settings in a single run.
+  - The current iSCSI targets, iSCSI names and CHAP users are read once per port and only the missing
+    pieces are added.
+options:
+  management_address:
+    description:
+      - The management address of the storage system.
+    required: true
+  management_port:
+    description:
+      - The management port of the storage system.
+    required: false
+    default: 443
+  user:
+    description:
+      - The username used for authentication.
+    required: true
+  password:
+    description:
+      - The password used for authentication.
+    required: true
+    no_log: true
+  port_settings:
+    description:
+      - The iSCSI targets.
+    required: true
+    suboptions:
+      port_id:
+        description:
+          - The port number of the storage system.
+        required: true
+      host_group_number:
+        description:
+          - The host group number of the port.
+        required: true
+      host_group_name:
+        description:
+          - The name of the iSCSI target, only required for the iSCSI targets that do not exist yet.
+        required: false
+      host_mode:
+        description:
+          - The host mode of the iSCSI target.
+        required: false
+      iscsi_name:
+        description:
+          - The iSCSI name added to the iSCSI target if it does not have it yet.
+        required: false
+      iscsi_nick_name:
+        description:
+          - The nickname set for the iSCSI name.
+        required: false
+      chap_user_name:
+        description:
+          - Not used by this module, the CHAP users are given in chap_settings.
+        required: false
+      way_of_chap_user:
+        description:
+          - Not used by this module, the CHAP users are given in chap_settings.
+        required: false
+      chap_password:
+        description:
+          - Not used by this module, the CHAP users are given in chap_settings.
+          - It is not logged.
+        required: false
+        no_log: true
+  chap_settings:
+    description:
+      - The CHAP users added to the iSCSI targets.
+    required: false
+    suboptions:
+      port_id:
+        description:
+          - The port number of the storage system.
+        required: true
+      host_group_number:
+        description:
+          - The host group number of the port.
+        required: true
+      chap_user_name:
+        description:
+          - The CHAP user name.
+        required: true
+      way_of_chap_user:
+        description:
+          - The way of the CHAP user, INI or TAR.
+        required: true
+      chap_password:
+        description:
+          - The secret set for the CHAP user when this module creates it. The secret of an existing CHAP
+            user is not changed.
+          - It is not logged.
+        required: false
+        no_log: true
+  max_workers:
+    description:
+      - The number of iSCSI targets provisioned concurrently (1-32).
+      - A target that fails does not stop the others. The changes made to each target are returned in C(outputs).
+    required: false
+    default: 8
+"""
+
+EXAMPLES = """
+- name: Create iSCSI targets with their iSCSI names and CHAP users
+  hitachi_block_createhg_bulk:
+    management_address: "storage.example.com"
+    user: "admin"
+    password: "secret"
+    max_workers: 4
+    port_settings:
+      - {port_id: 'CL1-C', host_group_number: 1, host_group_name: 'target1', host_mode: 'LINUX/IRIX',
+         iscsi_name: 'iqn.1994-04.jp.co.hitachi:example.1', iscsi_nick_name: 'host1'}
+    chap_settings:
+      - {port_id: 'CL1-C', host_group_number: 1, chap_user_name: 'chapuser1', way_of_chap_user: 'INI'}
+"""
+
+
+def hitachi_block_main():
+    module_args = dict(
+        management_address=dict(type='str', required=True),
+        management_port=dict(type='int', required=False, default=Api.SERVER_PORT_DEFAULT),
+        user=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        port_settings=dict(type='list', elements='dict', required=True, options=dict(
+            port_id=dict(type='str', required=True),
+            host_group_number=dict(type='int', required=True),
+            host_group_name=dict(type='str', required=False),
+            host_mode=dict(type='str', required=False),
+            iscsi_name=dict(type='str', required=False),
+            iscsi_nick_name=dict(type='str', required=False),
+            chap_user_name=dict(type='str', required=False),
+            way_of_chap_user=dict(type='str', required=False),
+            chap_password=dict(type='str', required=False, no_log=True)
+        )),
+        chap_settings=dict(type='list', elements='dict', required=False, options=dict(
+            port_id=dict(type='str', required=True),
+            host_group_number=dict(type='int', required=True),
+            chap_user_name=dict(type='str', required=True),
+            way_of_chap_user=dict(type='str', required=True),
+            chap_password=dict(type='str', required=False, no_log=True)
+        )),
+        max_workers=dict(type='int', required=False, default=ConcurrencyConstants.MAX_WORKERS_CREATE_DEFAULT)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    logger = init_logger(module)
+    logger.info("Initializing the createhg_bulk task")
+    try:
+        module.params[ModuleArgs.CHECK_MODE] = module.check_mode
+        executors = Executors(module.params)
+        response = executors.provision_iscsi_targets()
+
+    except HitachiBlockException as err:
+        import json
+        logger.exception(json.dumps(err.error_response(), ensure_ascii=False))
+        module.fail_json(**err.error_response())
+    except Exception as e:
+        logger.exception(repr(e))
+        module.fail_json(msg=str(e))
+    logger.info("Finished the createhg_bulk task")
+
+    module.exit_json(**response)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    hitachi_block_main()
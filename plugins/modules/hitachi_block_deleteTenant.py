@@ -0,0 +1,110 @@
+from __future__ import absolute_import, print_function
+from ansible.module_utils.basic import AnsibleModule
+import json
+
+from ansible.module_utils.hitachi_block_client import (
+    init_logger,
+    Executors,
+    HitachiBlockException
+)
+from ansible.module_utils.hitachi_block_constant import (
+    Api,
+    ModuleArgs
+)
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants
+
+DOCUMENTATION = '''
+---
+module: hitachi_block_deleteTenant
+short_description: Deletes the iSCSI targets and volumes of an iSCSI name on a Hitachi block storage system.
+description:
+  - This module removes an iSCSI name from every iSCSI target it is registered to on a Hitachi block storage system.
+  - An iSCSI target left without iSCSI names is deleted with its LUNs, and a volume is deleted once every iSCSI target it was mapped to is gone.
+options:
+  management_address:
+    description:
+      - The hostname or IP address of the storage system.
+    required: true
+  management_port:
+    description:
+      - The TCP/UDP port number of the storage system.
+    required: false
+    default: 443
+  user:
+    description:
+      - The username used for authentication.
+    required: true
+  password:
+    description:
+      - The password used for authentication.
+    required: true
+    no_log: true
+  storage_device_id:
+    description:
+      - The storage device ID of the storage system.
+    required: true
+  iscsi_name:
+    description:
+      - The iSCSI name of the host.
+      - Specify this item in the iqn or eui format.
+    required: true
+  max_workers:
+    description:
+      - The number of iSCSI targets, then volumes, deleted concurrently (1-32).
+      - The LUNs of an iSCSI target are deleted one by one by the worker deleting the target.
+      - An iSCSI target or volume that fails to delete does not stop the others. The deleted ones are returned in C(outputs).
+    required: false
+    default: 4
+'''
+
+EXAMPLES = '''
+- name: Delete the iSCSI targets and volumes of an iSCSI name.
+  hitachi_block_deleteTenant:
+    management_address: "example.com"
+    user: "admin"
+    password: "secret"
+    storage_device_id: "886000123456"
+    iscsi_name: 'iqn.rest.example.of.iqn.form'
+    max_workers: 8
+'''
+
+def hitachi_block_main():
+    module_args = dict(
+        management_address=dict(type='str', required=True),
+        management_port=dict(type='int', required=False, default=Api.SERVER_PORT_DEFAULT),
+        user=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        storage_device_id=dict(type='str', required=True),
+        iscsi_name=dict(type='str', required=True),
+        max_workers=dict(type='int', required=False, default=ConcurrencyConstants.MAX_WORKERS_DELETE_DEFAULT)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    logger = init_logger(module)
+    logger.info("Intialized deleteTenant task")
+    logger.debug('management_address: %s', module.params['management_address'])
+    logger.debug('management_port: %d', module.params['management_port'])
+    logger.debug('storage_device_id: %s', module.params['storage_device_id'])
+    logger.debug('iscsi_name: %s', module.params['iscsi_name'])
+    logger.debug('max_workers: %d', module.params['max_workers'])
+    logger.debug('user: %s', module.params['user'])
+    try:
+        module.params[ModuleArgs.CHECK_MODE] = module.check_mode
+        executors = Executors(module.params)
+        response = executors.delete_tenant()
+
+    except HitachiBlockException as err:
+        logger.exception(json.dumps(err.error_response(), ensure_ascii=False))
+        module.fail_json(**err.error_response())
+    except Exception as e:
+        logger.exception(repr(e))
+        module.fail_json(msg=str(e))
+    logger.debug('response: %s', json.dumps(response))
+    logger.info("Completed deleteTenant task")
+    module.exit_json(**response)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    hitachi_block_main()
@@ -49,6 +49,19 @@ options:
     description:
       - Specify the mirror unit number in the range from 0 to 1023.
     required: true
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 """
 
 EXAMPLES = """
@@ -72,7 +85,9 @@ def hitachi_block_main():
         password=dict(type='str', required=True, no_log=True),
         snapshot_group_name=dict(type='str', required=True),
         pvol_ldev_id=dict(type='int', required=True),
-        mu_number=dict(type='int', required=True)
+        mu_number=dict(type='int', required=True),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
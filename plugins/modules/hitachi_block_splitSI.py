@@ -45,12 +45,36 @@ options:
   copy_pair_name:
     description:
       - The name of the copy pair.
-    required: true
+      - Required unless pvol_ldev_id and svol_ldev_id are specified.
+    required: false
+  pvol_ldev_id:
+    description:
+      - The LDEV number of the P-VOL with a decimal (base 10) number.
+      - Together with svol_ldev_id, selects the copy pair created by hitachi_block_createSI for the two volumes
+        when copy_pair_name is not specified.
+    required: false
+  svol_ldev_id:
+    description:
+      - The LDEV number of the S-VOL with a decimal (base 10) number.
+    required: false
   copy_pace:
     description:
       - The copy pace.
     required: false
     default: 3
+  return_detail:
+    description:
+      - How much of the resource is returned in C(outputs).
+      - C(full) returns the resource as read back after the operation.
+      - C(id) skips reading the resource back and returns only its ID.
+      - C(fields) returns only the keys listed in I(return_fields).
+    required: false
+    choices: ['full', 'id', 'fields']
+    default: full
+  return_fields:
+    description:
+      - The keys of the resource returned when I(return_detail=fields).
+    required: false
 """
 
 EXAMPLES = """
@@ -62,6 +86,15 @@ EXAMPLES = """
     copy_group_name: "CG001"
     copy_pair_name: "CP001"
     copy_pace: 5
+
+- name: Split the shadow image of a P-VOL and an S-VOL
+  hitachi_block_splitSI:
+    management_address: "storage.example.com"
+    user: "admin"
+    password: "secret"
+    copy_group_name: "CG001"
+    pvol_ldev_id: 10005
+    svol_ldev_id: 10006
 """
 
 
@@ -74,11 +107,17 @@ def hitachi_block_main():
         user=dict(type='str', required=True),
         password=dict(type='str', required=True, no_log=True),
         copy_group_name=dict(type='str', required=True),
-        copy_pair_name=dict(type='str', required=True),
-        copy_pace=dict(type='int', required=False, default=3)
+        copy_pair_name=dict(type='str', required=False),
+        pvol_ldev_id=dict(type='int', required=False),
+        svol_ldev_id=dict(type='int', required=False),
+        copy_pace=dict(type='int', required=False, default=3),
+        return_detail=dict(type='str', required=False, default='full', choices=['full', 'id', 'fields']),
+        return_fields=dict(type='list', elements='str', required=False)
     )
     module = AnsibleModule(
         argument_spec=module_args,
+        required_one_of=[['copy_pair_name', 'pvol_ldev_id']],
+        required_together=[['pvol_ldev_id', 'svol_ldev_id']],
         supports_check_mode=True,
     )
     logger = init_logger(module)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+''' Runs one storage operation for every row of a CSV or JSON file.
+
+    The rows are the module arguments of the operation, e.g. ldev_id, pool_id and
+    capacity_mb for create_ldev. They run with a configurable concurrency in one
+    process over one shared REST API session, instead of one Ansible task, process
+    and login per row. The result of each row is written as a JSON line, and a run
+    started again with --resume skips the rows that already succeeded.
+
+    Example:
+        hitachi_bulk.py --platform vsp --management-address storage.example.com \
+            --user admin --operation create_ldev --input volumes.csv \
+            --output volumes.jsonl --concurrency 16 --set pool_id=0
+'''
+import argparse
+import csv
+import getpass
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+import ansible.module_utils
+
+# The module_utils of ANSIBLE_MODULE_UTILS, as for the modules, then those of this checkout
+MODULE_UTILS = [path for path in os.environ.get('ANSIBLE_MODULE_UTILS', '').split(os.pathsep) if path] + \
+    [os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'plugins', 'module_utils')]
+ansible.module_utils.__path__.extend(path for path in MODULE_UTILS if path not in ansible.module_utils.__path__)
+
+from ansible.module_utils.hitachi_ansible_common import (  # noqa: E402
+    initialize_filehandler_logger,
+    map_concurrently,
+)
+from ansible.module_utils.hitachi_ansible_common_constant import ConcurrencyConstants  # noqa: E402
+
+PLATFORMS = ('vsp', 'sds')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Runs a storage operation for every row of a CSV or JSON file.')
+    parser.add_argument('--platform', choices=PLATFORMS, required=True,
+                        help='vsp for a VSP storage system, sds for a VSP One SDS Block storage cluster')
+    parser.add_argument('--management-address', required=True)
+    parser.add_argument('--management-port', type=int, default=443)
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--password',
+                        help='defaults to the HITACHI_PASSWORD environment variable, else it is prompted for')
+    parser.add_argument('--operation', required=True,
+                        help='the Executors operation, e.g. create_ldev or create_volume')
+    parser.add_argument('--input', required=True,
+                        help='a CSV file with a header row, a JSON array of objects or JSON lines; "-" reads stdin')
+    parser.add_argument('--output', default='-',
+                        help='the JSON lines file the results are appended to, "-" writes to stdout')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE', dest='defaults',
+                        help='a module argument for every row, a row value takes precedence')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='the number of rows run at once (1-{})'.format(ConcurrencyConstants.MAX_WORKERS_LIMIT))
+    parser.add_argument('--resume', action='store_true',
+                        help='skip the rows the output file already records as succeeded, not counting check mode runs')
+    parser.add_argument('--check', action='store_true',
+                        help='run the operations in check mode')
+    args = parser.parse_args(argv)
+    if not 1 <= args.concurrency <= ConcurrencyConstants.MAX_WORKERS_LIMIT:
+        parser.error('--concurrency must be between 1 and {}'.format(ConcurrencyConstants.MAX_WORKERS_LIMIT))
+    if args.resume and args.output == '-':
+        parser.error('--resume needs an --output file')
+    return args
+
+
+def parse_value(text):
+    ''' Returns a CSV cell or --set value as JSON if it is valid JSON, e.g. 100, true or a
+        list of port_settings, else as the string itself '''
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def read_rows(path):
+    ''' Returns the rows of a CSV or JSON file as module argument dicts.
+        Empty CSV cells are left out, so the module default applies. '''
+    if path == '-':
+        text = sys.stdin.read()
+    else:
+        with open(path, newline='') as input_file:
+            text = input_file.read()
+    stripped = text.lstrip()
+    if path.lower().endswith('.csv') or not stripped.startswith(('[', '{')):
+        return [dict((name.strip(), parse_value(value)) for name, value in row.items()
+                     if name is not None and value not in (None, ''))
+                for row in csv.DictReader(text.splitlines())]
+    if stripped.startswith('['):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def row_key(args, module_args):
+    ''' Identifies a row by its storage system, operation and content, so --resume still matches
+        after rows are reordered but not against an output file written for another storage system '''
+    key = [args.platform, args.management_address, args.operation, module_args]
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def read_succeeded(path):
+    ''' Returns the keys of the rows `path` records as succeeded. A row run in check mode
+        changed nothing, so it is run again. '''
+    succeeded = set()
+    if not os.path.exists(path):
+        return succeeded
+    with open(path) as output_file:
+        for line in output_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line cut short by an interrupted run
+                continue
+            if not record.get('failed', True) and not record.get('check_mode', False):
+                succeeded.add(record.get('key'))
+    return succeeded
+
+
+def pending_rows(args, rows):
+    ''' Returns the (number, module_args) rows the --output file does not record as succeeded '''
+    succeeded = read_succeeded(args.output)
+    return [(number, module_args) for number, module_args in rows
+            if row_key(args, module_args) not in succeeded]
+
+
+def create_client(args):
+    password = args.password or os.environ.get('HITACHI_PASSWORD') or getpass.getpass()
+    if args.platform == 'vsp':
+        from ansible.module_utils.hitachi_block_client import BlockClient as Client
+    else:
+        from ansible.module_utils.hitachi_vssb_client import VssbClient as Client
+    return Client(args.management_address, args.user, password,
+                  management_port=args.management_port, check_mode=args.check)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.platform == 'vsp':
+        from ansible.module_utils.hitachi_block_client import get_logger, HitachiBlockException
+    else:
+        from ansible.module_utils.hitachi_vssb_client import get_logger, HitachiBlockException
+    logger = get_logger()
+    logger.setLevel(logging.DEBUG)
+    initialize_filehandler_logger(logger)
+
+    defaults = {}
+    for setting in args.defaults:
+        name, separator, value = setting.partition('=')
+        if not separator:
+            sys.exit('--set takes NAME=VALUE, got {}'.format(setting))
+        defaults[name.strip()] = parse_value(value)
+    rows = [(number, dict(defaults, **row)) for number, row in enumerate(read_rows(args.input), 1)]
+
+    skipped = 0
+    if args.resume:
+        pending = pending_rows(args, rows)
+        skipped = len(rows) - len(pending)
+        rows = pending
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'a')
+    output_lock = threading.Lock()
+
+    def run_row(row):
+        number, module_args = row
+        record = {
+            'row': number,
+            'key': row_key(args, module_args),
+            'operation': args.operation,
+            'check_mode': args.check,
+        }
+        started = time.monotonic()
+        try:
+            response = client.run(args.operation, **module_args)
+            # Some operations, e.g. delete_tenant, return None
+            changed = response.get('changed', False) if isinstance(response, dict) else False
+            record.update(failed=False, changed=changed, result=response)
+        except HitachiBlockException as err:
+            record.update(failed=True, changed=False, error=err.error_response())
+        except Exception as err:
+            record.update(failed=True, changed=False, error={'msg': str(err)})
+        record['elapsed_seconds'] = round(time.monotonic() - started, 3)
+        with output_lock:
+            output.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+            output.flush()
+        return record
+
+    started = time.monotonic()
+    try:
+        with create_client(args) as client:
+            outcomes = map_concurrently(run_row, rows, args.concurrency)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.monotonic() - started
+
+    records = [record for record, error in outcomes]
+    failed = sum(1 for record in records if record['failed'])
+    changed = sum(1 for record in records if record['changed'])
+    sys.stderr.write('{} operations in {:.1f} s, {:.1f} operations/s: {} changed, {} failed, {} skipped\n'.format(
+        len(records), elapsed, len(records) / elapsed if elapsed > 0 else 0.0, changed, failed, skipped))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,8 @@
+import os
+
+import ansible.module_utils
+
+# The module_utils are imported as ansible.module_utils.hitachi_*, as with ANSIBLE_MODULE_UTILS
+MODULE_UTILS = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'plugins', 'module_utils')
+if MODULE_UTILS not in ansible.module_utils.__path__:
+    ansible.module_utils.__path__.append(MODULE_UTILS)
@@ -0,0 +1,173 @@
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from ansible.module_utils.hitachi_ansible_common import JsonStreamParser, NameIdCache, SessionTokenCache, paginate
+from ansible.module_utils.hitachi_ansible_common_constant import NameCacheConstants
+
+BODIES = [
+    '{"data":[12.5,3e2,7]}',
+    '{"total": -1.25E-3, "data": [{"ldevId": 10, "label": "vol\\u00e9"}, 1234567890, -0.5e+10, true, null], "count": 10}',
+    '{"data": []}',
+    '{"count": 0}',
+    '[1.5, 2]',
+    '"text"',
+]
+
+
+@pytest.mark.parametrize('body', BODIES)
+def test_load_matches_json_loads_at_every_chunk_boundary(body):
+    for chunk_size in range(1, len(body) + 2):
+        parser = JsonStreamParser(io.BytesIO(body.encode('utf-8')), chunk_size=chunk_size)
+        assert parser.load('data') == json.loads(body), chunk_size
+
+
+def test_load_returns_text_that_is_not_json():
+    assert JsonStreamParser(io.BytesIO(b'Not Available.'), chunk_size=4).load('data') == 'Not Available.'
+
+
+def test_iter_items_yields_before_the_stream_is_read():
+    body = '{"data": [' + ', '.join(json.dumps({'id': n}) for n in range(100)) + ']}'
+    stream = io.BytesIO(body.encode('utf-8'))
+    items = JsonStreamParser(stream, chunk_size=16).iter_items('data', {})
+    assert next(items) == {'id': 0}
+    assert stream.tell() < len(body)
+    assert [item['id'] for item in items] == list(range(1, 100))
+
+
+def test_paginate_stops_at_a_short_page():
+    items = list(range(7))
+    pages = []
+
+    def get_page(start, page_size):
+        pages.append(start)
+        return iter(items[start:start + page_size])
+
+    assert list(paginate(get_page, page_size=3)) == items
+    assert pages == [0, 3, 6]
+
+
+def test_paginate_stops_when_the_start_is_ignored():
+    assert list(paginate(lambda start, page_size: [1, 2], page_size=2)) == [1, 2]
+
+
+SCOPE = ('block', 'storage.example.com', 443, 'admin')
+
+
+@pytest.fixture
+def name_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv('HITACHI_NAME_CACHE', raising=False)
+    monkeypatch.delenv('HITACHI_NAME_CACHE_TTL', raising=False)
+    return NameIdCache(str(tmp_path))
+
+
+def test_name_cache_returns_the_saved_ids(name_cache):
+    name_cache.put(SCOPE, NameCacheConstants.SERVER, {'srv1': 'S1', 'srv2': 'S2', None: 'S3', 'srv4': None})
+    assert name_cache.get(SCOPE, NameCacheConstants.SERVER, 'srv1') == 'S1'
+    assert name_cache.get(SCOPE, NameCacheConstants.SERVER, 'srv4') is None
+    assert name_cache.get(SCOPE, NameCacheConstants.POOL, 'srv1') is None
+    assert name_cache.get(SCOPE[:3] + ('other',), NameCacheConstants.SERVER, 'srv1') is None
+
+
+def test_name_cache_entries_expire_after_the_ttl_of_their_kind(name_cache, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now)
+    name_cache.put(SCOPE, NameCacheConstants.SERVER, {'srv': 'S1'})
+    name_cache.put(SCOPE, NameCacheConstants.PORT, {'port': 'P1'})
+    monkeypatch.setattr(time, 'time', lambda: now + NameCacheConstants.TTL_DEFAULTS[NameCacheConstants.SERVER] + 1)
+    assert name_cache.get(SCOPE, NameCacheConstants.SERVER, 'srv') is None
+    assert name_cache.get(SCOPE, NameCacheConstants.PORT, 'port') == 'P1'
+
+
+def test_name_cache_invalidates_a_name_or_a_kind(name_cache):
+    name_cache.put(SCOPE, NameCacheConstants.VOLUME, {'vol1': 'V1', 'vol2': 'V2'})
+    name_cache.put(SCOPE, NameCacheConstants.POOL, {'pool': 'P1'})
+    name_cache.invalidate(SCOPE, NameCacheConstants.VOLUME, 'vol1')
+    assert name_cache.get(SCOPE, NameCacheConstants.VOLUME, 'vol1') is None
+    assert name_cache.get(SCOPE, NameCacheConstants.VOLUME, 'vol2') == 'V2'
+    name_cache.invalidate(SCOPE, NameCacheConstants.VOLUME)
+    assert name_cache.get(SCOPE, NameCacheConstants.VOLUME, 'vol2') is None
+    assert name_cache.get(SCOPE, NameCacheConstants.POOL, 'pool') == 'P1'
+
+
+def test_name_cache_keeps_every_concurrent_update(name_cache):
+    # Each put reads, changes and rewrites the file under its lock, so none is lost
+    threads = [threading.Thread(target=name_cache.put, args=(SCOPE, NameCacheConstants.SERVER, {'srv%d' % n: 'S%d' % n}))
+               for n in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [name_cache.get(SCOPE, NameCacheConstants.SERVER, 'srv%d' % n) for n in range(20)] == ['S%d' % n for n in range(20)]
+
+
+def test_name_cache_is_off_with_the_environment_variable(name_cache, monkeypatch):
+    monkeypatch.setenv('HITACHI_NAME_CACHE', 'false')
+    name_cache.put(SCOPE, NameCacheConstants.SERVER, {'srv': 'S1'})
+    monkeypatch.delenv('HITACHI_NAME_CACHE')
+    assert name_cache.get(SCOPE, NameCacheConstants.SERVER, 'srv') is None
+
+
+SESSION_KEY = ('block', 'storage.example.com', 443, 'admin', 'secret')
+
+
+class SessionFactory(object):
+    ''' Stands in for a login, returning a new (token, session_id) pair per call '''
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return 'token-%d' % self.calls, self.calls
+
+
+def test_session_cache_logs_in_once(tmp_path):
+    create = SessionFactory()
+    cache = SessionTokenCache(str(tmp_path), ttl=60)
+    assert cache.get_or_create(SESSION_KEY, create) == ('token-1', 1)
+    assert SessionTokenCache(str(tmp_path), ttl=60).get_or_create(SESSION_KEY, create) == ('token-1', 1)
+    assert cache.get_or_create(SESSION_KEY[:4] + ('other',), create) == ('token-2', 2)
+
+
+def test_session_cache_logs_in_once_for_concurrent_callers(tmp_path):
+    # The second caller waits for the lock the first one holds while it logs in
+    create = SessionFactory(delay=0.05)
+    cache = SessionTokenCache(str(tmp_path), ttl=60)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_create(SESSION_KEY, create)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert create.calls == 1
+    assert results == [('token-1', 1)] * 8
+
+
+def test_session_cache_entries_expire_after_their_last_use(tmp_path, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now)
+    create = SessionFactory()
+    cache = SessionTokenCache(str(tmp_path), ttl=60)
+    cache.get_or_create(SESSION_KEY, create)
+    monkeypatch.setattr(time, 'time', lambda: now + 50)
+    assert cache.get_or_create(SESSION_KEY, create) == ('token-1', 1)
+    monkeypatch.setattr(time, 'time', lambda: now + 100)
+    assert cache.get_or_create(SESSION_KEY, create) == ('token-1', 1)
+    monkeypatch.setattr(time, 'time', lambda: now + 161)
+    assert cache.get_or_create(SESSION_KEY, create) == ('token-2', 2)
+
+
+def test_session_cache_invalidate_forces_a_new_login(tmp_path):
+    create = SessionFactory()
+    cache = SessionTokenCache(str(tmp_path), ttl=60)
+    cache.get_or_create(SESSION_KEY, create)
+    cache.invalidate(SESSION_KEY)
+    cache.invalidate(SESSION_KEY)
+    assert cache.get_or_create(SESSION_KEY, create) == ('token-2', 2)
@@ -0,0 +1,152 @@
+import io
+
+import pytest
+
+from ansible.module_utils.urls import urllib_error
+from ansible.module_utils import hitachi_ansible_common
+from ansible.module_utils.hitachi_ansible_common_constant import NameCacheConstants
+from ansible.module_utils.hitachi_block_client import (
+    BlockSession,
+    HitachiBlockHttpException,
+    HTTPClient,
+    Params,
+    with_name_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def name_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv('HITACHI_NAME_CACHE', raising=False)
+    monkeypatch.setattr(hitachi_ansible_common.NAME_ID_CACHE, 'directory', str(tmp_path))
+
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    ''' Stubs the login and the logout, returns the list of the session IDs logged in '''
+    monkeypatch.delenv('HITACHI_SESSION_CACHE', raising=False)
+    monkeypatch.setattr(hitachi_ansible_common.SESSION_TOKEN_CACHE, 'directory', str(tmp_path))
+    created = []
+
+    def post_objects_sessions(params):
+        created.append(len(created) + 1)
+        return {'token': 'token-%d' % created[-1], 'sessionId': created[-1]}
+
+    monkeypatch.setattr(HTTPClient, 'post_objects_sessions', staticmethod(post_objects_sessions))
+    monkeypatch.setattr(HTTPClient, 'delete_objects_sessions', staticmethod(lambda params: None))
+    return created
+
+
+def http_error(code):
+    return HitachiBlockHttpException(urllib_error.HTTPError(
+        'https://storage.example.com/', code, 'Error', {}, io.BytesIO(b'{}')))
+
+
+def new_params():
+    return Params({'management_address': 'storage.example.com', 'user': 'admin', 'password': 'secret'})
+
+
+class Operation(object):
+    ''' Looks the snapshot group up like an Executors operation, then fails or returns as told '''
+
+    def __init__(self, *outcomes):
+        self.params = new_params()
+        self.outcomes = list(outcomes)
+        self.group_ids = []
+
+    @with_name_cache
+    def run(self):
+        group_id = HTTPClient.get_cached_id(self.params, NameCacheConstants.SNAPSHOT_GROUP, 'group') or 'live'
+        self.group_ids.append(group_id)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_with_name_cache_looks_up_again_after_a_not_found_cached_id():
+    operation = Operation(http_error(404), 'done')
+    HTTPClient.cache_names(operation.params, NameCacheConstants.SNAPSHOT_GROUP, {'group': 'stale'})
+    assert operation.run() == 'done'
+    assert operation.group_ids == ['stale', 'live']
+    assert HTTPClient.get_cached_id(operation.params, NameCacheConstants.SNAPSHOT_GROUP, 'group') is None
+
+
+def test_with_name_cache_does_not_retry_without_a_cache_hit():
+    operation = Operation(http_error(404), 'done')
+    with pytest.raises(HitachiBlockHttpException):
+        operation.run()
+    assert operation.group_ids == ['live']
+
+
+def test_with_name_cache_does_not_retry_other_errors():
+    operation = Operation(http_error(500), 'done')
+    HTTPClient.cache_names(operation.params, NameCacheConstants.SNAPSHOT_GROUP, {'group': 'cached'})
+    with pytest.raises(HitachiBlockHttpException):
+        operation.run()
+    assert operation.group_ids == ['cached']
+    assert HTTPClient.get_cached_id(operation.params, NameCacheConstants.SNAPSHOT_GROUP, 'group') == 'cached'
+
+
+def test_renew_replaces_the_token_once_per_operation(sessions):
+    params = new_params()
+    with BlockSession(params) as session:
+        operation = params.copy()
+        assert operation.session_token == 'token-1'
+        assert session.renew(operation)
+        assert (operation.session_id, operation.session_token) == (2, 'token-2')
+        assert not session.renew(operation)
+        assert session.renew(params.copy())
+    assert sessions == [1, 2, 3]
+
+
+def test_renew_hands_another_workers_renewal_to_a_stale_worker(sessions):
+    params = new_params()
+    with BlockSession(params) as session:
+        operation = params.copy()
+        workers = [operation.copy(), operation.copy()]
+        assert session.renew(workers[0])
+        assert session.renew(workers[1])
+        assert workers[1].session_token == 'token-2'
+        assert not workers[1].session_renewed
+    assert sessions == [1, 2]
+
+
+def test_renew_drops_the_cached_token(sessions, monkeypatch):
+    monkeypatch.setenv('HITACHI_SESSION_CACHE', 'true')
+    params = new_params()
+    with BlockSession(params) as session:
+        assert session.renew(params.copy())
+    with BlockSession(new_params()) as session:
+        assert session.params.session_token == 'token-2'
+    assert sessions == [1, 2]
+
+
+def test_request_renews_a_rejected_token_and_resends(sessions, monkeypatch):
+    sent = []
+
+    def send_request(http_verb, endpoint, params, stream_key=None, body=None):
+        sent.append(params.session_token)
+        if params.session_token == 'token-1':
+            raise http_error(401)
+        return {'token': params.session_token}
+
+    monkeypatch.setattr(HTTPClient, '_send_request', staticmethod(send_request))
+    params = new_params()
+    with BlockSession(params):
+        assert HTTPClient._request('GET', 'ldevs', params.copy()) == {'token': 'token-2'}
+    assert sent == ['token-1', 'token-2']
+
+
+def test_request_gives_up_after_one_renewal(sessions, monkeypatch):
+    def send_request(http_verb, endpoint, params, stream_key=None, body=None):
+        raise http_error(401)
+
+    monkeypatch.setattr(HTTPClient, '_send_request', staticmethod(send_request))
+    params = new_params()
+    with BlockSession(params):
+        operation = params.copy()
+        with pytest.raises(HitachiBlockHttpException):
+            HTTPClient._request('GET', 'ldevs', operation)
+        with pytest.raises(HitachiBlockHttpException):
+            HTTPClient._request('GET', 'ldevs', operation)
+    assert sessions == [1, 2]
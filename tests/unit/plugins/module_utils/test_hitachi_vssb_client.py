@@ -0,0 +1,52 @@
+import pytest
+
+from ansible.module_utils import hitachi_ansible_common
+from ansible.module_utils.hitachi_ansible_common_constant import NameCacheConstants
+from ansible.module_utils.hitachi_vssb_client import (
+    Executors,
+    HTTPClient,
+)
+
+MODULE_ARGS = {
+    'management_address': 'sds.example.com',
+    'user': 'admin',
+    'password': 'secret',
+    'check_mode': False,
+    'volume_name': 'vol',
+    'server_nickname': 'srv',
+}
+
+
+@pytest.fixture(autouse=True)
+def name_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv('HITACHI_NAME_CACHE', raising=False)
+    monkeypatch.setattr(hitachi_ansible_common.NAME_ID_CACHE, 'directory', str(tmp_path))
+
+
+def test_delete_volume_looks_the_name_up_despite_a_cached_id(monkeypatch):
+    executors = Executors(MODULE_ARGS)
+    HTTPClient.cache_names(executors.params, NameCacheConstants.VOLUME, {'vol': 'stale'})
+    deleted = []
+    monkeypatch.setattr(HTTPClient, 'get_volumes_by_name', staticmethod(lambda params: {'id': 'live'}))
+    monkeypatch.setattr(HTTPClient, 'delete_volumes', staticmethod(lambda params: deleted.append(params.volume_id) or True))
+    assert executors._do_delete_volume(executors.params)['changed']
+    assert deleted == ['live']
+    assert HTTPClient.get_cached_id(executors.params, NameCacheConstants.VOLUME, 'vol') is None
+
+
+def test_delete_computenode_looks_the_name_up_despite_a_cached_id(monkeypatch):
+    executors = Executors(MODULE_ARGS)
+    HTTPClient.cache_names(executors.params, NameCacheConstants.SERVER, {'srv': 'stale'})
+    deleted = []
+    monkeypatch.setattr(HTTPClient, 'get_servers_by_name', staticmethod(lambda params: {'id': 'live'}))
+    monkeypatch.setattr(HTTPClient, 'delete_servers', staticmethod(lambda params: deleted.append(params.server_id)))
+    assert executors._do_delete_computenode(executors.params)['changed']
+    assert deleted == ['live']
+
+
+def test_lookups_other_than_deletes_use_the_cached_id(monkeypatch):
+    executors = Executors(MODULE_ARGS)
+    HTTPClient.cache_names(executors.params, NameCacheConstants.SERVER, {'srv': 'cached'})
+    monkeypatch.setattr(HTTPClient, 'get_servers_by_name', staticmethod(lambda params: {'id': 'live'}))
+    assert HTTPClient.get_server_id_by_name(executors.params) == 'cached'
+    assert HTTPClient.get_server_id_by_name(executors.params, use_cache=False) == 'live'
@@ -0,0 +1,73 @@
+import argparse
+import importlib.util
+import json
+import os
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir,
+                      'scripts', 'hitachi_bulk.py')
+spec = importlib.util.spec_from_file_location('hitachi_bulk', SCRIPT)
+hitachi_bulk = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(hitachi_bulk)
+
+ROWS = [
+    {'ldev_id': 1, 'pool_id': 0, 'capacity_mb': 100},
+    {'ldev_id': 2, 'pool_id': 0, 'capacity_mb': 100, 'name': 'vol 2'},
+]
+
+
+def bulk_args(output, **overrides):
+    values = dict(platform='vsp', management_address='storage.example.com',
+                  operation='create_ldev', output=str(output))
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def record(args, module_args, **values):
+    result = {'key': hitachi_bulk.row_key(args, module_args), 'failed': False, 'check_mode': False}
+    result.update(values)
+    return json.dumps(result) + '\n'
+
+
+@pytest.mark.parametrize('name, text', [
+    ('rows.csv', 'ldev_id,pool_id,capacity_mb,name\n1,0,100,\n2,0,100,vol 2\n'),
+    ('rows.json', json.dumps(ROWS)),
+    ('rows.jsonl', ''.join(json.dumps(row) + '\n\n' for row in ROWS)),
+])
+def test_read_rows_reads_csv_json_and_json_lines(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    assert hitachi_bulk.read_rows(str(path)) == ROWS
+
+
+def test_read_succeeded_skips_failed_check_mode_and_truncated_records(tmp_path):
+    output = tmp_path / 'results.jsonl'
+    args = bulk_args(output)
+    output.write_text(
+        record(args, ROWS[0])
+        + record(args, ROWS[1], failed=True)
+        + record(args, ROWS[1], check_mode=True)
+        + record(args, ROWS[1])[:20])
+    assert hitachi_bulk.read_succeeded(str(output)) == {hitachi_bulk.row_key(args, ROWS[0])}
+    assert hitachi_bulk.read_succeeded(str(tmp_path / 'missing.jsonl')) == set()
+
+
+def test_resume_runs_only_the_rows_not_yet_succeeded(tmp_path):
+    output = tmp_path / 'results.jsonl'
+    args = bulk_args(output)
+    output.write_text(record(args, ROWS[1]))
+    rows = list(enumerate(ROWS, 1))
+    assert hitachi_bulk.pending_rows(args, rows) == [(1, ROWS[0])]
+    assert hitachi_bulk.pending_rows(args, rows[::-1]) == [(1, ROWS[0])]
+
+
+@pytest.mark.parametrize('overrides', [
+    {'management_address': 'other.example.com'},
+    {'platform': 'sds'},
+    {'operation': 'delete_ldev'},
+])
+def test_resume_does_not_match_rows_of_another_run(tmp_path, overrides):
+    output = tmp_path / 'results.jsonl'
+    output.write_text(record(bulk_args(output), ROWS[0]))
+    assert hitachi_bulk.pending_rows(bulk_args(output, **overrides), [(1, ROWS[0])]) == [(1, ROWS[0])]